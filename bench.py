@@ -0,0 +1,303 @@
+# * Description:  Startup and throughput benchmarks for cnew, cproj, glnew and pynew
+# * Author:       Alicia Amarilla ( smushyaa@gmail.com )
+# * File Created: October 19, 2026
+
+import sys
+import os
+import json
+import time
+import getopt
+import platform
+import tempfile
+import statistics
+import subprocess
+
+root_dir = os.path.dirname( os.path.abspath( __file__ ) )
+src_dir  = os.path.join( root_dir, "src" )
+bin_dir  = os.path.join( root_dir, "bin" )
+
+sys.path.insert( 0, src_dir )
+from common import print_status, print_err, print_fatal, print_help
+
+scripts = {
+    "cnew":  "create_c.py",
+    "cproj": "create_cproj.py",
+    "glnew": "create_glsl.py",
+    "pynew": "create_py.py",
+}
+
+all_cases = [ "startup", "init", "edit", "batch" ]
+
+def display_help():
+    print_help( "bench: startup and throughput benchmarks for cnew, cproj, glnew and pynew" )
+    print_help( " everything runs in temporary directories, nothing in the repository is touched" )
+    print_help( " -n, --runs     [int]    [default=15]:    runs per case, the median is reported" )
+    print_help( " -c, --case     [string]:                 only run given case, can be repeated. VALID = [startup, init, edit, batch]" )
+    print_help( " -t, --target   [string] [default=src]:   benchmark scripts in src or the bin/scaffold zipapp. VALID = [src, bin]" )
+    print_help( " -o, --output   [string]:                 write results as json to given path" )
+    print_help( " -b, --baseline [string]:                 compare results against given json results, exit with 1 on regression" )
+    print_help( " --threshold    [float]  [default=10]:    allowed slowdown against baseline in percent" )
+    print_help( " --lines        [int]    [default=20000]: lines in synthetic Makefile and compile_flags.txt for edit cases" )
+    print_help( " --batch        [int]    [default=300]:   entries in manifest for batch cases" )
+    print_help( "\n -h, --help: print this help message and exit" )
+    sys.exit(0)
+
+def command( target:str, tool:str ) -> list:
+    if target == "bin":
+        return [ sys.executable, os.path.join( bin_dir, "scaffold" ), tool ]
+    return [ sys.executable, os.path.join( src_dir, scripts[tool] ) ]
+
+class CaseError( Exception ):
+    pass
+
+def check( proc, cmd:list ):
+    if proc.returncode != 0:
+        raise CaseError(
+            " ".join( os.path.basename( arg ) for arg in cmd[1:] ) +
+            " exited with " + str(proc.returncode) + ":\n" + proc.stderr.strip()
+        )
+
+def run( cmd:list, cwd:str, stdin:str = None ) -> float:
+    start = time.perf_counter()
+    proc  = subprocess.run(
+        cmd, cwd=cwd, input=stdin, text=True,
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
+    )
+    elapsed = ( time.perf_counter() - start ) * 1000.0
+    check( proc, cmd )
+    return elapsed
+
+def result( times:list, files:int = 0 ) -> dict:
+    res = {
+        "median_ms": statistics.median( times ),
+        "min_ms":    min( times ),
+        "max_ms":    max( times ),
+        "runs":      len( times ),
+    }
+    if files != 0:
+        res["files_per_s"] = files / ( res["median_ms"] / 1000.0 )
+    return res
+
+def import_breakdown( cmd:list, cwd:str ) -> list:
+    # top level imports only, nested imports are part of their cumulative time
+    proc = subprocess.run(
+        [ cmd[0], "-X", "importtime" ] + cmd[1:], cwd=cwd,
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
+    )
+    imports = []
+    for line in proc.stderr.splitlines():
+        if not( line.startswith( "import time:" ) ):
+            continue
+        parts = line[len( "import time:" ):].split( "|" )
+        if len( parts ) != 3 or not( parts[0].strip().isdigit() ):
+            continue
+        name = parts[2].rstrip()
+        if name.startswith( " " * 2 ):
+            continue
+        imports.append( [ name.strip(), int( parts[0] ), int( parts[1] ) ] )
+    imports.sort( key=lambda item: item[2], reverse=True )
+    return imports[:10]
+
+def startup_args( tool:str, idx:int ) -> list:
+    match tool:
+        case "cnew":
+            return [ "bench" + str(idx), "-c", "-q" ]
+        case "glnew":
+            return [ "bench" + str(idx), "-q" ]
+        case "pynew":
+            return [ "-n", "bench" + str(idx) ]
+        case _:
+            return [ "--compile_flags", "-c", "-q" ]
+
+def bench_startup( target:str, runs:int, results:dict, imports:dict ):
+    for tool in scripts:
+        times = []
+        for idx in range( runs ):
+            with tempfile.TemporaryDirectory() as cwd:
+                times.append( run( command( target, tool ) + startup_args( tool, idx ), cwd ) )
+        results["startup." + tool] = result( times )
+
+        with tempfile.TemporaryDirectory() as cwd:
+            imports[tool] = import_breakdown( command( target, tool ) + startup_args( tool, 0 ), cwd )
+
+def bench_init( target:str, runs:int, results:dict ):
+    times = []
+    for idx in range( runs ):
+        with tempfile.TemporaryDirectory() as cwd:
+            times.append( run( command( target, "cproj" ) + [ "--init", "bench", "-q" ], cwd ) )
+    results["init.cproj"] = result( times )
+
+def synthetic_project( target:str, cwd:str, lines:int ):
+    cmd  = command( target, "cproj" ) + [ "--init", "bench", "-c", "-q" ]
+    proc = subprocess.run( cmd, cwd=cwd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True )
+    check( proc, cmd )
+    # pad the editable section of the Makefile and compile_flags.txt
+    makefile_path = os.path.join( cwd, "Makefile" )
+    with open( makefile_path, "r" ) as read_file:
+        makefile = read_file.read()
+    padding = "".join( "BENCH_VAR_" + str(idx) + " = value" + str(idx) + "\n" for idx in range( lines ) )
+    makefile = makefile.replace( "# pre-compiled header\n", padding + "\n# pre-compiled header\n", 1 )
+    with open( makefile_path, "w", newline='\n' ) as write_file:
+        write_file.write( makefile )
+
+    with open( os.path.join( cwd, "compile_flags.txt" ), "a", newline='\n' ) as write_file:
+        for idx in range( lines ):
+            write_file.write( "-DBENCH_FLAG_" + str(idx) + "\n" )
+
+def bench_edit( target:str, runs:int, lines:int, results:dict ):
+    cases = {
+        "rename":   lambda idx: [ "--rename", "bench" + str(idx) ],
+        "dir":      lambda idx: [ "-d", "bench" + str(idx) ],
+        "cflag":    lambda idx: [ "--cflag", "-DBENCH_CFLAG_" + str(idx) ],
+        "makeflag": lambda idx: [ "--makeflag", "-DBENCH_MAKEFLAG_" + str(idx) ],
+    }
+    with tempfile.TemporaryDirectory() as cwd:
+        synthetic_project( target, cwd, lines )
+        for case, args in cases.items():
+            times = []
+            for idx in range( runs ):
+                times.append( run( command( target, "cproj" ) + args( idx ) + [ "-q" ], cwd ) )
+            results["edit." + case] = result( times )
+
+def bench_batch( target:str, runs:int, count:int, results:dict ):
+    names = "".join( "mod" + str(idx) + "\n" for idx in range( count ) )
+    files_per_entry = { "cnew": 2, "glnew": 2, "pynew": 1 }
+    for tool, per_entry in files_per_entry.items():
+        times = []
+        for idx in range( runs ):
+            with tempfile.TemporaryDirectory() as cwd:
+                times.append( run( command( target, tool ) + [ "-m", "-" ], cwd, names ) )
+        results["batch." + tool] = result( times, count * per_entry )
+
+def compare( results:dict, baseline:dict, threshold:float ) -> bool:
+    regressed = False
+    for key, current in results.items():
+        if not( key in baseline ):
+            continue
+        base  = baseline[key]["median_ms"]
+        ratio = current["median_ms"] / base
+        line  = "{:<16} {:>9.2f} ms -> {:>9.2f} ms ({:+.1f}%)".format(
+            key, base, current["median_ms"], ( ratio - 1.0 ) * 100.0
+        )
+        if ratio > 1.0 + threshold / 100.0:
+            regressed = True
+            print_err( line + " REGRESSION" )
+        else:
+            print_status( line )
+    return regressed
+
+def print_results( results:dict, imports:dict ):
+    for key, res in results.items():
+        line = "{:<16} median {:>9.2f} ms  min {:>9.2f} ms".format( key, res["median_ms"], res["min_ms"] )
+        if "files_per_s" in res:
+            line += "  {:>9.0f} files/s".format( res["files_per_s"] )
+        print_status( line )
+    for tool, top in imports.items():
+        print_help( "\nslowest top level imports for " + tool + " (self us, cumulative us):" )
+        for name, self_us, cumulative_us in top:
+            print_help( "  {:<24} {:>7} {:>7}".format( name, self_us, cumulative_us ) )
+
+short_options = "hn:c:t:o:b:"
+long_options  = [
+    "help", "runs=", "case=", "target=", "output=",
+    "baseline=", "threshold=", "lines=", "batch="
+]
+
+if __name__ == "__main__":
+    try:
+        args, values = getopt.getopt( sys.argv[1:], short_options, long_options )
+    except getopt.error as err:
+        print_fatal( str(err) )
+
+    runs          = 15
+    cases         = []
+    target        = "src"
+    output_path   = ""
+    baseline_path = ""
+    threshold     = 10.0
+    lines         = 20000
+    batch         = 300
+
+    try:
+        for arg, value in args:
+            if arg in ( "-h", "--help" ):
+                display_help()
+            if arg in ( "-n", "--runs" ):
+                runs = int( value )
+            if arg in ( "-c", "--case" ):
+                if not( value in all_cases ):
+                    print_fatal( "\"" + value + "\" is not a valid case!" )
+                cases.append( value )
+            if arg in ( "-t", "--target" ):
+                target = value
+            if arg in ( "-o", "--output" ):
+                output_path = value
+            if arg in ( "-b", "--baseline" ):
+                baseline_path = value
+            if arg == "--threshold":
+                threshold = float( value )
+            if arg == "--lines":
+                lines = int( value )
+            if arg == "--batch":
+                batch = int( value )
+    except ValueError as err:
+        print_fatal( str(err) )
+
+    if runs < 1:
+        print_fatal( "runs must be at least 1!" )
+    if not( target in ( "src", "bin" ) ):
+        print_fatal( "\"" + target + "\" is not a valid target!" )
+    if target == "bin" and not( os.path.isfile( os.path.join( bin_dir, "scaffold" ) ) ):
+        print_fatal( "bin/scaffold does not exist, run build.py first!" )
+    if len( cases ) == 0:
+        cases = all_cases
+
+    results = {}
+    imports = {}
+    benches = {
+        "startup": lambda: bench_startup( target, runs, results, imports ),
+        "init":    lambda: bench_init( target, runs, results ),
+        "edit":    lambda: bench_edit( target, runs, lines, results ),
+        "batch":   lambda: bench_batch( target, runs, batch, results ),
+    }
+    failed = False
+    for case in all_cases:
+        if not( case in cases ):
+            continue
+        try:
+            benches[case]()
+        except CaseError as err:
+            # a failing command would otherwise be timed as a fast run
+            print_err( "case \"" + case + "\" failed, " + str(err) )
+            failed = True
+
+    print_results( results, imports )
+
+    if output_path != "":
+        report = {
+            "python":   platform.python_version(),
+            "platform": platform.platform(),
+            "target":   target,
+            "lines":    lines,
+            "batch":    batch,
+            "results":  results,
+            "imports":  imports,
+        }
+        with open( output_path, "w", newline='\n' ) as write_file:
+            json.dump( report, write_file, indent=4 )
+        print_status( "wrote results to \"" + output_path + "\"" )
+
+    if baseline_path != "":
+        try:
+            with open( baseline_path, "r" ) as read_file:
+                baseline = json.load( read_file )["results"]
+        except ( OSError, ValueError, KeyError ) as err:
+            print_fatal( "could not read baseline: " + str(err) )
+        print_help( "\ncomparing against \"" + baseline_path + "\", threshold " + str(threshold) + "%" )
+        if compare( results, baseline, threshold ):
+            sys.exit(1)
+
+    if failed:
+        sys.exit(1)
+
+    sys.exit(0)
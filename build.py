@@ -0,0 +1,69 @@
+# * Description:  Packages src into the bin/scaffold zipapp and creates cnew, cproj, glnew and pynew next to it
+# * Author:       Alicia Amarilla ( smushyaa@gmail.com )
+# * File Created: October 19, 2026
+
+import sys
+import os
+import glob
+import shutil
+import stat
+import zipfile
+import tempfile
+import py_compile
+
+root_dir = os.path.dirname( os.path.abspath( __file__ ) )
+src_dir  = os.path.join( root_dir, "src" )
+bin_dir  = os.path.join( root_dir, "bin" )
+
+commands = [ "cnew", "cproj", "glnew", "pynew" ]
+
+main_source = "import scaffold\nscaffold.main()\n"
+
+def compile_module( path:str, name:str ) -> bytes:
+    # unchecked hash based pyc, zipimport never writes a cache so
+    # without this every module is compiled from source on every run.
+    # a pyc from another python version is ignored and the source used instead
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cfile = os.path.join( temp_dir, name + "c" )
+        py_compile.compile(
+            path, cfile=cfile, dfile=name, doraise=True,
+            invalidation_mode=py_compile.PycInvalidationMode.UNCHECKED_HASH
+        )
+        with open( cfile, "rb" ) as read_file:
+            return read_file.read()
+
+def create_archive( target:str, interpreter:str ):
+    with open( target, "wb" ) as write_file:
+        write_file.write( b"#!" + interpreter.encode( "utf-8" ) + b"\n" )
+        with zipfile.ZipFile( write_file, "w", compression=zipfile.ZIP_STORED ) as archive:
+            archive.writestr( "__main__.py", main_source )
+            for path in sorted( glob.glob( os.path.join( src_dir, "*.py" ) ) ):
+                name = os.path.basename( path )
+                with open( path, "r", encoding="utf-8" ) as read_file:
+                    source = read_file.read()
+                archive.writestr( name, source )
+                archive.writestr( name + "c", compile_module( path, name ) )
+
+    mode = os.stat( target ).st_mode
+    os.chmod( target, mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH )
+
+if __name__ == "__main__":
+    interpreter = "/usr/bin/env python3"
+    if len( sys.argv ) > 1:
+        interpreter = sys.argv[1]
+
+    os.makedirs( bin_dir, exist_ok=True )
+    target = os.path.join( bin_dir, "scaffold" )
+    create_archive( target, interpreter )
+    print( "created \"" + target + "\"" )
+
+    # argv[0] based dispatch, symlink when possible, copy otherwise
+    for command in commands:
+        link = os.path.join( bin_dir, command )
+        if os.path.lexists( link ):
+            os.remove( link )
+        try:
+            os.symlink( "scaffold", link )
+        except OSError:
+            shutil.copy2( target, link )
+        print( "created \"" + link + "\"" )
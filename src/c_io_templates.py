@@ -0,0 +1,471 @@
+# * Description:  Built-in templates of cnew --io, imported by templates.py on first use
+# * Author:       Alicia Amarilla ( smushyaa@gmail.com )
+# * File Created: October 19, 2026
+
+builtin = {
+    # cnew --io, see create_c.py
+    "c_io_header": (
+        "{{info}}{{guard_begin}}\n"
+        "\n"
+        "/* high throughput file i/o, generated by cnew --io\n"
+        " *\n"
+        " * {{lower}}_view:\n"
+        " *     read-only view of a whole file. regular files are memory mapped (mmap\n"
+        " *     with madvise hints, MapViewOfFile on windows), pipes, stdin on a\n"
+        " *     terminal and files that cannot be mapped are read into one heap buffer.\n"
+        " * {{lower}}_lines:\n"
+        " *     iterates the records of a view without copying, every record points\n"
+        " *     into the view and lives as long as it.\n"
+        " * {{lower}}_writer:\n"
+        " *     buffers writes in one large buffer and writes it out when it is full,\n"
+        " *     on {{lower}}_writer_flush() and on close. writes larger than the buffer\n"
+        " *     bypass it.\n"
+        " *\n"
+        " * functions returning int return 0 on success and -1 with errno set on failure.\n"
+        " * a path of NULL or \"-\" is stdin for views and stdout for writers. */\n"
+        "\n"
+        "#include <stddef.h>\n"
+        "\n"
+        "#define {{upper}}_DEFAULT_BUFFER ( (size_t)1 << 20 )\n"
+        "\n"
+        "/* access pattern hints for {{lower}}_view_open */\n"
+        "typedef enum {{lower}}_advice {\n"
+        "    {{upper}}_NORMAL     = 0,\n"
+        "    {{upper}}_SEQUENTIAL = 1, /* read front to back, aggressive read-ahead */\n"
+        "    {{upper}}_RANDOM     = 2, /* random access, no read-ahead */\n"
+        "    {{upper}}_WILLNEED   = 3  /* start reading the whole file in now */\n"
+        "} {{lower}}_advice;\n"
+        "\n"
+        "typedef struct {{lower}}_view {\n"
+        "    const char* data;\n"
+        "    size_t      size;\n"
+        "    int         mapped; /* 1 when data is a mapping, 0 when it is a heap buffer */\n"
+        "} {{lower}}_view;\n"
+        "\n"
+        "typedef struct {{lower}}_lines {\n"
+        "    const char* cursor;\n"
+        "    const char* end;\n"
+        "    char        delimiter;\n"
+        "} {{lower}}_lines;\n"
+        "\n"
+        "typedef struct {{lower}}_writer {\n"
+        "    void*  file;\n"
+        "    char*  buffer;\n"
+        "    size_t capacity;\n"
+        "    size_t used;\n"
+        "    int    error;  /* errno of the first failed write, sticky until close */\n"
+        "    int    owned;  /* file is closed by {{lower}}_writer_close */\n"
+        "} {{lower}}_writer;\n"
+        "\n"
+        "#if defined(__cplusplus)\n"
+        "extern \"C\" {\n"
+        "#endif\n"
+        "\n"
+        "int  {{lower}}_view_open( {{lower}}_view* view, const char* path, {{lower}}_advice advice );\n"
+        "void {{lower}}_view_close( {{lower}}_view* view );\n"
+        "\n"
+        "/* records are separated by delimiter, with '\\n' a trailing '\\r' is dropped too.\n"
+        " * a last record without delimiter is returned, an empty one after the last\n"
+        " * delimiter is not */\n"
+        "void {{lower}}_lines_init( {{lower}}_lines* lines, const {{lower}}_view* view, char delimiter );\n"
+        "/* returns 1 and sets record/length to the next record, 0 at the end */\n"
+        "int  {{lower}}_lines_next( {{lower}}_lines* lines, const char** record, size_t* length );\n"
+        "\n"
+        "/* capacity 0 uses {{upper}}_DEFAULT_BUFFER */\n"
+        "int  {{lower}}_writer_open( {{lower}}_writer* writer, const char* path, size_t capacity );\n"
+        "int  {{lower}}_write( {{lower}}_writer* writer, const void* data, size_t size );\n"
+        "int  {{lower}}_writer_flush( {{lower}}_writer* writer );\n"
+        "/* flushes, closes and frees the writer, reports the first error of its lifetime */\n"
+        "int  {{lower}}_writer_close( {{lower}}_writer* writer );\n"
+        "\n"
+        "#if defined(__cplusplus)\n"
+        "}\n"
+        "#endif\n"
+        "{{guard_end}}"
+    ),
+    "c_io_source": (
+        "{{info}}#if defined(__linux__) && !defined(_DEFAULT_SOURCE)\n"
+        "    /* madvise under -std=c99 */\n"
+        "    #define _DEFAULT_SOURCE\n"
+        "#endif\n"
+        "#include \"{{include}}\"\n"
+        "\n"
+        "#include <errno.h>\n"
+        "#include <stdio.h>\n"
+        "#include <stdlib.h>\n"
+        "#include <string.h>\n"
+        "\n"
+        "#if defined(_WIN32)\n"
+        "    #define WIN32_LEAN_AND_MEAN\n"
+        "    #include <windows.h>\n"
+        "    #include <io.h>\n"
+        "    #include <fcntl.h>\n"
+        "#else\n"
+        "    #include <fcntl.h>\n"
+        "    #include <unistd.h>\n"
+        "    #include <sys/mman.h>\n"
+        "    #include <sys/stat.h>\n"
+        "#endif\n"
+        "\n"
+        "static int {{lower}}_is_stdio( const char* path ) {\n"
+        "    return path == NULL || strcmp( path, \"-\" ) == 0;\n"
+        "}\n"
+        "\n"
+        "/* fallback for pipes, terminals and files that cannot be mapped,\n"
+        " * reads file to its end into one heap buffer */\n"
+        "static int {{lower}}_read_stream( {{lower}}_view* view, FILE* file ) {\n"
+        "    size_t capacity = {{upper}}_DEFAULT_BUFFER;\n"
+        "    size_t size     = 0;\n"
+        "    char*  data     = (char*)malloc( capacity );\n"
+        "    if( !data ) {\n"
+        "        errno = ENOMEM;\n"
+        "        return -1;\n"
+        "    }\n"
+        "    for( ;; ) {\n"
+        "        size_t count;\n"
+        "        if( size == capacity ) {\n"
+        "            char* grown = (char*)realloc( data, capacity * 2 );\n"
+        "            if( !grown ) {\n"
+        "                free( data );\n"
+        "                errno = ENOMEM;\n"
+        "                return -1;\n"
+        "            }\n"
+        "            data      = grown;\n"
+        "            capacity *= 2;\n"
+        "        }\n"
+        "        count = fread( data + size, 1, capacity - size, file );\n"
+        "        size += count;\n"
+        "        if( count == 0 ) {\n"
+        "            if( ferror( file ) ) {\n"
+        "                free( data );\n"
+        "                errno = EIO;\n"
+        "                return -1;\n"
+        "            }\n"
+        "            break;\n"
+        "        }\n"
+        "    }\n"
+        "    if( size == 0 ) {\n"
+        "        free( data );\n"
+        "        return 0;\n"
+        "    }\n"
+        "    view->data   = data;\n"
+        "    view->size   = size;\n"
+        "    view->mapped = 0;\n"
+        "    return 0;\n"
+        "}\n"
+        "\n"
+        "#if defined(_WIN32)\n"
+        "\n"
+        "static int {{lower}}_read_path( {{lower}}_view* view, const char* path ) {\n"
+        "    FILE* file;\n"
+        "    int   result;\n"
+        "    if( {{lower}}_is_stdio( path ) ) {\n"
+        "        _setmode( _fileno( stdin ), _O_BINARY );\n"
+        "        return {{lower}}_read_stream( view, stdin );\n"
+        "    }\n"
+        "    file = fopen( path, \"rb\" );\n"
+        "    if( !file ) {\n"
+        "        return -1;\n"
+        "    }\n"
+        "    result = {{lower}}_read_stream( view, file );\n"
+        "    fclose( file );\n"
+        "    return result;\n"
+        "}\n"
+        "\n"
+        "int {{lower}}_view_open( {{lower}}_view* view, const char* path, {{lower}}_advice advice ) {\n"
+        "    HANDLE        file, mapping;\n"
+        "    LARGE_INTEGER size;\n"
+        "    DWORD         flags = FILE_ATTRIBUTE_NORMAL;\n"
+        "    void*         data;\n"
+        "\n"
+        "    view->data   = \"\";\n"
+        "    view->size   = 0;\n"
+        "    view->mapped = 0;\n"
+        "    if( {{lower}}_is_stdio( path ) ) {\n"
+        "        return {{lower}}_read_path( view, path );\n"
+        "    }\n"
+        "\n"
+        "    if( advice == {{upper}}_SEQUENTIAL ) {\n"
+        "        flags |= FILE_FLAG_SEQUENTIAL_SCAN;\n"
+        "    } else if( advice == {{upper}}_RANDOM ) {\n"
+        "        flags |= FILE_FLAG_RANDOM_ACCESS;\n"
+        "    }\n"
+        "    file = CreateFileA( path, GENERIC_READ, FILE_SHARE_READ, NULL, OPEN_EXISTING, flags, NULL );\n"
+        "    if( file == INVALID_HANDLE_VALUE ) {\n"
+        "        errno = GetLastError() == ERROR_FILE_NOT_FOUND ? ENOENT : EACCES;\n"
+        "        return -1;\n"
+        "    }\n"
+        "    if( GetFileType( file ) != FILE_TYPE_DISK || !GetFileSizeEx( file, &size ) ) {\n"
+        "        CloseHandle( file );\n"
+        "        return {{lower}}_read_path( view, path );\n"
+        "    }\n"
+        "    if( size.QuadPart == 0 ) {\n"
+        "        CloseHandle( file );\n"
+        "        return 0;\n"
+        "    }\n"
+        "    /* a 32 bit size_t cannot hold a file of 4 GiB or more */\n"
+        "    if( sizeof(size_t) < sizeof(size.QuadPart) && size.HighPart != 0 ) {\n"
+        "        CloseHandle( file );\n"
+        "        errno = EFBIG;\n"
+        "        return -1;\n"
+        "    }\n"
+        "\n"
+        "    mapping = CreateFileMappingA( file, NULL, PAGE_READONLY, 0, 0, NULL );\n"
+        "    CloseHandle( file );\n"
+        "    if( !mapping ) {\n"
+        "        return {{lower}}_read_path( view, path );\n"
+        "    }\n"
+        "    /* the view keeps the mapping alive */\n"
+        "    data = MapViewOfFile( mapping, FILE_MAP_READ, 0, 0, 0 );\n"
+        "    CloseHandle( mapping );\n"
+        "    if( !data ) {\n"
+        "        return {{lower}}_read_path( view, path );\n"
+        "    }\n"
+        "\n"
+        "    view->data   = (const char*)data;\n"
+        "    view->size   = (size_t)size.QuadPart;\n"
+        "    view->mapped = 1;\n"
+        "    return 0;\n"
+        "}\n"
+        "\n"
+        "void {{lower}}_view_close( {{lower}}_view* view ) {\n"
+        "    if( view->mapped ) {\n"
+        "        UnmapViewOfFile( view->data );\n"
+        "    } else if( view->size != 0 ) {\n"
+        "        free( (void*)view->data );\n"
+        "    }\n"
+        "    view->data   = \"\";\n"
+        "    view->size   = 0;\n"
+        "    view->mapped = 0;\n"
+        "}\n"
+        "\n"
+        "#else\n"
+        "\n"
+        "/* reads the already open fd, a fifo or pipe is never opened twice */\n"
+        "static int {{lower}}_read_fd( {{lower}}_view* view, int fd ) {\n"
+        "    FILE* file;\n"
+        "    int   result;\n"
+        "    if( fd == STDIN_FILENO ) {\n"
+        "        return {{lower}}_read_stream( view, stdin );\n"
+        "    }\n"
+        "    file = fdopen( fd, \"rb\" );\n"
+        "    if( !file ) {\n"
+        "        close( fd );\n"
+        "        return -1;\n"
+        "    }\n"
+        "    result = {{lower}}_read_stream( view, file );\n"
+        "    fclose( file );\n"
+        "    return result;\n"
+        "}\n"
+        "\n"
+        "int {{lower}}_view_open( {{lower}}_view* view, const char* path, {{lower}}_advice advice ) {\n"
+        "    struct stat info;\n"
+        "    int         fd;\n"
+        "    void*       data;\n"
+        "\n"
+        "    view->data   = \"\";\n"
+        "    view->size   = 0;\n"
+        "    view->mapped = 0;\n"
+        "\n"
+        "    /* stdin redirected from a regular file is mapped too */\n"
+        "    fd = {{lower}}_is_stdio( path ) ? STDIN_FILENO : open( path, O_RDONLY );\n"
+        "    if( fd < 0 ) {\n"
+        "        return -1;\n"
+        "    }\n"
+        "    if( fstat( fd, &info ) != 0 || !S_ISREG( info.st_mode ) ) {\n"
+        "        return {{lower}}_read_fd( view, fd );\n"
+        "    }\n"
+        "    if( info.st_size == 0 ) {\n"
+        "        /* mmap rejects empty mappings */\n"
+        "        if( fd != STDIN_FILENO ) {\n"
+        "            close( fd );\n"
+        "        }\n"
+        "        return 0;\n"
+        "    }\n"
+        "    /* off_t is signed and may be wider than size_t, the size has to survive the round trip */\n"
+        "    if( info.st_size < 0 || (off_t)(size_t)info.st_size != info.st_size ) {\n"
+        "        if( fd != STDIN_FILENO ) {\n"
+        "            close( fd );\n"
+        "        }\n"
+        "        errno = EFBIG;\n"
+        "        return -1;\n"
+        "    }\n"
+        "\n"
+        "    data = mmap( NULL, (size_t)info.st_size, PROT_READ, MAP_PRIVATE, fd, 0 );\n"
+        "    if( data == MAP_FAILED ) {\n"
+        "        return {{lower}}_read_fd( view, fd );\n"
+        "    }\n"
+        "    /* the mapping stays valid after the fd is closed */\n"
+        "    if( fd != STDIN_FILENO ) {\n"
+        "        close( fd );\n"
+        "    }\n"
+        "\n"
+        "#if defined(MADV_SEQUENTIAL)\n"
+        "    switch( advice ) {\n"
+        "        case {{upper}}_SEQUENTIAL:\n"
+        "            madvise( data, (size_t)info.st_size, MADV_SEQUENTIAL );\n"
+        "            break;\n"
+        "        case {{upper}}_RANDOM:\n"
+        "            madvise( data, (size_t)info.st_size, MADV_RANDOM );\n"
+        "            break;\n"
+        "        case {{upper}}_WILLNEED:\n"
+        "            madvise( data, (size_t)info.st_size, MADV_WILLNEED );\n"
+        "            break;\n"
+        "        default:\n"
+        "            break;\n"
+        "    }\n"
+        "#else\n"
+        "    (void)advice;\n"
+        "#endif\n"
+        "\n"
+        "    view->data   = (const char*)data;\n"
+        "    view->size   = (size_t)info.st_size;\n"
+        "    view->mapped = 1;\n"
+        "    return 0;\n"
+        "}\n"
+        "\n"
+        "void {{lower}}_view_close( {{lower}}_view* view ) {\n"
+        "    if( view->mapped ) {\n"
+        "        munmap( (void*)view->data, view->size );\n"
+        "    } else if( view->size != 0 ) {\n"
+        "        free( (void*)view->data );\n"
+        "    }\n"
+        "    view->data   = \"\";\n"
+        "    view->size   = 0;\n"
+        "    view->mapped = 0;\n"
+        "}\n"
+        "\n"
+        "#endif\n"
+        "\n"
+        "void {{lower}}_lines_init( {{lower}}_lines* lines, const {{lower}}_view* view, char delimiter ) {\n"
+        "    lines->cursor    = view->data;\n"
+        "    lines->end       = view->data + view->size;\n"
+        "    lines->delimiter = delimiter;\n"
+        "}\n"
+        "\n"
+        "int {{lower}}_lines_next( {{lower}}_lines* lines, const char** record, size_t* length ) {\n"
+        "    const char* begin = lines->cursor;\n"
+        "    const char* next;\n"
+        "    size_t      size;\n"
+        "    if( begin >= lines->end ) {\n"
+        "        return 0;\n"
+        "    }\n"
+        "    next = (const char*)memchr( begin, lines->delimiter, (size_t)( lines->end - begin ) );\n"
+        "    if( next ) {\n"
+        "        size          = (size_t)( next - begin );\n"
+        "        lines->cursor = next + 1;\n"
+        "    } else {\n"
+        "        size          = (size_t)( lines->end - begin );\n"
+        "        lines->cursor = lines->end;\n"
+        "    }\n"
+        "    if( lines->delimiter == '\\n' && size != 0 && begin[size - 1] == '\\r' ) {\n"
+        "        size--;\n"
+        "    }\n"
+        "    *record = begin;\n"
+        "    *length = size;\n"
+        "    return 1;\n"
+        "}\n"
+        "\n"
+        "int {{lower}}_writer_open( {{lower}}_writer* writer, const char* path, size_t capacity ) {\n"
+        "    FILE* file;\n"
+        "    if( capacity == 0 ) {\n"
+        "        capacity = {{upper}}_DEFAULT_BUFFER;\n"
+        "    }\n"
+        "    writer->file     = NULL;\n"
+        "    writer->used     = 0;\n"
+        "    writer->error    = 0;\n"
+        "    writer->owned    = 0;\n"
+        "    writer->capacity = capacity;\n"
+        "    writer->buffer   = (char*)malloc( capacity );\n"
+        "    if( !writer->buffer ) {\n"
+        "        errno = ENOMEM;\n"
+        "        return -1;\n"
+        "    }\n"
+        "\n"
+        "    if( {{lower}}_is_stdio( path ) ) {\n"
+        "        fflush( stdout );\n"
+        "#if defined(_WIN32)\n"
+        "        _setmode( _fileno( stdout ), _O_BINARY );\n"
+        "#endif\n"
+        "        file = stdout;\n"
+        "    } else {\n"
+        "        file = fopen( path, \"wb\" );\n"
+        "        if( !file ) {\n"
+        "            free( writer->buffer );\n"
+        "            writer->buffer = NULL;\n"
+        "            return -1;\n"
+        "        }\n"
+        "        /* the writer buffers, stdio would only copy every block a second time */\n"
+        "        setvbuf( file, NULL, _IONBF, 0 );\n"
+        "        writer->owned = 1;\n"
+        "    }\n"
+        "    writer->file = file;\n"
+        "    return 0;\n"
+        "}\n"
+        "\n"
+        "static int {{lower}}_write_out( {{lower}}_writer* writer, const char* data, size_t size ) {\n"
+        "    errno = 0;\n"
+        "    if( size != 0 && fwrite( data, 1, size, (FILE*)writer->file ) != size ) {\n"
+        "        if( writer->error == 0 ) {\n"
+        "            writer->error = errno != 0 ? errno : EIO;\n"
+        "        }\n"
+        "    }\n"
+        "    if( writer->error != 0 ) {\n"
+        "        errno = writer->error;\n"
+        "        return -1;\n"
+        "    }\n"
+        "    return 0;\n"
+        "}\n"
+        "\n"
+        "int {{lower}}_writer_flush( {{lower}}_writer* writer ) {\n"
+        "    size_t used  = writer->used;\n"
+        "    writer->used = 0;\n"
+        "    if( {{lower}}_write_out( writer, writer->buffer, used ) != 0 ) {\n"
+        "        return -1;\n"
+        "    }\n"
+        "    if( !writer->owned && fflush( (FILE*)writer->file ) != 0 ) {\n"
+        "        writer->error = errno != 0 ? errno : EIO;\n"
+        "        return -1;\n"
+        "    }\n"
+        "    return 0;\n"
+        "}\n"
+        "\n"
+        "int {{lower}}_write( {{lower}}_writer* writer, const void* data, size_t size ) {\n"
+        "    if( writer->error != 0 ) {\n"
+        "        errno = writer->error;\n"
+        "        return -1;\n"
+        "    }\n"
+        "    if( size > writer->capacity - writer->used ) {\n"
+        "        if( {{lower}}_writer_flush( writer ) != 0 ) {\n"
+        "            return -1;\n"
+        "        }\n"
+        "        if( size >= writer->capacity ) {\n"
+        "            return {{lower}}_write_out( writer, (const char*)data, size );\n"
+        "        }\n"
+        "    }\n"
+        "    memcpy( writer->buffer + writer->used, data, size );\n"
+        "    writer->used += size;\n"
+        "    return 0;\n"
+        "}\n"
+        "\n"
+        "int {{lower}}_writer_close( {{lower}}_writer* writer ) {\n"
+        "    int result = 0;\n"
+        "    if( !writer->file ) {\n"
+        "        return 0;\n"
+        "    }\n"
+        "    if( {{lower}}_writer_flush( writer ) != 0 ) {\n"
+        "        result = -1;\n"
+        "    }\n"
+        "    if( writer->owned && fclose( (FILE*)writer->file ) != 0 && result == 0 ) {\n"
+        "        result = -1;\n"
+        "    }\n"
+        "    free( writer->buffer );\n"
+        "    writer->buffer = NULL;\n"
+        "    writer->file   = NULL;\n"
+        "    if( result != 0 && writer->error != 0 ) {\n"
+        "        errno = writer->error;\n"
+        "    }\n"
+        "    return result;\n"
+        "}\n"
+    ),
+}
@@ -0,0 +1,107 @@
+# * Description:  Shared print helpers and user directories for cnew, cproj, glnew and pynew
+# * Author:       Alicia Amarilla ( smushyaa@gmail.com )
+# * File Created: October 19, 2026
+
+import sys
+import os
+
+# only sys and os are imported here, termcolor and datetime are imported
+# the first time they are actually needed so quiet runs never pay for them
+
+silent = False
+
+# number of print_err calls, cproj --workspace reports projects with errors from it
+error_count = 0
+
+author = "Alicia Amarilla ( smushyaa@gmail.com )"
+
+def colored( msg:str, color:str ) -> str:
+    import termcolor
+    return termcolor.colored( msg, color )
+
+def print_status( msg:str ):
+    if not(silent):
+        print( colored( msg, "green" ) )
+
+def print_err( msg:str ):
+    global error_count
+    error_count += 1
+    print( colored( msg, "red" ) )
+
+def print_fatal( msg:str ):
+    print_err( "error: " + msg )
+    print_err( "run with -h or --help to get a list of valid options" )
+    sys.exit(-1)
+
+def print_help( msg:str ):
+    print( colored( msg, "cyan" ) )
+
+def import_getopt():
+    """getopt without gettext, which it only imports to translate its error
+    messages and which pulls in re, locale and enum on every run"""
+    if not( "gettext" in sys.modules ):
+        # a None entry makes "from gettext import gettext" raise ImportError,
+        # getopt then falls back to the untranslated messages
+        sys.modules["gettext"] = None
+        try:
+            import getopt
+        finally:
+            del sys.modules["gettext"]
+    import getopt
+    return getopt
+
+def is_identifier( text:str ) -> bool:
+    return text != "" and ( text[0].isalpha() or text[0] == "_" ) and all( c.isalnum() or c == "_" for c in text )
+
+def module_name( name:str, kind:str = "module" ) -> str:
+    """basename of name, exits when it is not a valid C identifier"""
+    base = os.path.basename( os.path.normpath( name ) )
+    if not( is_identifier( base ) ):
+        print_fatal( "\"" + base + "\" is not a valid " + kind + " name!" )
+    return base
+
+def guard_context( context:dict, header_guard:str, no_pragma:bool = False ) -> dict:
+    # guard_begin/guard_end of generated headers, the header guard wins over pragma once
+    if header_guard != "":
+        context["guard_begin"] = "#if !defined(" + header_guard + ")\n#define " + header_guard + " 1"
+        context["guard_end"]   = "\n#endif /* " + header_guard + " */\n"
+    else:
+        context["guard_begin"] = "" if no_pragma else "#pragma once"
+        context["guard_end"]   = ""
+    return context
+
+def write_outputs( files:list, overwrite:bool, kind:str ):
+    """writes ( path, text ) pairs of a generator, existing files are kept without overwrite"""
+    for path, text in files:
+        if not(overwrite) and os.path.isfile( path ):
+            print_err( "error: cannot create \"" + path + "\", file already exists" )
+            print_err( "use -o or --overwrite to overwrite existing file" )
+            continue
+        try:
+            with open( path, "w+", newline='\n' ) as write_file:
+                write_file.write( text )
+        except OSError as err:
+            print_fatal( str(err) )
+        print_status( "created " + kind + " file \"" + path + "\"" )
+
+def today_string() -> str:
+    from datetime import date
+    return date.today().strftime( "%B %d, %Y" )
+
+def config_dir() -> str:
+    if sys.platform == "win32":
+        base = os.environ.get( "APPDATA", "" )
+    else:
+        base = os.environ.get( "XDG_CONFIG_HOME", "" )
+    if base == "":
+        base = os.path.join( os.path.expanduser( "~" ), ".config" )
+    return os.path.join( base, "scaffold" )
+
+def cache_dir() -> str:
+    if sys.platform == "win32":
+        base = os.environ.get( "LOCALAPPDATA", "" )
+    else:
+        base = os.environ.get( "XDG_CACHE_HOME", "" )
+    if base == "":
+        base = os.path.join( os.path.expanduser( "~" ), ".cache" )
+    return os.path.join( base, "scaffold" )
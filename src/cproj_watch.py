@@ -0,0 +1,397 @@
+# * Description:  cproj --watch, keeps Makefile SRC and compile_commands.json in sync with src
+# * Author:       Alicia Amarilla ( smushyaa@gmail.com )
+# * File Created: October 19, 2026
+
+import sys
+import os
+import profiler
+from common import print_status, print_err, print_fatal
+
+# cproj --watch tracks every directory below ./src (hidden directories are
+# skipped like cproj --init does) and keeps the build metadata in sync:
+#   Makefile              SRC lists ./src and every directory below it. entries
+#                         that are not below ./src are left alone, entries of
+#                         removed directories are dropped, new ones appended
+#   compile_commands.json updated when it exists, one entry per .c/.cpp file in
+#                         the SRC directories with the flags of compile_flags.txt
+# compile_flags.txt has no per directory entries, it is watched as the flag
+# source of the compile database.
+#
+# on linux the directories are watched with inotify and the process sleeps in
+# select until something changes, elsewhere (or with --poll) the directory
+# mtimes are checked every poll_interval seconds. events are debounced, a
+# batch is written once no event arrived for debounce seconds or at the
+# latest after max_delay seconds, and files are only written when they change.
+# object and dependency files written by make do not wake the watcher up.
+
+debounce      = 0.25
+max_delay     = 2.0
+poll_interval = 1.0
+
+source_exts = ( ".c", ".cpp" )
+root_files  = ( "Makefile", "compile_flags.txt", "compile_commands.json", "src" )
+
+src_root = "src"
+
+# <sys/inotify.h>
+IN_CLOSE_WRITE  = 0x00000008
+IN_MOVED_FROM   = 0x00000040
+IN_MOVED_TO     = 0x00000080
+IN_CREATE       = 0x00000100
+IN_DELETE       = 0x00000200
+IN_DELETE_SELF  = 0x00000400
+IN_MOVE_SELF    = 0x00000800
+IN_Q_OVERFLOW   = 0x00004000
+IN_IGNORED      = 0x00008000
+IN_ONLYDIR      = 0x01000000
+IN_ISDIR        = 0x40000000
+IN_NONBLOCK     = 0x00000800
+IN_CLOEXEC      = 0x00080000
+
+dir_mask  = IN_CREATE | IN_DELETE | IN_MOVED_FROM | IN_MOVED_TO | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR
+root_mask = IN_CREATE | IN_DELETE | IN_MOVED_FROM | IN_MOVED_TO | IN_CLOSE_WRITE | IN_ONLYDIR
+
+class Inotify:
+    def __init__( self ):
+        import ctypes
+        import ctypes.util
+
+        self.libc = ctypes.CDLL( ctypes.util.find_library( "c" ) or "libc.so.6", use_errno=True )
+        self.fd   = self.libc.inotify_init1( IN_NONBLOCK | IN_CLOEXEC )
+        if self.fd < 0:
+            raise OSError( ctypes.get_errno(), "inotify_init1 failed" )
+
+    def add_watch( self, path:str, mask:int ) -> int:
+        import ctypes
+
+        wd = self.libc.inotify_add_watch( self.fd, os.fsencode( path ), mask )
+        if wd < 0:
+            errno = ctypes.get_errno()
+            raise OSError( errno, os.strerror( errno ), path )
+        return wd
+
+    def read( self ) -> list:
+        """returns [ ( wd, mask, name ) ] of every pending event"""
+        import struct
+
+        events = []
+        while True:
+            try:
+                data = os.read( self.fd, 65536 )
+            except BlockingIOError:
+                return events
+            offset = 0
+            while offset + 16 <= len( data ):
+                wd, mask, _, length = struct.unpack_from( "iIII", data, offset )
+                name = data[offset + 16:offset + 16 + length].split( b"\0", 1 )[0]
+                events.append( ( wd, mask, os.fsdecode( name ) ) )
+                offset += 16 + length
+
+    def wait( self, timeout ) -> bool:
+        import select
+        readable, _, _ = select.select( [ self.fd ], [], [], timeout )
+        return len( readable ) != 0
+
+def src_entries( line:str ) -> list:
+    return line.split( "=", 1 )[1].split()
+
+def update_src( entries:list, dirs:list ) -> list:
+    """entries of the SRC line with removed directories dropped and new ones appended"""
+    result = []
+    seen   = set()
+    for entry in entries:
+        path = os.path.normpath( entry )
+        if path == src_root or path.startswith( src_root + os.sep ):
+            if not( path in dirs ) or path in seen:
+                continue
+            seen.add( path )
+        result.append( entry )
+    for path in dirs:
+        if not( path in seen ):
+            result.append( "./" + path.replace( os.sep, "/" ) )
+    return result
+
+class Watcher:
+    def __init__( self, silent:bool, verbose:bool ):
+        self.silent  = silent
+        self.verbose = verbose
+        # relative directory -> ( mtime_ns, source file names )
+        self.dirs    = {}
+        self.dirty   = set()
+        self.root_dirty = True
+        self.inotify = None
+        # wd -> directory and directory -> wd of the live inotify watches
+        self.wds     = {}
+        self.watched = {}
+        self.root_wd = -1
+        self.root_mtimes = {}
+        self.db_warned   = False
+
+    def report( self, message:str ):
+        if not( self.silent ):
+            print_status( message )
+
+    def watch_dir( self, path:str ):
+        if self.inotify is not None and not( path in self.watched ):
+            wd = self.inotify.add_watch( path, dir_mask )
+            self.wds[wd] = path
+            self.watched[path] = wd
+
+    def drop_tree( self, path:str ):
+        prefix = path + os.sep
+        for known in [ d for d in self.dirs if d == path or d.startswith( prefix ) ]:
+            del self.dirs[known]
+            self.dirty.discard( known )
+
+    def scan( self, path:str ):
+        """rescans one directory, new subdirectories are scanned and watched recursively"""
+        # watch before listing so nothing created in between is missed
+        try:
+            self.watch_dir( path )
+        except FileNotFoundError:
+            self.drop_tree( path )
+            return
+        try:
+            mtime = os.stat( path ).st_mtime_ns
+            with os.scandir( path ) as it:
+                entries = list( it )
+        except OSError:
+            self.drop_tree( path )
+            return
+
+        sources = []
+        subdirs = []
+        for entry in entries:
+            if entry.name.startswith( "." ):
+                continue
+            if entry.is_dir( follow_symlinks=False ):
+                subdirs.append( os.path.join( path, entry.name ) )
+            elif os.path.splitext( entry.name )[1] in source_exts:
+                sources.append( entry.name )
+        self.dirs[path] = ( mtime, sorted( sources ) )
+
+        prefix = path + os.sep
+        for known in [ d for d in self.dirs if d.startswith( prefix ) and os.path.dirname( d ) == path ]:
+            if not( known in subdirs ):
+                self.drop_tree( known )
+        for subdir in subdirs:
+            if not( subdir in self.dirs ):
+                self.scan( subdir )
+
+    def root_state( self ) -> dict:
+        state = {}
+        for name in root_files:
+            try:
+                st = os.stat( name )
+                state[name] = ( st.st_mtime_ns, st.st_size )
+            except OSError:
+                state[name] = None
+        return state
+
+    def poll( self ) -> tuple:
+        """polling fallback, marks directories whose mtime changed and returns
+        the state it saw so callers can tell when changes settled"""
+        mtimes = []
+        for path, ( mtime, _ ) in list( self.dirs.items() ):
+            try:
+                current = os.stat( path ).st_mtime_ns
+            except OSError:
+                current = None
+                self.dirty.add( os.path.dirname( path ) or src_root )
+            if current != mtime:
+                self.dirty.add( path )
+            mtimes.append( current )
+        state = self.root_state()
+        if state != self.root_mtimes:
+            self.root_dirty = True
+        if not( src_root in self.dirs ) and state[src_root] is not None:
+            self.dirty.add( src_root )
+        return mtimes, state
+
+    def handle( self, events:list ):
+        for wd, mask, name in events:
+            if mask & IN_Q_OVERFLOW:
+                # events were lost, rescan everything
+                self.dirty.update( self.dirs )
+                self.dirty.add( src_root )
+                self.root_dirty = True
+                continue
+            if wd == self.root_wd:
+                if name in root_files:
+                    self.root_dirty = True
+                    if name == src_root:
+                        self.dirty.add( src_root )
+                continue
+            path = self.wds.get( wd )
+            if path is None:
+                continue
+            if mask & IN_IGNORED:
+                del self.wds[wd]
+                if self.watched.get( path ) == wd:
+                    del self.watched[path]
+                continue
+            if mask & ( IN_DELETE_SELF | IN_MOVE_SELF ):
+                self.dirty.add( os.path.dirname( path ) or src_root )
+                self.dirty.add( path )
+            elif mask & IN_ISDIR or os.path.splitext( name )[1] in source_exts:
+                self.dirty.add( path )
+
+    def pending( self ) -> bool:
+        if self.root_dirty and len( self.dirty ) == 0 and self.root_state() == self.root_mtimes:
+            # only our own writes
+            self.root_dirty = False
+        return self.root_dirty or len( self.dirty ) != 0
+
+    def sync( self ):
+        profiler.mark( "sync" )
+        for path in sorted( self.dirty, key=len ):
+            if path == src_root or os.path.dirname( path ) in self.dirs:
+                self.scan( path )
+        self.dirty.clear()
+        self.root_dirty = False
+
+        entries = self.write_makefile( sorted( self.dirs ) )
+        self.write_database( entries )
+        self.root_mtimes = self.root_state()
+
+    def write_makefile( self, dirs:list ) -> list:
+        """updates the SRC line, returns its entries"""
+        entries = []
+        try:
+            with open( "Makefile", "r" ) as read_file:
+                makefile_lines = read_file.readlines()
+        except OSError:
+            makefile_lines = []
+            print_err( "no Makefile present, cannot update SRC!" )
+        for idx, line in enumerate( makefile_lines ):
+            if "SRC = " in line:
+                entries = update_src( src_entries( line ), dirs )
+                old = src_entries( line )
+                if entries != old:
+                    makefile_lines[idx] = line.split( "=", 1 )[0] + "= " + " ".join( entries ) + "\n"
+                    with open( "Makefile", "w+", newline='\n' ) as write_file:
+                        write_file.writelines( makefile_lines )
+                    added   = [ e for e in entries if not( e in old ) ]
+                    removed = [ e for e in old if not( e in entries ) ]
+                    self.report(
+                        "updated SRC in Makefile:" +
+                        "".join( " +" + e for e in added ) + "".join( " -" + e for e in removed )
+                    )
+                break
+        return entries
+
+    def write_database( self, entries:list ):
+        import json
+
+        if not( os.path.isfile( "compile_commands.json" ) ):
+            return
+        try:
+            with open( "compile_flags.txt", "r" ) as read_file:
+                flags = [ line.strip() for line in read_file if line.strip() != "" ]
+        except OSError:
+            flags = []
+        if len( flags ) == 0:
+            if not( self.db_warned ):
+                print_err( "compile_flags.txt is missing or empty, not updating compile_commands.json" )
+                self.db_warned = True
+            return
+        self.db_warned = False
+
+        database  = []
+        directory = os.getcwd()
+        for entry in entries:
+            path = os.path.normpath( entry )
+            if path in self.dirs:
+                sources = self.dirs[path][1]
+            else:
+                try:
+                    sources = sorted( name for name in os.listdir( path ) if os.path.splitext( name )[1] in source_exts )
+                except OSError:
+                    continue
+            for name in sources:
+                file = os.path.join( path, name ).replace( os.sep, "/" )
+                database.append( {
+                    "directory": directory,
+                    "file": file,
+                    "arguments": flags + [ "-c", file, "-o", os.path.splitext( file )[0] + ".o" ],
+                } )
+        text = json.dumps( database, indent=4 ) + "\n"
+        with open( "compile_commands.json", "r" ) as read_file:
+            if read_file.read() == text:
+                return
+        with open( "compile_commands.json", "w+", newline='\n' ) as write_file:
+            write_file.write( text )
+        self.report( "updated compile_commands.json (" + str(len( database )) + " files)" )
+
+    def wait_inotify( self ):
+        import time
+
+        # sleep until the first event, then until the batch settles
+        self.inotify.wait( None )
+        self.handle( self.inotify.read() )
+        deadline = time.monotonic() + max_delay
+        while True:
+            timeout = min( debounce, deadline - time.monotonic() )
+            if timeout <= 0 or not( self.inotify.wait( timeout ) ):
+                return
+            self.handle( self.inotify.read() )
+
+    def wait_poll( self ):
+        import time
+
+        while True:
+            time.sleep( poll_interval )
+            state = self.poll()
+            if self.pending():
+                break
+        deadline = time.monotonic() + max_delay
+        while time.monotonic() < deadline:
+            time.sleep( debounce )
+            current = self.poll()
+            if current == state:
+                return
+            state = current
+
+def run( use_poll:bool, silent:bool, verbose:bool ):
+    if not( os.path.isfile( "Makefile" ) ):
+        print_fatal( "no Makefile in current directory, run cproj --init first!" )
+
+    profiler.mark( "watch" )
+    watcher = Watcher( silent, verbose )
+    if not( use_poll ) and sys.platform == "linux":
+        try:
+            watcher.inotify = Inotify()
+            watcher.root_wd = watcher.inotify.add_watch( ".", root_mask )
+        except OSError as err:
+            watcher.inotify = None
+            print_err( "inotify unavailable (" + str(err) + "), polling every " + str(poll_interval) + "s" )
+
+    watcher.dirty.add( src_root )
+    try:
+        watcher.sync()
+    except OSError as err:
+        if watcher.inotify is None:
+            raise
+        # most likely out of inotify watches, fall back to polling
+        print_err( "inotify failed (" + str(err) + "), polling every " + str(poll_interval) + "s" )
+        watcher = Watcher( silent, verbose )
+        watcher.dirty.add( src_root )
+        watcher.sync()
+
+    if not( silent ):
+        mode = "polling" if watcher.inotify is None else "inotify"
+        print_status( "watching " + str(len( watcher.dirs )) + " directories (" + mode + "), ctrl+c to stop" )
+
+    try:
+        while True:
+            if watcher.inotify is not None:
+                watcher.wait_inotify()
+            else:
+                watcher.wait_poll()
+            if watcher.pending():
+                if verbose:
+                    print_status( "syncing " + str(len( watcher.dirty )) + " changed directories" )
+                watcher.sync()
+    except KeyboardInterrupt:
+        pass
+    sys.exit(0)
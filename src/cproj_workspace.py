@@ -0,0 +1,217 @@
+# * Description:  Parallel init and edits of many cproj projects from one workspace manifest
+# * Author:       Alicia Amarilla ( smushyaa@gmail.com )
+# * File Created: October 19, 2026
+
+import sys
+import os
+import profiler
+from common import print_status, print_err, print_fatal
+
+# a workspace manifest is a manifest (see manifest.py) with a "projects" list,
+# every project is a name or a table with these keys, "defaults" applies to all:
+#   name      project name, also the target name in the top-level Makefile
+#   path      project directory relative to the manifest. default = name
+#   c         C project instead of C++
+#   version   C/C++ version
+#   dirs      source directories below src
+#   flags     compiler flags for compile_flags.txt and Makefile
+#   cflags    compiler flags only for compile_flags.txt
+#   makeflags compiler flags only for Makefile
+#   rename    new project name of an existing project
+#   readme    create README.md on init. default = true
+#   todo      create TODO.md on init. default = true
+#   depends   names of projects that have to be built first
+#
+# a project without a Makefile is initialized, any other project is edited.
+# dirs and flags of the manifest describe the project, they are added quietly
+# when missing so running the same workspace again is a no-op. dirs and flags
+# given on the command line are edits and report like plain cproj does.
+# every project runs in a worker process, its output is collected and
+# printed when it failed, had errors or with --verbose.
+#
+# the top-level Makefile next to the manifest has one target per project,
+# make -j builds independent projects in parallel. CONFIG=release passes
+# the release flags and target directory to every project Makefile.
+
+makefile_marker = "# generated by cproj --workspace, do not edit"
+
+list_keys = [ "dirs", "flags", "cflags", "makeflags", "depends" ]
+reserved  = [ "all", "clean", "run" ]
+
+def load( path:str ) -> list:
+    import manifest
+
+    try:
+        entries = manifest.load_manifest( path, "projects" )
+    except manifest.ManifestError as err:
+        print_fatal( str(err) )
+
+    names = set()
+    for entry in entries:
+        name = entry["name"]
+        if name in names:
+            print_fatal( "project \"" + name + "\" is defined twice!" )
+        if name in reserved or any( c.isspace() or c in ":#=$" for c in name ):
+            print_fatal( "\"" + name + "\" cannot be used as a project name!" )
+        names.add( name )
+        for key in list_keys:
+            value = entry.get( key, [] )
+            if isinstance( value, str ):
+                value = [ value ]
+            if not( isinstance( value, list ) ) or not( all( isinstance( v, str ) for v in value ) ):
+                print_fatal( "project \"" + name + "\": \"" + key + "\" must be a list of strings!" )
+            entry[key] = value
+        entry.setdefault( "path", name )
+
+    for entry in entries:
+        for dependency in entry["depends"]:
+            if not( dependency in names ):
+                print_fatal( "project \"" + entry["name"] + "\" depends on unknown project \"" + dependency + "\"!" )
+    return entries
+
+def run_project( root:str, entry:dict, directories:list, cflags:list, makeflags:list, verbose:bool ):
+    """runs in a worker process, directories already start with src/.
+    returns ( name, action, ok, errors, output )"""
+    import io
+    import contextlib
+    import common
+    import create_cproj
+
+    path    = os.path.join( root, entry["path"] )
+    output  = io.StringIO()
+    action  = "updated"
+    ok      = True
+    cwd     = os.getcwd()
+    common.error_count = 0
+
+    is_cpp      = not( entry.get( "c", False ) )
+    dirs        = [ "src/" + d for d in entry["dirs"] ]
+    all_cflags  = entry["flags"] + entry["cflags"]
+    all_mflags  = entry["flags"] + entry["makeflags"]
+    try:
+        os.makedirs( path, exist_ok=True )
+        os.chdir( path )
+        with contextlib.redirect_stdout( output ):
+            version = create_cproj.resolve_version( str(entry.get( "version", "" )), is_cpp )
+            if not( os.path.isfile( "Makefile" ) ):
+                action = "initialized"
+                create_cproj.init(
+                    entry.get( "rename", entry["name"] ), is_cpp, version,
+                    all_cflags + cflags, all_mflags + makeflags, create_cproj.init_directories( dirs + directories ),
+                    entry.get( "readme", True ), entry.get( "todo", True ),
+                    False, verbose
+                )
+            if entry.get( "rename", "" ) != "":
+                create_cproj.rename_proj( entry["rename"], False )
+            for quiet, edit_dirs, edit_cflags, edit_mflags in (
+                ( True, dirs, all_cflags, all_mflags ),
+                ( False, directories, cflags, makeflags ),
+            ):
+                if quiet:
+                    edit_dirs = [ d for d in edit_dirs if not( os.path.isdir( d ) ) ]
+                if len( edit_dirs ) != 0:
+                    create_cproj.create_src_dir( edit_dirs, quiet )
+                if len( edit_cflags ) != 0:
+                    create_cproj.add_cflags( edit_cflags, quiet )
+                if len( edit_mflags ) != 0:
+                    create_cproj.add_makeflags( edit_mflags, quiet )
+    except SystemExit as exit:
+        # init and print_fatal always exit
+        ok = exit.code in ( 0, None )
+    except OSError as err:
+        ok = False
+        output.write( str(err) + "\n" )
+    finally:
+        os.chdir( cwd )
+
+    return entry["name"], action, ok, common.error_count, output.getvalue()
+
+def render_makefile( root:str, entries:list ) -> str:
+    lines = [
+        makefile_marker,
+        "",
+        "# make CONFIG=release builds every project with its release flags",
+        "CONFIG ?= debug",
+        "",
+        "ifeq ($(CONFIG),release)",
+        "PROJECT_CONFIG = CFLAGS='$$(RELEASE)' TARGETDIR=./build/release",
+        "else",
+        "PROJECT_CONFIG = CFLAGS='$$(DEBUG)' TARGETDIR=./build/debug",
+        "endif",
+        "",
+        "PROJECTS = " + " ".join( entry["name"] for entry in entries ),
+        "",
+        "all: $(PROJECTS)",
+        "",
+    ]
+    for entry in entries:
+        path = entry["path"].replace( "\\", "/" )
+        lines.append( ( entry["name"] + ": " + " ".join( entry["depends"] ) ).rstrip() )
+        lines.append( "\t$(MAKE) -C " + path + " $(PROJECT_CONFIG)" )
+        lines.append( "" )
+    lines.append( "clean:" )
+    for entry in entries:
+        lines.append( "\t-$(MAKE) -C " + entry["path"].replace( "\\", "/" ) + " clean" )
+    lines.append( "" )
+    lines.append( ".PHONY: all clean $(PROJECTS)" )
+    return "\n".join( lines ) + "\n"
+
+def write_makefile( root:str, entries:list ) -> bool:
+    makefile_path = os.path.join( root, "Makefile" )
+    if os.path.isfile( makefile_path ):
+        with open( makefile_path, "r" ) as read_file:
+            if read_file.readline().rstrip( "\n" ) != makefile_marker:
+                print_err( "\"" + makefile_path + "\" was not generated by cproj --workspace, not overwriting it" )
+                return False
+    with open( makefile_path, "w+", newline='\n' ) as write_file:
+        write_file.write( render_makefile( root, entries ) )
+    return True
+
+def run( manifest_path:str, directories:list, cflags:list, makeflags:list, jobs:int, silent:bool, verbose:bool ):
+    from concurrent.futures import ProcessPoolExecutor
+
+    profiler.mark( "manifest" )
+    entries = load( manifest_path )
+    root    = os.path.dirname( os.path.abspath( manifest_path ) )
+
+    profiler.mark( "projects" )
+    results = []
+    if len( entries ) != 0:
+        with ProcessPoolExecutor( max_workers=max( 1, min( jobs, len( entries ) ) ) ) as pool:
+            futures = [
+                pool.submit( run_project, root, entry, directories, cflags, makeflags, verbose )
+                for entry in entries
+            ]
+            results = [ future.result() for future in futures ]
+
+    counts = { "initialized": 0, "updated": 0 }
+    failed = 0
+    with_errors = 0
+    for name, action, ok, errors, output in results:
+        if not( ok ):
+            failed += 1
+            print_err( "error: project \"" + name + "\" failed:" )
+            print_err( "    " + output.rstrip().replace( "\n", "\n    " ) )
+            continue
+        counts[action] += 1
+        if errors != 0:
+            with_errors += 1
+        if verbose or ( errors != 0 and not( silent ) ):
+            print_status( name + " (" + action + "):" )
+            print( "    " + output.rstrip().replace( "\n", "\n    " ) )
+
+    profiler.mark( "makefile" )
+    makefile_ok = write_makefile( root, entries )
+
+    if not( silent ):
+        print_status(
+            "workspace: " + str(len( results )) + " projects, " +
+            str(counts["initialized"]) + " initialized, " + str(counts["updated"]) + " updated, " +
+            str(with_errors) + " with errors, " + str(failed) + " failed"
+        )
+        if makefile_ok:
+            print_status( "wrote \"" + os.path.join( root, "Makefile" ) + "\"" )
+
+    if failed != 0 or not( makefile_ok ):
+        sys.exit(-1)
+    sys.exit(0)
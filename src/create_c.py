@@ -4,27 +4,10 @@
 
 import sys
 import os
-import getopt
-import pathlib
-from datetime import date
-import termcolor
-
-silent = False
-
-def print_status( msg:str ):
-    if not(silent):
-        print( termcolor.colored( msg, "green" ) )
-
-def print_err( msg:str ):
-    print( termcolor.colored( msg, "red" ) )
-
-def print_fatal( msg:str ):
-    print_err( "error: " + msg )
-    print_err( "run with -h or --help to get a list of valid options" )
-    sys.exit(-1)
-
-def print_help( msg:str ):
-    print( termcolor.colored( msg, "cyan" ) )
+import profiler
+import common
+import templates
+from common import print_status, print_err, print_fatal, print_help
 
 def display_help():
     print_help( "cnew: create new C/C++ header and/or source file" )
@@ -39,26 +22,133 @@ def display_help():
     print_help( " -c                 [switch]: create c source/header instead of cpp" )
     print_help( " -o, --overwrite    [switch]: will overwrite files if they already exist" )
     print_help( " -g, --header_guard [string]: define header guard to use instead of pragma once. --no_pragma has no effect with this option" )
+    print_help( " -m, --manifest     [string]: create every file listed in manifest (.json, .toml or one name per line, - for stdin)" )
+    print_help( "                    entries may override description, c, header, source, no_pragma, no_include, no_info and header_guard" )
+    print_help( " --io               [string]: create an i/o module <name> instead: memory mapped read-only file views with" )
+    print_help( "                    madvise hints, a zero copy record iterator, a large buffer writer and a read fallback" )
+    print_help( "                    for pipes and stdin. works with -c, -d, --no_info, --no_pragma, -g and -o" )
     print_help( " -s, -q, --silent, --quiet [switch]: don't print status" )
+    for line in profiler.help_lines:
+        print_help( line )
     print_help( "\n -h, --help      [switch]: print this help message and quit" )
     sys.exit(0)
 
-short_options = "n:g:d:ochsq"
+short_options = "n:g:d:m:ochsq"
 long_options  = [
     "name=", "overwrite", "header_guard=",
     "no_pragma", "help", "header",
     "source", "no_info", "no_include",
     "description",
-    "silent", "quiet"
+    "silent", "quiet", "manifest=", "io="
 ]
 
-if __name__ == "__main__":
-    arg_list = sys.argv[1:]
+def make_context( name:str, description:str, no_info:bool ) -> dict:
+    context = { "name": name, "description": description, "info": "" }
+    if not( no_info ):
+        context["info"] = templates.render( "c_info", **context )
+    return context
+
+def render_header( context:dict, header_guard:str, no_pragma:bool ) -> str:
+    if header_guard != "":
+        return templates.render( "c_header_guard", guard=header_guard, **context )
+    if no_pragma:
+        return templates.render( "c_header_empty", **context )
+    return templates.render( "c_header", **context )
+
+def render_source( context:dict, include:str ) -> str:
+    if include == "":
+        return templates.render( "c_source_empty", **context )
+    return templates.render( "c_source", include=include, **context )
+
+def render_io( module:str, context:dict, header_ext:str, header_guard:str, no_pragma:bool ) -> tuple:
+    """returns the header and source of an --io module"""
+    context = common.guard_context( dict( context ), header_guard, no_pragma )
+    context["lower"]   = module.lower()
+    context["upper"]   = module.upper()
+    context["include"] = module + header_ext
+    header = templates.render( "c_io_header", **context )
+    if header.startswith( "\n" ):
+        # neither info nor guard
+        header = header.lstrip( "\n" )
+    return header, templates.render( "c_io_source", **context )
+
+def create_io( name:str, cpp:bool, description:str, no_info:bool, header_guard:str, no_pragma:bool, overwrite:bool ):
+    module = common.module_name( name )
+
+    header_ext, source_ext = extensions( cpp )
+    prefix = "src/" if os.path.isdir( "src" ) else ""
+
+    profiler.mark( "render" )
+    header, source = render_io( module, make_context( name, description, no_info ), header_ext, header_guard, no_pragma )
+
+    profiler.mark( "write" )
+    common.write_outputs( [ ( prefix + name + header_ext, header ), ( prefix + name + source_ext, source ) ], overwrite, "i/o" )
+
+    sys.exit(0)
+
+def extensions( cpp:bool ):
+    if cpp:
+        return ".hpp", ".cpp"
+    else:
+        return ".h", ".c"
+
+def create_from_manifest( manifest_path:str, defaults:dict, overwrite:bool ):
+    import manifest
+
+    profiler.mark( "manifest" )
+    try:
+        entries = manifest.load_manifest( manifest_path )
+    except manifest.ManifestError as err:
+        print_fatal( str(err) )
+
+    prefix = ""
+    if os.path.isdir( "src" ):
+        prefix = "src/"
+
+    profiler.mark( "render" )
+    files = []
+    for entry in entries:
+        opts = dict( defaults )
+        opts.update( entry )
+        name = opts["name"]
+
+        if opts["no_info"] and opts["description"] != "":
+            print_fatal( "\"" + name + "\": no_info and description cannot be defined simultaneously!" )
+        if opts["header"] and opts["source"]:
+            print_fatal( "\"" + name + "\": header and source cannot be defined simultaneously!" )
+        if opts["no_include"] and ( opts["header"] or opts["source"] ):
+            print_fatal( "\"" + name + "\": no_include and source/header cannot be defined simultaneously!" )
+
+        header_ext, source_ext = extensions( not( opts["c"] ) )
+        context = make_context( name, opts["description"], opts["no_info"] )
+
+        if not( opts["source"] ):
+            files.append( ( prefix + name + header_ext, render_header( context, opts["header_guard"], opts["no_pragma"] ) ) )
+        if not( opts["header"] ):
+            include = ""
+            if not( opts["no_include"] ) and not( opts["source"] ):
+                include = os.path.basename( os.path.normpath( name ) ) + header_ext
+            files.append( ( prefix + name + source_ext, render_source( context, include ) ) )
+
+    profiler.mark( "write" )
+    created, skipped, failed = manifest.write_files( files, overwrite )
+    for path, err in failed:
+        print_err( "error: cannot create \"" + path + "\": " + err )
+    print_status( manifest.summary( created, skipped, failed ) )
+
+    if len( failed ) != 0:
+        sys.exit(-1)
+    sys.exit(0)
+
+def main( arg_list:list ):
+    arg_list = profiler.setup( arg_list )
+    getopt   = common.import_getopt()
 
     if len( arg_list ) == 0:
         print_fatal( "arguments required!" )
 
     name = ""
+    manifest_path = ""
 
     if not("-" in arg_list[0]):
         name = arg_list[0]
@@ -73,11 +163,12 @@ if __name__ == "__main__":
     no_include   = False
     overwrite    = False
     description  = ""
+    io_name      = ""
 
     try:
         args, values = getopt.getopt( arg_list, short_options, long_options )
     except getopt.error as err:
-        print_fatal( err )
+        print_fatal( str(err) )
 
     for arg, value in args:
         if arg == "-h" or arg == "--help":
@@ -101,9 +192,34 @@ if __name__ == "__main__":
         if arg == "-o" or arg == "--overwrite":
             overwrite = True
         if arg == "-s" or arg == "-q" or arg == "--silent" or arg == "--quiet":
-            silent = True
+            common.silent = True
         if arg == "-d" or arg == "--description":
             description = value
+        if arg == "-m" or arg == "--manifest":
+            manifest_path = value
+        if arg == "--io":
+            io_name = value
+
+    if io_name != "":
+        if name != "" or manifest_path != "":
+            print_fatal( "--io cannot be combined with -n/--name or -m/--manifest!" )
+        if no_header or no_source or no_include:
+            print_fatal( "--io cannot be combined with --header, --source or --no_include!" )
+        if no_info and description != "":
+            print_fatal( "--no_info and -d/--description cannot be defined simultaneously!" )
+        create_io( io_name, cpp, description, no_info, header_guard, no_pragma, overwrite )
+
+    if manifest_path != "":
+        if name != "":
+            print_fatal( "-n/--name and -m/--manifest cannot be defined simultaneously!" )
+        if header_guard != "":
+            print_fatal( "-g/--header_guard cannot be used with -m/--manifest, set header_guard per entry instead!" )
+        create_from_manifest( manifest_path, {
+            "description": description, "c": not( cpp ),
+            "header": no_source, "source": no_header,
+            "no_pragma": no_pragma, "no_include": no_include,
+            "no_info": no_info, "header_guard": ""
+        }, overwrite )
 
     if name == "":
         print_fatal( "must input file name!" )
@@ -117,73 +233,54 @@ if __name__ == "__main__":
     if no_include and ( no_header or no_source ):
         print_fatal( "--no_include and --source/--header cannot be defined simultaneously!" )
 
-    header_ext = ""
-    source_ext = ""
-
-    if cpp:
-        header_ext = ".hpp"
-        source_ext = ".cpp"
-    else:
-        header_ext = ".h"
-        source_ext = ".c"
+    header_ext, source_ext = extensions( cpp )
 
     base_name = os.path.basename(os.path.normpath( name ))
 
     header_full_path = ""
     source_full_path = ""
 
-    if pathlib.Path( "src" ).is_dir():
+    if os.path.isdir( "src" ):
         header_full_path = "src/" + name + header_ext
         source_full_path = "src/" + name + source_ext
     else:
         header_full_path = name + header_ext
         source_full_path = name + source_ext
 
-    desc = ""
-    if not(no_info):
-        today = date.today()
-        desc += "/**\n"
-        desc += " * Description:  " + description + "\n"
-        desc += " * Author:       Alicia Amarilla (smushyaa@gmail.com)\n"
-        desc += " * File Created: " + today.strftime( "%B %d, %Y" ) + "\n"
-        desc += "*/\n"
-
+    profiler.mark( "render" )
+    context = make_context( name, description, no_info )
 
+    profiler.mark( "write" )
     if not(no_header):
-        if not(overwrite) and pathlib.Path( header_full_path ).is_file():
+        if not(overwrite) and os.path.isfile( header_full_path ):
             print_err( "error: cannot create header file, file already exists" )
             print_err( "use -o or --overwrite to overwrite existing file" )
         else:
             try:
                 with open( header_full_path, "w+", newline='\n' ) as write_file:
-                    if not(no_info):
-                        write_file.write( desc )
-                    if header_guard == "":
-                        if not( no_pragma ):
-                            write_file.write( "#pragma once" )
-                    else:
-                        write_file.write( "#if !defined(" + header_guard + ")\n" )
-                        write_file.write( "#define " + header_guard + " 1\n" )
-                        write_file.write( "#endif\n" )
+                    write_file.write( render_header( context, header_guard, no_pragma ) )
             except OSError as err:
                 print_fatal( str(err) )
 
             print_status( "created header file \"" + header_full_path + "\"" )
 
     if not(no_source):
-        if not(overwrite) and pathlib.Path( source_full_path ).is_file():
+        if not(overwrite) and os.path.isfile( source_full_path ):
             print_err( "error: cannot create source file, already exists" )
             print_err( "use -o or --overwrite to overwrite existing file" )
         else:
             try:
                 with open( source_full_path, "w+", newline='\n' ) as write_file:
-                    if not(no_info):
-                        write_file.write( desc )
+                    include = ""
                     if not(no_include) and not(no_header):
-                        write_file.write( "#include \"" + base_name + header_ext + "\"" )
+                        include = base_name + header_ext
+                    write_file.write( render_source( context, include ) )
             except OSError as err:
                 print_fatal( str(err) )
 
             print_status( "created source file \"" + source_full_path + "\"" )
 
     sys.exit(0)
+
+if __name__ == "__main__":
+    main( sys.argv[1:] )
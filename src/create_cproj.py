@@ -4,55 +4,35 @@
 
 import sys
 import os
-import glob
-import pathlib
-import termcolor
-import getopt
-from datetime import date
-
-today = date.today()
-
-comment_author = "Alicia Amarilla ( smushyaa@gmail.com )"
-comment_date   = today.strftime( "%B %d, %Y" )
-comment_info0  = "    * Description:  \n"
-comment_info1  = "    * Author:       " + comment_author + "\n"
-comment_info2  = "    * File Created: " + comment_date + "\n"
-
-comment_info = "/**\n" + comment_info0 + comment_info1 + comment_info2 + "*/\n"
-
-def print_cyan( msg:str ):
-    print( termcolor.colored( msg, "cyan" ) )
-
-def print_status( msg:str ):
-    print( termcolor.colored( msg, "green" ) )
-
-def print_err( msg:str ):
-    print( termcolor.colored( msg, "red" ) )
-
-def print_fatal( msg:str ):
-    print_err( msg )
-    print_err( "run with -h or --help to get a list of valid options" )
-    sys.exit(-1)
-
-def create_default_compile_flags( is_cpp, version, is_silent ):
+import profiler
+import templates
+from common import print_status, print_err, print_fatal, print_help, import_getopt
+
+def project_context( project_name, is_cpp, version, cflags, makeflags ) -> dict:
+    # fields available to every cproj template
+    context = {
+        "name": project_name, "version": version, "description": "",
+        "compiler": "g++", "pch_ext": ".hpp",
+        "cflags": "", "makeflags": "",
+    }
+    if not(is_cpp):
+        context["compiler"] = "gcc"
+        context["pch_ext"]  = ".h"
+    for cflag in cflags:
+        context["cflags"] += str(cflag) + "\n"
+    for flag in makeflags:
+        context["makeflags"] += " " + flag
+    return context
+
+def create_default_compile_flags( is_cpp, version, cflags, is_silent ):
     cflags_path = "compile_flags.txt"
-    if pathlib.Path( cflags_path ).is_file():
+    if os.path.isfile( cflags_path ):
         if not(is_silent):
             print_err( "file \"" + cflags_path + "\" already exists" )
     else:
         file = open( cflags_path, "w+", newline='\n' )
-        if is_cpp:
-            file.write( "g++\n" )
-        else:
-            file.write( "gcc\n" )
-
-        file.write( "-std=" + version + "\n" )
-        file.write( "-I./src\n" )
-        file.write( "-D_CLANGD=1\n" )
-
-        for cflag in cflags:
-            file.write(str(cflag) + "\n")
-
+        context = project_context( "project", is_cpp, version, cflags, [] )
+        file.write( templates.render( "cproj_compile_flags", **context ) )
         file.close()
         if not( is_silent ):
             print_status( "created file \"" + cflags_path + "\"" )
@@ -61,7 +41,7 @@ def rename_proj( new_name, is_silent ):
     success = True
 
     launch_path = "./.vscode/launch.json"
-    if pathlib.Path( launch_path ).is_file():
+    if os.path.isfile( launch_path ):
         launch_lines = []
         with open( launch_path, "r" ) as read_file:
             launch_lines = read_file.readlines()
@@ -88,7 +68,7 @@ def rename_proj( new_name, is_silent ):
             print_err( "failed to edit launch.json in vscode directory, could not find it" )
 
     makefile_path = "./Makefile"
-    if pathlib.Path( makefile_path ).is_file():
+    if os.path.isfile( makefile_path ):
         makefile_lines = []
         with open( makefile_path, "r" ) as read_file:
             makefile_lines = read_file.readlines()
@@ -130,7 +110,7 @@ def create_src_dir( directories, is_silent ):
                 print_status( "created dir \"" + dir + "\"" )
 
     makefile_path = "./Makefile"
-    if pathlib.Path( makefile_path ).is_file():
+    if os.path.isfile( makefile_path ):
         makefile_lines = []
         with open( makefile_path, "r" ) as read_file:
             makefile_lines = read_file.readlines()
@@ -162,7 +142,7 @@ def cflag_exists( lines, flag_to_find ) -> bool:
 
 def add_cflags( cflags, is_silent ):
     cflags_path = "compile_flags.txt"
-    if pathlib.Path( cflags_path ).is_file():
+    if os.path.isfile( cflags_path ):
         cflag_lines = []
         with open( cflags_path, "r" ) as read_file:
             cflag_lines = read_file.readlines()
@@ -182,7 +162,7 @@ def add_cflags( cflags, is_silent ):
 
 def add_makeflags( makeflags, is_silent ):
     makefile_path = "./Makefile"
-    if pathlib.Path( makefile_path ).is_file():
+    if os.path.isfile( makefile_path ):
         makefile_lines = []
         with open( makefile_path, "r" ) as read_file:
             makefile_lines = read_file.readlines()
@@ -215,12 +195,32 @@ def add_makeflags( makeflags, is_silent ):
         if not( is_silent ):
             print_err( "failed to add makeflags, no Makefile present!" )
 
+def init_files( is_cpp:bool ) -> list:
+    # ( path relative to the project, template ) of every file init can create
+    ext = ".cpp" if is_cpp else ".c"
+    pch_ext = ".hpp" if is_cpp else ".h"
+    return [
+        ( "src/main" + ext, "cproj_main" ),
+        ( "src/pch" + pch_ext, "cproj_pch" ),
+        ( ".gitignore", "cproj_gitignore" ),
+        ( "README.md", "cproj_readme" ),
+        ( "TODO.md", "cproj_todo" ),
+        ( ".vscode/launch.json", "cproj_launch" ),
+        ( "compile_flags.txt", "cproj_compile_flags" ),
+        ( "Makefile", "cproj_makefile" ),
+    ]
+
 def init( project_name, is_cpp, version, cflags, makeflags, directories, create_readme, create_todo, is_silent, is_verbose ):
+    import common
+    import skeleton
+
     status_message = ""
+    context = project_context( project_name, is_cpp, version, cflags, makeflags )
 
     main_dir = "."
 
     # create subdirectories
+    profiler.mark( "dirs" )
 
     for dir in directories:
         subdir = main_dir + "/" + dir
@@ -230,247 +230,64 @@ def init( project_name, is_cpp, version, cflags, makeflags, directories, create_
         else:
             os.makedirs( subdir )
             status_message += "created dir \"" + subdir + "\"\n"
-    
-    # create main.c/cpp
-
-    main_path = "main"
-    if is_cpp:
-        main_path += ".cpp"
-    else:
-        main_path += ".c"
-
-    main_path = main_dir + "/src/" + main_path
-
-    if pathlib.Path(main_path).is_file():
-        if is_verbose and not(is_silent):
-            print_err( "file \"" + main_path + "\" already exists" )
-    else:
-        file = open( main_path, "w+", newline='\n' )
-        file.write( comment_info )
-        file.write( "\nint main( int argc, char* argv[] ) {\n    return 0;\n}\n" )
-        file.close()
-        status_message += "created file \"" + main_path + "\"\n"
-
-    # create pch
-    pch_path = "pch"
-    if is_cpp:
-        pch_path += ".hpp"
-    else:
-        pch_path += ".h"
 
-    pch_path = main_dir + "/src/" + pch_path
-
-    if pathlib.Path(pch_path).is_file():
-        if is_verbose and not(is_silent):
-            print_err( "file \"" + pch_path + "\" already exists" )
-    else:
-        file = open( pch_path, "w+", newline='\n' )
-        file.write( comment_info )
-        file.close()
-        status_message += "created file \"" + pch_path + "\"\n"
-
-    # create .gitignore
-
-    gitignore_path = main_dir + "/.gitignore"
-
-    if pathlib.Path( gitignore_path ).is_file():
-        if is_verbose and not(is_silent):
-            print_err( "file \"" + gitignore_path + "\" already exists" )
-    else:
-        file = open( gitignore_path, "w+", newline='\n' )
-        file.write( "build\n.vscode\ncompile_flags.txt\n*.d\n*.o\n*.gch" )
-        file.close()
-        status_message += "created file \"" + gitignore_path + "\"\n"
-
-    # create README and TODO
-
-    if create_readme:
-        readme_path = main_dir + "/README.md"
-        if pathlib.Path( readme_path ).is_file():
+    # files are copied from a cached skeleton, see skeleton.py
+    profiler.mark( "files" )
+
+    files = init_files( is_cpp )
+    paths = []
+    for path, template in files:
+        if path == "README.md" and not( create_readme ):
+            continue
+        if path == "TODO.md" and not( create_todo ):
+            continue
+        full_path = main_dir + "/" + path
+        if os.path.isfile( full_path ):
             if is_verbose and not(is_silent):
-                print_err( "file \"" + readme_path + "\" already exists" )
+                print_err( "file \"" + full_path + "\" already exists" )
         else:
-            file = open( readme_path, "w+", newline='\n' )
-            file.write( "# " + project_name + "\n" )
-            file.close()
-            status_message += "created file \"" + readme_path + "\"\n"
-
-    if create_todo:
-        todo_path = main_dir + "/TODO.md"
-        if pathlib.Path( todo_path ).is_file():
-            if is_verbose and not(is_silent):
-                print_err( "file \"" + todo_path + "\" already exists" )
-        else:
-            file = open( todo_path, "w+", newline='\n' )
-            file.write( "# " + project_name + " todo list" + "\n\n - [ ] " )
-            file.close()
-            status_message += "created file \"" + todo_path + "\"\n"
+            paths.append( path )
+            status_message += "created file \"" + full_path + "\"\n"
 
-    # create launch.json
-
-    launch_path = main_dir + "/.vscode/launch.json"
-    if pathlib.Path( launch_path ).is_file():
-        if is_verbose and not(is_silent):
-            print_err( "file \"" + launch_path + "\" already exists" )
-    else:
-        file = open( launch_path, "w+", newline='\n' )
-        file.write( "{\n" )
-        file.write( "    \"version\": \"0.2.0\",\n")
-        file.write( "    \"configuarations\": [\n" )
-        file.write( "        {\n" )
-        file.write( "            \"name\": \"(gdb) Launch\",\n" )
-        file.write( "            \"type\": \"cppdbg\",\n" )
-        file.write( "            \"request\": \"launch\",\n" )
-        file.write( "            \"program\": \"${workspaceFolder}/build/debug/" + project_name + ".exe\",\n" )
-        file.write( "            \"args\": [],\n" )
-        file.write( "            \"stopAtEntry\": false,\n" )
-        file.write( "            \"cwd\": \"${workspaceFolder}\",\n" )
-        file.write( "            \"environment\": [],\n" )
-        file.write( "            \"externalConsole\": false,\n" )
-        file.write( "            \"MIMode\": \"gdb\",\n" )
-        file.write( "            \"miDebuggerPath\": \"C:/msys64/mingw64/bin/gdb.exe\",\n" )
-        file.write( "            \"setupCommands\": [\n" )
-        file.write( "                {\n" )
-        file.write( "                    \"description\": \"Enable pretty-printing for gdb\",\n" )
-        file.write( "                    \"text\": \"-enable-pretty-printing\",\n" )
-        file.write( "                    \"ignoreFailures\": true\n" )
-        file.write( "                }\n" )
-        file.write( "            ]\n" )
-        file.write( "        }\n" )
-        file.write( "    ]\n" )
-        file.write( "}" )
-        file.close()
-        status_message += "created file \"" + launch_path + "\"\n"
-
-    # create compile_flags.txt
-
-    cflags_path = main_dir + "/compile_flags.txt"
-    if pathlib.Path( cflags_path ).is_file():
-        if is_verbose and not(is_silent):
-            print_err( "file \"" + cflags_path + "\" already exists" )
-    else:
-        file = open( cflags_path, "w+", newline='\n' )
-        if is_cpp:
-            file.write( "g++\n" )
-        else:
-            file.write( "gcc\n" )
-
-        file.write( "-std=" + version + "\n" )
-        file.write( "-I./src\n" )
-        file.write( "-D_CLANGD=1\n" )
-
-        for cflag in cflags:
-            file.write(str(cflag) + "\n")
-
-        file.close()
-        status_message += "created file \"" + cflags_path + "\"\n"
-
-    # create makefile
-
-    makefile_path = main_dir + "/Makefile"
-    if pathlib.Path( makefile_path ).is_file():
-        if is_verbose and not(is_silent):
-            print_err( "file \"" + makefile_path + "\" already exists" )
-    else:
-        file = open( makefile_path, "w+", newline='\n' )
-        file.write( "# Desired compiler and C/C++ version\n" )
-        cc = "CC = "
-        if is_cpp:
-            cc += "g++"
-        else:
-            cc += "gcc"
-        cc += " -std=" + version + "\n"
-        file.write( cc )
-
-        file.write( "# change between DEBUG/RELEASE\n\n" )
-        file.write( "# RELEASE BUILD\n" )
-        file.write( "# CFLAGS = $(RELEASE)\n" )
-        file.write( "# LNKFLAGS = --static -mwindows\n" )
-        file.write( "# TARGETDIR = ./build/release\n\n" )
-
-        file.write( "# DEBUG BUILD\n" )
-        file.write( "CFLAGS = $(DEBUG)\n" )
-        file.write( "LNKFLAGS = --static\n" )
-        file.write( "TARGETDIR = ./build/debug\n\n" )
-
-        file.write( "# executable name\n" )
-        file.write( "EXE = " + project_name + ".exe\n\n" )
-
-        file.write( "# source code paths\n" )
-        src_paths = "./src"
+    src_paths = "./src"
+    if "Makefile" in paths:
+        import glob
 
+        profiler.mark( "walk" )
         for dir in glob.iglob( main_dir + '/src/**', recursive=True ):
             if os.path.isdir( dir ):
                 src_dir = str(dir).replace( main_dir + "/src\\", "" )
                 if src_dir != "":
                     src_paths += " ./src/" + src_dir
 
-        file.write( "SRC = " + src_paths + "\n\n" )
-
-        file.write( "# defines\n" )
-        makeflags_string = ""
-        for flag in makeflags:
-            makeflags_string += " " + flag
-        file.write( "DEF =" + makeflags_string + "\n\n" )
-
-        file.write( "# pre-compiled header\n" )
-        file.write( "PCH = ./src/pch\n\n" )
-
-        file.write( "# linker flags\n" )
-        file.write( "LNK = -static-libstdc++ -static-libgcc -lmingw32\n\n" )
-
-        file.write( "# DO NOT EDIT BEYOND THIS POINT!!! ======================================\n\n" )
-        
-        file.write( "DEBUG   = $(DFLAGS) $(foreach D, $(INC), -I$(D)) $(DEPFLAGS)\n" )
-        file.write( "RELEASE = $(RFLAGS) $(foreach D, $(INC), -I$(D)) $(DEPFLAGS)\n\n" )
-
-        file.write( "BINARY = $(TARGETDIR)/($EXE)\n\n" )
-
-        file.write( "WARN     = -Wall -Wextra\n" )
-        file.write( "DFLAGS   = $(WARN) $(DEF) -O0 -g -D DEBUG -march=native\n" )
-        file.write( "RFLAGS   = $(DEF) -O2 -march=native\n" )
-        file.write( "DEPFLAGS = -MP -MD\n" )
-        file.write( "INC      = ./src\n\n" )
-
-        file.write( "CPP  = $(foreach D, $(SRC), $(wildcard $(D)/*.cpp))\n" )
-        file.write( "C    = $(foreach D, $(SRC), $(wildcard $(D)/*.c))\n" )
-        file.write( "OBJ  = $(patsubst %.c,%.o, $(C)) $(patsubst %.cpp,%.o, $(CPP))\n" )
-        file.write( "DEPS = $(patsubst %.c,%.d, $(C)) $(patsubst %.cpp,%.d, $(CPP))\n\n" )
-
-        file.write( "PCH_TARG = $(PCH).gch\n\n" )
-
-        file.write( "all: $(PCH_TARG) $(BINARY)\n\n" )
-
-        file.write( "run: all\n\t$(BINARY)\n\n" )
-
-        file.write( "-include $(DEPS)\n" )
-        file.write( "$(BINARY): $(OBJ)\n" )
-        file.write( "\t$(CC) -o $@ $(LIB) $^ $(LNK) $(LNKFLAGS)\n\n" )
-
-        file.write( "%.o: %.c\n" )
-        file.write( "\t$(CC) $(CFLAGS) -c -o $@ $<\n\n" )
-
-        file.write( "%.o: %.cpp\n" )
-        file.write( "\t$(CC) $(CFLAGS) -c -o $@ $<\n\n" )
-
-        pch_ext = ".hpp"
-        if not(is_cpp):
-            pch_ext = ".h"
-
-        file.write( "$(PCH_TARG): $(PCH)" + pch_ext + "\n" )
-        file.write( "\t$(CC) $(CFLAGS) $(PCH)" + pch_ext + " -o $(PCH_TARG)\n\n" )
-
-        file.write( "clean:\n\trm *.d, *.o, *.gch -r\n\n" )
-
-        file.write( ".PHONY: all clean run\n" )
-
-        file.close()
-        status_message += "created file \"" + makefile_path + "\"\n"
+    profiler.mark( "files" )
+    today = common.today_string()
+    skeleton.create(
+        [ is_cpp, version, cflags, makeflags ], files, context, main_dir, paths,
+        { "name": project_name, "date": today, "year": today[-4:], "src": src_paths }
+    )
 
     if not(is_silent):
         print_status( status_message )
     sys.exit(0)
 
+def init_directories( directories:list ) -> list:
+    # directories every new project gets around the requested source directories
+    return [ "src" ] + directories + [ "build", "build/debug", "build/release", "bin", ".vscode" ]
+
+def resolve_version( input_version:str, is_cpp:bool ) -> str:
+    if input_version == "":
+        return cpp_default_version if is_cpp else c_default_version
+
+    input_version = input_version.lower()
+    if is_cpp:
+        if not( input_version in valid_cpp_versions ):
+            print_fatal("\"" + input_version + "\" is not a valid version of C++!")
+    else:
+        if not( input_version in valid_c_versions ):
+            print_fatal("\"" + input_version + "\" is not a valid version of C!")
+    return input_version
+
 # directory structure:
 # 
 # src
@@ -487,45 +304,61 @@ def init( project_name, is_cpp, version, cflags, makeflags, directories, create_
 # README.md
 # TODO.md
 
-short_options = "hcsqvd:f:"
+short_options = "hcsqvd:f:j:"
 long_options  = [
     "help", "dir=", "flag=", "cflag=", "makeflag=",
     "init=", "silent", "quiet", "version=", "rename=",
-    "no_readme", "no_todo", "compile_flags", "verbose"
+    "no_readme", "no_todo", "compile_flags", "verbose",
+    "workspace=", "jobs=", "watch", "poll"
 ]
 valid_cpp_versions = [ "c++20", "c++17", "c++11" ]
 valid_c_versions = [ "c89", "c99", "c11" ]
 
-def print_help():
-    print_cyan( "cproj: manage simple C/C++ project" )
-    print_cyan( " --init [string]: create new project with given name in current directory" )
-    print_cyan( "                  will name project \"project\" if no name is provided" )
+c_default_version   = "c99"
+cpp_default_version = "c++20"
+
+def display_help():
+    print_help( "cproj: manage simple C/C++ project" )
+    print_help( " --init [string]: create new project with given name in current directory" )
+    print_help( "                  will name project \"project\" if no name is provided" )
     
-    print_cyan( "\noptions only when initializing:" )
-    print_cyan( " -c          [switch] [default=false]:     initialize project as C instead of C++. REQUIRES --init" )
-    print_cyan( " --version   [string] [default=C++20/C99]: set C/C++ version. REQUIRES --init. VALID = [c++20, c++17, c++11, c89, c99, c11]" )
-    print_cyan( " --no_readme [switch] [default=false]:     don't create readme. REQUIRES --init." )
-    print_cyan( " --no_todo   [switch] [default=false]:     don't create todo. REQUIRES --init." )
+    print_help( "\noptions only when initializing:" )
+    print_help( " -c          [switch] [default=false]:     initialize project as C instead of C++. REQUIRES --init" )
+    print_help( " --version   [string] [default=C++20/C99]: set C/C++ version. REQUIRES --init. VALID = [c++20, c++17, c++11, c89, c99, c11]" )
+    print_help( " --no_readme [switch] [default=false]:     don't create readme. REQUIRES --init." )
+    print_help( " --no_todo   [switch] [default=false]:     don't create todo. REQUIRES --init." )
     
-    print_cyan( "\noptions when initializing or in existing project:" )
-    print_cyan( " -d, --dir  [string]: create new directory in current project, adds directory to Makefile" )
-    print_cyan( " -f, --flag [string]: add new compiler flag to compile_flags.txt and Makefile" )
-    print_cyan( " --cflag    [string]: add new compiler flag only to compile_flags.txt" )
-    print_cyan( " --makeflag [string]: add new compiler flag only to Makefile" )
-
-    print_cyan( "\noptions only in existing project:" )
-    print_cyan( " --rename        [string]: rename project" )
-    print_cyan( " --compile_flags [switch]: create default compile_flags.txt if it doesn't already exist" )
-    print_cyan( "           NOTE: can also take -c and -v/--version to define compiler options if --compile_flags is the first argument" )
-
-    print_cyan( "\nmiscellaneous options:" )
-    print_cyan( " -s, -q, --silent, --quiet [switch] [default=false]: don't print status" )
-    print_cyan( " -v, --verbose             [switch] [default=false]: print extra error messages" )
-    print_cyan( "\n -h, --help: print this help message and exit" )
+    print_help( "\noptions when initializing or in existing project:" )
+    print_help( " -d, --dir  [string]: create new directory in current project, adds directory to Makefile" )
+    print_help( " -f, --flag [string]: add new compiler flag to compile_flags.txt and Makefile" )
+    print_help( " --cflag    [string]: add new compiler flag only to compile_flags.txt" )
+    print_help( " --makeflag [string]: add new compiler flag only to Makefile" )
+
+    print_help( "\noptions only in existing project:" )
+    print_help( " --rename        [string]: rename project" )
+    print_help( " --watch         [switch]: keep the Makefile SRC line and compile_commands.json (when present) in sync" )
+    print_help( "                           with the directories and source files below src until interrupted" )
+    print_help( " --poll          [switch]: check for changes every second instead of using inotify. REQUIRES --watch" )
+    print_help( " --compile_flags [switch]: create default compile_flags.txt if it doesn't already exist" )
+    print_help( "           NOTE: can also take -c and -v/--version to define compiler options if --compile_flags is the first argument" )
+
+    print_help( "\nworkspace options:" )
+    print_help( " --workspace [string]: init or edit every project listed in a workspace manifest (.json or .toml) in parallel" )
+    print_help( "                       and write a top-level Makefile that builds all of them, see cproj_workspace.py for the format" )
+    print_help( "                       -d, -f, --cflag and --makeflag are applied to every project" )
+    print_help( " -j, --jobs  [int] [default=cpu count]: worker processes for --workspace" )
+
+    print_help( "\nmiscellaneous options:" )
+    print_help( " -s, -q, --silent, --quiet [switch] [default=false]: don't print status" )
+    print_help( " -v, --verbose             [switch] [default=false]: print extra error messages" )
+    for line in profiler.help_lines:
+        print_help( line )
+    print_help( "\n -h, --help: print this help message and exit" )
     sys.exit(0)
 
-if __name__ == "__main__":
-    arg_list = sys.argv[1:]
+def main( arg_list:list ):
+    arg_list = profiler.setup( arg_list )
+    getopt   = import_getopt()
 
     for i, opt in enumerate( arg_list ):
         if opt == "--init":
@@ -538,7 +371,7 @@ if __name__ == "__main__":
     try:
         args, values = getopt.getopt( arg_list, short_options, long_options )
     except getopt.error as err:
-        print_fatal( "error: " + str(err) )
+        print_fatal( str(err) )
 
     project_name = "project"
     is_cpp       = True
@@ -553,14 +386,16 @@ if __name__ == "__main__":
     create_compile_flags = False
     silent  = False
     verbose = False
+    workspace_path = ""
+    jobs = os.cpu_count() or 1
+    watch = False
+    poll  = False
 
-    c_default_version = "c99"
-    cpp_default_version = "c++20"
     input_version = ""
 
     for current_arg, current_value in args:
         if current_arg in ( "-h", "--help" ):
-            print_help()
+            display_help()
         if current_arg == "--init":
             is_init = True
             if current_value != "":
@@ -617,27 +452,33 @@ if __name__ == "__main__":
                 create_todo = False
         if current_arg in ( "-v", "--verbose" ):
             verbose = True
+        if current_arg == "--workspace":
+            workspace_path = current_value
+        if current_arg == "--watch":
+            watch = True
+        if current_arg == "--poll":
+            poll = True
+        if current_arg in ( "-j", "--jobs" ):
+            try:
+                jobs = int( current_value )
+            except ValueError:
+                print_fatal( "-j/--jobs must be a number!" )
 
     if verbose and silent:
         print_fatal( "verbose and silent cannot be enabled simultaneously!" )
 
-    if input_version != "":
-        input_version = input_version.lower()
-        if is_cpp:
-            if input_version in valid_cpp_versions:
-                version = input_version
-            else:
-                print_fatal("\"" + input_version + "\" is not a valid version of C++!")
-        else:
-            if input_version in valid_c_versions:
-                version = input_version
-            else:
-                print_fatal("\"" + input_version + "\" is not a valid version of C!")
-    else:
-        if is_cpp:
-            version = cpp_default_version
-        else:
-            version = c_default_version
+    if poll and not( watch ):
+        print_fatal( "--poll requires --watch!" )
+    if watch and ( is_init or create_compile_flags ):
+        print_fatal( "--watch cannot be combined with --init or --compile_flags!" )
+
+    if workspace_path != "":
+        if is_init or rename != "" or create_compile_flags or watch:
+            print_fatal( "--workspace cannot be combined with --init, --rename, --compile_flags or --watch!" )
+        import cproj_workspace
+        cproj_workspace.run( workspace_path, directories, cflags, makeflags, jobs, silent, verbose )
+
+    version = resolve_version( input_version, is_cpp )
 
     if is_init:
 
@@ -655,12 +496,7 @@ if __name__ == "__main__":
             status_message += "C"
         status_message += " version: " + version + ".\n"
 
-        directories.insert( 0, "src" )
-        directories.append( "build" )
-        directories.append( "build/debug" )
-        directories.append( "build/release" )
-        directories.append( "bin" )
-        directories.append( ".vscode" )
+        directories = init_directories( directories )
 
         if not(silent):
             print_status( status_message )
@@ -673,19 +509,31 @@ if __name__ == "__main__":
         )
     else:
         if rename != "":
+            profiler.mark( "rename" )
             rename_proj( rename, silent )
 
         if create_compile_flags:
-            create_default_compile_flags( is_cpp, version, silent )
+            profiler.mark( "cflags" )
+            create_default_compile_flags( is_cpp, version, cflags, silent )
             sys.exit(0)
 
         if len( directories ) != 0:
+            profiler.mark( "dirs" )
             create_src_dir( directories, silent )
 
         if len( cflags ) != 0:
+            profiler.mark( "cflags" )
             add_cflags( cflags, silent )
 
         if len( makeflags ) != 0:
+            profiler.mark( "makeflags" )
             add_makeflags( makeflags, silent )
 
-    sys.exit(0)
\ No newline at end of file
+        if watch:
+            import cproj_watch
+            cproj_watch.run( poll, silent, verbose )
+
+    sys.exit(0)
+
+if __name__ == "__main__":
+    main( sys.argv[1:] )
@@ -4,56 +4,375 @@
 
 import sys
 import os
-import getopt
-import pathlib
-from datetime import date
-import termcolor
-
-silent = False
-
-def print_status( msg:str ):
-    if not(silent):
-        print( termcolor.colored( msg, "green" ) )
-
-def print_err( msg:str ):
-    print( termcolor.colored( msg, "red" ) )
-
-def print_fatal( msg:str ):
-    print_err( "error: " + msg )
-    print_err( "run with -h or --help to get a list of valid options" )
-    sys.exit(-1)
-
-def print_help( msg:str ):
-    print( termcolor.colored( msg, "cyan" ) )
+import profiler
+import common
+import templates
+from common import print_status, print_err, print_fatal, print_help
 
 def display_help():
     print_help( "glnew: create new GLSL shader source files" )
     print_help( " -n, --name, string [string] [required] [position = 1]: set name of shader files. include parent directories if necessary" )
     print_help( " --vertex           [switch]: only create vertex file. error if --fragment is also defined" )
     print_help( " --fragment         [switch]: only create fragment file. error if --vertex is also defined" )
+    print_help( " --compute          [switch]: create a compute shader and <name>_dispatch.h with a C dispatch helper instead" )
+    print_help( " --local_size       [string]: X[,Y[,Z]] workgroup size for --compute, overrides the workgroup table" )
+    print_help( " --workgroup        [string]: entry of the workgroup table to take the --compute workgroup size from" )
+    print_help( " --workgroup_table  [string]: .json or .toml table of name = [ x, y, z ] workgroup sizes" )
+    print_help( "                    default = first of ./.scaffold/workgroups.{json,toml} and the config dir, \"default\" entry or 64,1,1" )
+    print_help( " --buffer           [string]: name or name:type shader storage buffer for --compute, can be repeated" )
+    print_help( "                    bindings count up from --binding" )
+    print_help( " --shared           [switch]: add a shared memory array with one element per invocation to --compute" )
+    print_help( " --barrier          [string]: how the --compute results are used next, comma separated, can be repeated. default = storage" )
+    print_help( "                    storage, vertex, index, uniform, command, image, texture, update or all" )
     print_help( " --no_info          [switch]: don't write info" )
     print_help( " -v, --version      [string]: change GLSL version. default = 460 core" )
     print_help( " -d, --description  [string]: description at the top of files. error if --no_info is also defined" )
     print_help( " -o, --overwrite    [switch]: will overwrite files if they already exist" )
+    print_help( " -m, --manifest     [string]: create every shader listed in manifest (.json, .toml or one name per line, - for stdin)" )
+    print_help( "                    entries may override description, version, vertex, fragment and no_info" )
+    print_help( " --flatten          [string]: resolve #include in every shader under given directory and write the results to --output_dir" )
+    print_help( "                    only shaders whose source or includes changed since the last run are processed again, -o processes all" )
+    print_help( " --bundle           [string]: pack every shader under given directory into <output_dir>/<bundle_name>.bin" )
+    print_help( "                    and write a C header with offsets, lengths and hashes to <output_dir>/<bundle_name>.h" )
+    print_help( " --bundle_name      [string]: name of bundle files and prefix of C identifiers. default = shaders" )
+    print_help( " --permute          [string]: write every permutation of the shaders in given spec (.json or .toml) to --output_dir," )
+    print_help( "                    permutations with identical preprocessed source share one variant file" )
+    print_help( "                    and <output_dir>/<spec name>.h maps permutation masks to variant ids" )
+    print_help( " --block            [string] [fields]: create <name>.glsl with a uniform or storage block and <name>.h with a C struct" )
+    print_help( "                    of identical layout, fields follow the options as name:type or name:type[count]" )
+    print_help( " --layout           [string]: std140 or std430 layout for --block. default = std140, std430 with --storage" )
+    print_help( " --storage          [switch]: --block is a shader storage block instead of a uniform block" )
+    print_help( " --binding          [int]:    binding of --block or first --buffer binding of --compute. default = 0" )
+    print_help( " --hot_reload       [string]: create a C module <name>.h and <name>.c that watches a shader directory (inotify on linux," )
+    print_help( "                    polling elsewhere) and rebuilds changed programs on the render thread, keeping the last good program on error" )
+    print_help( " --gpu_timer        [string]: create a C module <name>.h and <name>.c timing passes with a ring of GL_TIME_ELAPSED queries" )
+    print_help( "                    read back --latency frames later without stalling, exported as csv or trace json" )
+    print_help( " --pass             [string]: pass known to --gpu_timer at compile time, can be repeated" )
+    print_help( " --latency          [int]:    frames in flight before --gpu_timer reads a query back. default = 3" )
+    print_help( " --gl_header        [string]: OpenGL header or loader included by --gpu_timer. default = <glad/glad.h>" )
+    print_help( " -g, --header_guard [string]: header guard for --bundle, --permute, --block, --compute, --hot_reload and --gpu_timer headers" )
+    print_help( "                    instead of pragma once" )
+    print_help( " --check            [string]: validate every shader under given directory in parallel, results are cached by content hash" )
+    print_help( " --validator        [string]: validator command for --check, {input}, {output} and {stage} are replaced" )
+    print_help( "                    default = $GLNEW_VALIDATOR or \"glslangValidator -G -S {stage} -o {output} {input}\"" )
+    print_help( " --define           [string]: NAME or NAME=VALUE define added after #version for --check, can be repeated" )
+    print_help( " -j, --jobs         [int]:    worker processes for --check. default = cpu count" )
+    print_help( " --output_dir       [string]: output directory for --flatten, --bundle, --check and --permute. default = build/shaders" )
     print_help( " -s, -q, --silent, --quiet [switch]: don't print status" )
+    for line in profiler.help_lines:
+        print_help( line )
     print_help( "\n -h, --help      [switch]: print this help message and quit" )
     sys.exit(0)
 
-short_options = "n:d:v:ohsq"
+short_options = "n:d:v:m:g:j:ohsq"
 long_options  = [
     "name=", "overwrite",
     "help", "vertex", "fragment",
     "no_info", "description", "version",
-    "silent", "quiet"
+    "silent", "quiet", "manifest=",
+    "flatten=", "output_dir=", "bundle=", "bundle_name=",
+    "header_guard=", "check=", "validator=",
+    "define=", "jobs=", "permute=", "block=",
+    "layout=", "storage", "binding=", "compute",
+    "local_size=", "workgroup=", "workgroup_table=",
+    "buffer=", "shared", "barrier=", "hot_reload=",
+    "gpu_timer=", "pass=", "latency=", "gl_header="
 ]
 
-if __name__ == "__main__":
-    arg_list = sys.argv[1:]
+vertex_ext   = ".vs"
+fragment_ext = ".fs"
+compute_ext  = ".cs"
+
+def make_context( name:str, description:str, version:str, no_info:bool ) -> dict:
+    context = { "name": name, "description": description, "version": version, "info": "" }
+    if not( no_info ):
+        context["info"] = templates.render( "c_info", **context )
+    return context
+
+def render_vertex( context:dict ) -> str:
+    return templates.render( "glsl_vertex", **context )
+
+def render_fragment( context:dict ) -> str:
+    return templates.render( "glsl_fragment", **context )
+
+def create_from_manifest( manifest_path:str, defaults:dict, overwrite:bool ):
+    import manifest
+
+    profiler.mark( "manifest" )
+    try:
+        entries = manifest.load_manifest( manifest_path )
+    except manifest.ManifestError as err:
+        print_fatal( str(err) )
+
+    profiler.mark( "render" )
+    files = []
+    for entry in entries:
+        opts = dict( defaults )
+        opts.update( entry )
+        name = opts["name"]
+
+        if opts["no_info"] and opts["description"] != "":
+            print_fatal( "\"" + name + "\": no_info and description cannot be defined simultaneously!" )
+        if opts["vertex"] and opts["fragment"]:
+            print_fatal( "\"" + name + "\": vertex and fragment cannot be defined simultaneously!" )
+
+        context = make_context( name, opts["description"], opts["version"], opts["no_info"] )
+
+        if not( opts["fragment"] ):
+            files.append( ( name + vertex_ext, render_vertex( context ) ) )
+        if not( opts["vertex"] ):
+            files.append( ( name + fragment_ext, render_fragment( context ) ) )
+
+    profiler.mark( "write" )
+    created, skipped, failed = manifest.write_files( files, overwrite )
+    for path, err in failed:
+        print_err( "error: cannot create \"" + path + "\": " + err )
+    print_status( manifest.summary( created, skipped, failed ) )
+
+    if len( failed ) != 0:
+        sys.exit(-1)
+    sys.exit(0)
+
+def flatten( root:str, output_dir:str, overwrite:bool ):
+    import glsl_flatten
+
+    if not( os.path.isdir( root ) ):
+        print_fatal( "\"" + root + "\" is not a directory!" )
+
+    profiler.mark( "flatten" )
+    flattened, unchanged, failed = glsl_flatten.flatten_tree( root, output_dir, overwrite )
+    for path, err in failed:
+        print_err( "error: " + path + ": " + err )
+    print_status(
+        "flattened " + str(len( flattened )) + " shaders into \"" + output_dir + "\", " +
+        str(len( unchanged )) + " unchanged, " + str(len( failed )) + " failed"
+    )
+
+    if len( failed ) != 0:
+        sys.exit(-1)
+    sys.exit(0)
+
+def header_context( name:str, description:str, no_info:bool, header_guard:str ) -> dict:
+    if no_info and description != "":
+        print_fatal( "--no_info and -d/--description cannot be defined simultaneously!" )
+
+    return common.guard_context( make_context( name, description, "", no_info ), header_guard )
+
+def bundle( root:str, output_dir:str, bundle_name:str, description:str, no_info:bool, header_guard:str ):
+    import glsl_bundle
+
+    if not( os.path.isdir( root ) ):
+        print_fatal( "\"" + root + "\" is not a directory!" )
+
+    profiler.mark( "bundle" )
+    context = header_context( bundle_name, description, no_info, header_guard )
+
+    try:
+        bundle_path, header_path, count = glsl_bundle.bundle_tree( root, output_dir, bundle_name, context )
+    except ( glsl_bundle.BundleError, OSError ) as err:
+        print_fatal( str(err) )
+
+    print_status( "bundled " + str(count) + " shaders into \"" + bundle_path + "\" and \"" + header_path + "\"" )
+    sys.exit(0)
+
+def permute( spec_path:str, output_dir:str, description:str, no_info:bool, header_guard:str ):
+    import glsl_permute
+
+    profiler.mark( "permute" )
+    spec_name = os.path.splitext( os.path.basename( spec_path ) )[0]
+    context   = header_context( spec_name, description, no_info, header_guard )
+
+    try:
+        header_path, permutations, variants = glsl_permute.permute_spec( spec_path, output_dir, context )
+    except ( glsl_permute.PermuteError, OSError ) as err:
+        print_fatal( str(err) )
+
+    print_status(
+        "wrote " + str(variants) + " variants for " + str(permutations) +
+        " permutations into \"" + output_dir + "\" and \"" + header_path + "\""
+    )
+    sys.exit(0)
+
+def block( name:str, field_specs:list, layout:str, storage:bool, binding:int,
+    description:str, no_info:bool, header_guard:str, overwrite:bool
+):
+    import glsl_block
+
+    block_name = common.module_name( name, "block" )
+    if layout == "":
+        layout = "std430" if storage else "std140"
+    if layout == "std430" and not( storage ):
+        print_fatal( "std430 is only valid for storage blocks, use --storage!" )
+
+    profiler.mark( "layout" )
+    try:
+        fields, size = glsl_block.layout_block( field_specs, layout )
+    except glsl_block.BlockError as err:
+        print_fatal( str(err) )
+
+    profiler.mark( "render" )
+    context = header_context( block_name, description, no_info, header_guard )
+    files = [
+        ( name + ".glsl", glsl_block.render_glsl( block_name, fields, layout, storage, binding, context ) ),
+        ( name + ".h", glsl_block.render_header( block_name, fields, size, layout, context ) ),
+    ]
+
+    profiler.mark( "write" )
+    common.write_outputs( files, overwrite, "block" )
+
+    print_status( block_name + ": " + layout + ", " + str(size) + " bytes" )
+    sys.exit(0)
+
+def compute( name:str, version:str, description:str, no_info:bool, header_guard:str, overwrite:bool,
+    size_arg:str, workgroup:str, table_path:str, buffer_specs:list, binding:int, shared:bool, uses:list
+):
+    import glsl_compute
+
+    if no_info and description != "":
+        print_fatal( "--no_info and -d/--description cannot be defined simultaneously!" )
+
+    profiler.mark( "render" )
+    try:
+        size    = glsl_compute.choose_local_size( size_arg, workgroup, table_path )
+        buffers = [ glsl_compute.parse_buffer( spec, binding + idx ) for idx, spec in enumerate( buffer_specs ) ]
+        shader_context = make_context( name, description, version, no_info )
+        files = [
+            ( name + compute_ext, glsl_compute.render_compute( shader_context, size, buffers, shared ) ),
+            ( name + "_dispatch.h", glsl_compute.render_dispatch(
+                os.path.basename( name ) + compute_ext, size, uses if len( uses ) != 0 else [ "storage" ],
+                header_context( os.path.basename( name ), description, no_info, header_guard )
+            ) ),
+        ]
+    except glsl_compute.ComputeError as err:
+        print_fatal( str(err) )
+
+    profiler.mark( "write" )
+    common.write_outputs( files, overwrite, "compute" )
+
+    sys.exit(0)
+
+def hot_reload( name:str, description:str, no_info:bool, header_guard:str, overwrite:bool ):
+    import glsl_bundle
+
+    module = common.module_name( name )
+
+    profiler.mark( "render" )
+    context = header_context( module, description, no_info, header_guard )
+    context["lower"]   = module.lower()
+    context["upper"]   = glsl_bundle.identifier( module )
+    context["include"] = module + ".h"
+    files = [
+        ( name + ".h", templates.render( "glsl_reload_header", **context ) ),
+        ( name + ".c", templates.render( "glsl_reload_source", **context ) ),
+    ]
+
+    profiler.mark( "write" )
+    common.write_outputs( files, overwrite, "hot reload" )
+
+    sys.exit(0)
+
+def gpu_timer( name:str, passes:list, latency:int, gl_header:str,
+    description:str, no_info:bool, header_guard:str, overwrite:bool
+):
+    import glsl_bundle
+
+    module = common.module_name( name )
+    if latency < 1:
+        print_fatal( "--latency must be at least 1!" )
+    if not( gl_header.startswith( "<" ) or gl_header.startswith( "\"" ) ):
+        gl_header = "\"" + gl_header + "\""
+
+    profiler.mark( "render" )
+    upper   = glsl_bundle.identifier( module )
+    context = header_context( module, description, no_info, header_guard )
+    context["lower"]      = module.lower()
+    context["upper"]      = upper
+    context["include"]    = module + ".h"
+    context["latency"]    = str(latency)
+    context["gl_include"] = gl_header
+    context["passes"]     = ""
+    context["pass_names"] = ""
+    idents = set()
+    for pass_name in passes:
+        ident = upper + "_PASS_" + glsl_bundle.identifier( pass_name )
+        if ident in idents:
+            print_fatal( "pass \"" + pass_name + "\" is defined twice!" )
+        idents.add( ident )
+        context["passes"]     += "    " + ident + ",\n"
+        context["pass_names"] += "    \"" + pass_name.replace( "\\", "_" ).replace( "\"", "_" ) + "\",\n"
+
+    files = [
+        ( name + ".h", templates.render( "glsl_timer_header", **context ) ),
+        ( name + ".c", templates.render( "glsl_timer_source", **context ) ),
+    ]
+
+    profiler.mark( "write" )
+    common.write_outputs( files, overwrite, "gpu timer" )
+
+    sys.exit(0)
+
+def check( root:str, output_dir:str, validator:str, defines:list, jobs:int ):
+    import glsl_check
+
+    if not( os.path.isdir( root ) ):
+        print_fatal( "\"" + root + "\" is not a directory!" )
+    if validator == "":
+        validator = os.environ.get( "GLNEW_VALIDATOR", glsl_check.default_validator )
+
+    profiler.mark( "check" )
+    try:
+        passed, cached, failed = glsl_check.check_tree( root, output_dir, validator, defines, jobs )
+    except ( glsl_check.ValidatorError, OSError ) as err:
+        print_fatal( str(err) )
+
+    for path, log in failed:
+        print_err( "error: " + path + " failed validation" )
+        for line in log.rstrip().splitlines():
+            print_err( "    " + line )
+    print_status(
+        "checked " + str(len( passed ) + len( failed )) + " shaders, " +
+        str(cached) + " cached, " + str(len( failed )) + " failed"
+    )
+
+    if len( failed ) != 0:
+        sys.exit(-1)
+    sys.exit(0)
+
+def main( arg_list:list ):
+    arg_list = profiler.setup( arg_list )
+    getopt   = common.import_getopt()
 
     if len( arg_list ) == 0:
         print_fatal( "arguments required!" )
 
     name = ""
+    manifest_path = ""
+    flatten_root  = ""
+    bundle_root   = ""
+    bundle_name   = "shaders"
+    header_guard  = ""
+    check_root    = ""
+    validator     = ""
+    defines       = []
+    jobs          = os.cpu_count() or 1
+    permute_spec  = ""
+    block_name    = ""
+    is_compute    = False
+    local_size    = ""
+    workgroup     = ""
+    table_path    = ""
+    buffer_specs  = []
+    shared        = False
+    uses          = []
+    reload_name   = ""
+    timer_name    = ""
+    passes        = []
+    latency       = 3
+    gl_header     = "<glad/glad.h>"
+    block_layout  = ""
+    storage       = False
+    binding       = 0
+    output_dir    = "build/shaders"
 
     if not("-" in arg_list[0]):
         name = arg_list[0]
@@ -67,9 +386,9 @@ if __name__ == "__main__":
     version      = "460 core"
 
     try:
-        args, values = getopt.getopt( arg_list, short_options, long_options )
+        args, values = getopt.gnu_getopt( arg_list, short_options, long_options )
     except getopt.error as err:
-        print_fatal( err )
+        print_fatal( str(err) )
 
     for arg, value in args:
         if arg == "-h" or arg == "--help":
@@ -87,9 +406,141 @@ if __name__ == "__main__":
         if arg == "-o" or arg == "--overwrite":
             overwrite = True
         if arg == "-s" or arg == "-q" or arg == "--silent" or arg == "--quiet":
-            silent = True
+            common.silent = True
         if arg == "-d" or arg == "--description":
             description = value
+        if arg == "-m" or arg == "--manifest":
+            manifest_path = value
+        if arg == "--flatten":
+            flatten_root = value
+        if arg == "--output_dir":
+            output_dir = value
+        if arg == "--bundle":
+            bundle_root = value
+        if arg == "--bundle_name":
+            bundle_name = value
+        if arg == "-g" or arg == "--header_guard":
+            header_guard = value
+        if arg == "--check":
+            check_root = value
+        if arg == "--validator":
+            validator = value
+        if arg == "--define":
+            defines.append( value )
+        if arg == "--compute":
+            is_compute = True
+        if arg == "--local_size":
+            local_size = value
+        if arg == "--workgroup":
+            workgroup = value
+        if arg == "--workgroup_table":
+            table_path = value
+        if arg == "--buffer":
+            buffer_specs.append( value )
+        if arg == "--shared":
+            shared = True
+        if arg == "--barrier":
+            uses += [ use.strip() for use in value.split( "," ) if use.strip() != "" ]
+        if arg == "--gpu_timer":
+            timer_name = value
+        if arg == "--pass":
+            passes.append( value )
+        if arg == "--latency":
+            try:
+                latency = int( value )
+            except ValueError:
+                print_fatal( "--latency must be a number!" )
+        if arg == "--gl_header":
+            gl_header = value
+        if arg == "--hot_reload":
+            reload_name = value
+        if arg == "--block":
+            block_name = value
+        if arg == "--layout":
+            block_layout = value
+        if arg == "--storage":
+            storage = True
+        if arg == "--binding":
+            try:
+                binding = int( value )
+            except ValueError:
+                print_fatal( "--binding must be a number!" )
+        if arg == "--permute":
+            permute_spec = value
+        if arg == "-j" or arg == "--jobs":
+            try:
+                jobs = int( value )
+            except ValueError:
+                print_fatal( "-j/--jobs must be a number!" )
+
+    # only --block takes values after the options, its fields
+    if len( values ) != 0 and block_name == "":
+        print_fatal( "unexpected argument \"" + values[0] + "\"!" )
+
+    if flatten_root != "":
+        if name != "" or manifest_path != "":
+            print_fatal( "--flatten cannot be combined with -n/--name or -m/--manifest!" )
+        flatten( flatten_root, output_dir, overwrite )
+
+    if bundle_root != "":
+        if name != "" or manifest_path != "":
+            print_fatal( "--bundle cannot be combined with -n/--name or -m/--manifest!" )
+        bundle( bundle_root, output_dir, bundle_name, description, no_info, header_guard )
+
+    if check_root != "":
+        if name != "" or manifest_path != "":
+            print_fatal( "--check cannot be combined with -n/--name or -m/--manifest!" )
+        check( check_root, output_dir, validator, defines, jobs )
+
+    if permute_spec != "":
+        if name != "" or manifest_path != "":
+            print_fatal( "--permute cannot be combined with -n/--name or -m/--manifest!" )
+        permute( permute_spec, output_dir, description, no_info, header_guard )
+
+    if block_name != "":
+        if name != "" or manifest_path != "":
+            print_fatal( "--block cannot be combined with -n/--name or -m/--manifest!" )
+        block( block_name, values, block_layout, storage, binding, description, no_info, header_guard, overwrite )
+
+    if block_layout != "" or storage:
+        print_fatal( "--layout and --storage are only valid with --block!" )
+
+    if reload_name != "":
+        if name != "" or manifest_path != "":
+            print_fatal( "--hot_reload cannot be combined with -n/--name or -m/--manifest!" )
+        hot_reload( reload_name, description, no_info, header_guard, overwrite )
+
+    if timer_name != "":
+        if name != "" or manifest_path != "":
+            print_fatal( "--gpu_timer cannot be combined with -n/--name or -m/--manifest!" )
+        gpu_timer( timer_name, passes, latency, gl_header, description, no_info, header_guard, overwrite )
+
+    if is_compute:
+        if manifest_path != "":
+            print_fatal( "--compute cannot be combined with -m/--manifest!" )
+        if name == "":
+            print_fatal( "must input file name!" )
+        if no_vertex or no_fragment:
+            print_fatal( "--compute cannot be combined with --vertex or --fragment!" )
+        compute(
+            name, version, description, no_info, header_guard, overwrite,
+            local_size, workgroup, table_path, buffer_specs, binding, shared, uses
+        )
+
+    if local_size != "" or workgroup != "" or table_path != "" or len( buffer_specs ) != 0 or shared or len( uses ) != 0:
+        print_fatal( "--local_size, --workgroup, --workgroup_table, --buffer, --shared and --barrier are only valid with --compute!" )
+
+    if header_guard != "":
+        print_fatal( "-g/--header_guard is only valid with --bundle, --permute, --block, --compute, --hot_reload or --gpu_timer!" )
+
+    if manifest_path != "":
+        if name != "":
+            print_fatal( "-n/--name and -m/--manifest cannot be defined simultaneously!" )
+        create_from_manifest( manifest_path, {
+            "description": description, "version": version,
+            "vertex": no_fragment, "fragment": no_vertex,
+            "no_info": no_info
+        }, overwrite )
 
     if name == "":
         print_fatal( "must input file name!" )
@@ -100,55 +551,41 @@ if __name__ == "__main__":
     if no_vertex and no_fragment:
         print_fatal( "--vertex and --fragment cannot be defined simultaneously!" )
 
-    vertex_ext   = ".vs"
-    fragment_ext = ".fs"
-
     vertex_full_path   = name + vertex_ext
     fragment_full_path = name + fragment_ext
 
-    desc = ""
-    if not(no_info):
-        today = date.today()
-        desc += "/**\n"
-        desc += " * Description:  " + description + "\n"
-        desc += " * Author:       Alicia Amarilla (smushyaa@gmail.com)\n"
-        desc += " * File Created: " + today.strftime( "%B %d, %Y" ) + "\n"
-        desc += "*/\n"
+    profiler.mark( "render" )
+    context = make_context( name, description, version, no_info )
 
 
+    profiler.mark( "write" )
     if not(no_vertex):
-        if not(overwrite) and pathlib.Path( vertex_full_path ).is_file():
+        if not(overwrite) and os.path.isfile( vertex_full_path ):
             print_err( "error: cannot create vertex file, file already exists" )
             print_err( "use -o or --overwrite to overwrite existing file" )
         else:
             try:
                 with open( vertex_full_path, "w+", newline='\n' ) as write_file:
-                    if not(no_info):
-                        write_file.write( desc )
-                    write_file.write( "#version " + version + "\n\n" )
-                    write_file.write( "out struct{\n    \n} v2f;\n\n" )
-                    write_file.write( "void main() {\n    \n}\n" )
+                    write_file.write( render_vertex( context ) )
             except OSError as err:
                 print_fatal( str(err) )
 
             print_status( "created vertex file \"" + vertex_full_path + "\"" )
 
     if not(no_fragment):
-        if not(overwrite) and pathlib.Path( fragment_full_path ).is_file():
+        if not(overwrite) and os.path.isfile( fragment_full_path ):
             print_err( "error: cannot create fragment file, already exists" )
             print_err( "use -o or --overwrite to overwrite existing file" )
         else:
             try:
                 with open( fragment_full_path, "w+", newline='\n' ) as write_file:
-                    if not(no_info):
-                        write_file.write( desc )
-                    write_file.write( "#version " + version + "\n\n" )
-                    write_file.write( "in struct{\n    \n} v2f;\n\n" )
-                    write_file.write( "out vec4 FRAG_COLOR;\n" )
-                    write_file.write( "void main() {\n    \n}\n" )
+                    write_file.write( render_fragment( context ) )
             except OSError as err:
                 print_fatal( str(err) )
 
             print_status( "created fragment file \"" + fragment_full_path + "\"" )
 
-    sys.exit(0)
\ No newline at end of file
+    sys.exit(0)
+
+if __name__ == "__main__":
+    main( sys.argv[1:] )
@@ -3,61 +3,122 @@
 # * File Created: February 09, 2023
 
 import sys
-import pathlib
-from datetime import date
-import termcolor
+import os
+import profiler
+import templates
+from common import print_status, print_err, print_help
 
-today = date.today()
+# --kind -> template
+kinds = {
+    "script":   "py_script",
+    # streaming reader, bounded queues, thread/process pool stages, --profile and --bench
+    "pipeline": "py_pipeline",
+}
 
-comment_author = "Alicia Amarilla ( smushyaa@gmail.com )"
-comment_date   = today.strftime( "%B %d, %Y" )
-comment_info0  = "# * Description:  \n"
-comment_info1  = "# * Author:       " + comment_author + "\n"
-comment_info2  = "# * File Created: " + comment_date + "\n"
+def render_script( name:str, kind:str = "script" ) -> str:
+    context = { "name": name, "description": "" }
+    context["info"] = templates.render( "py_info", **context )
+    return templates.render( kinds[kind], **context )
 
-comment_info = comment_info0 + comment_info1 + comment_info2 + "\n"
-
-def create_script( file_path ):
+def create_script( name, kind ):
+    file_path = name + ".py"
+    profiler.mark( "render" )
+    text = render_script( name, kind )
+    profiler.mark( "write" )
     file = open( file_path, "w+", newline='\n' )
-    file.write( comment_info )
-    file.write( "import sys\n\n" )
-    file.write( "if __name__ == \"__main__\":\n    sys.exit()" )
+    file.write( text )
 
     file.close()
-    print( termcolor.colored( "created python script \"" + file_path + "\"", "green" ) )
+    print_status( "created python script \"" + file_path + "\"" )
 
-if __name__ == "__main__":
+def create_from_manifest( manifest_path:str, defaults:dict, overwrite:bool ):
+    import manifest
+
+    profiler.mark( "manifest" )
+    try:
+        entries = manifest.load_manifest( manifest_path )
+    except manifest.ManifestError as err:
+        print_err( "error: " + str(err) )
+        sys.exit(-1)
+
+    for entry in entries:
+        for key, value in defaults.items():
+            entry.setdefault( key, value )
+        if not( entry["kind"] in kinds ):
+            print_err( "error: \"" + entry["name"] + "\": unknown kind \"" + str(entry["kind"]) + "\", expected one of " + ", ".join( kinds ) )
+            sys.exit(-1)
+
+    profiler.mark( "render" )
+    files = [ ( entry["name"] + ".py", render_script( entry["name"], entry["kind"] ) ) for entry in entries ]
+
+    profiler.mark( "write" )
+    created, skipped, failed = manifest.write_files( files, overwrite )
+    for path, err in failed:
+        print_err( "error: cannot create \"" + path + "\": " + err )
+    print_status( manifest.summary( created, skipped, failed ) )
+
+    if len( failed ) != 0:
+        sys.exit(-1)
+    sys.exit()
+
+def main( arg_list:list ):
+    arg_list = profiler.setup( arg_list )
     name_is_set = False
     name = "file"
     overwrite = False
+    manifest_path = ""
+    kind = "script"
 
-    for i, arg in enumerate( sys.argv ):
+    for i, arg in enumerate( arg_list ):
         match arg:
             case "--help" | "-h":
-                print( termcolor.colored( "pynew: create new Python script", "cyan" ) )
-                print( termcolor.colored( "    -n, --name [required] [string]: set name of file.", "cyan" ) )
-                print( termcolor.colored( "                                    include parent directory if deeper in current directory.", "cyan" ) )
-                print( termcolor.colored( "    -o, --overwrite       [switch] [default=false]:  if file exists, overwrite", "cyan" ) )
+                print_help( "pynew: create new Python script" )
+                print_help( "    -n, --name [required] [string]: set name of file." )
+                print_help( "                                    include parent directory if deeper in current directory." )
+                print_help( "    -o, --overwrite       [switch] [default=false]:  if file exists, overwrite" )
+                print_help( "    -k, --kind            [string] [default=script]: script to create. VALID = [" + ", ".join( kinds ) + "]" )
+                print_help( "                                    pipeline: streaming reader, bounded queue stages on a thread or" )
+                print_help( "                                    process pool, chunked batched I/O, --profile and --bench" )
+                print_help( "    -m, --manifest        [string]: create every script listed in manifest" )
+                print_help( "                                    (.json, .toml or one name per line, - for stdin)" )
+                for line in profiler.help_lines:
+                    print_help( "   " + line )
 
-                print( termcolor.colored( "\n    -h, --help: print this help message and exit", "cyan" ) )
+                print_help( "\n    -h, --help: print this help message and exit" )
                 sys.exit()
             case "-n" | "--name":
                 name_is_set = True
-                name = sys.argv[i + 1]
+                name = arg_list[i + 1]
             case "-o" | "--overwrite":
                 overwrite = True
+            case "-m" | "--manifest":
+                manifest_path = arg_list[i + 1]
+            case "-k" | "--kind":
+                kind = arg_list[i + 1]
+                if not( kind in kinds ):
+                    print_err( "\"" + kind + "\" is not a valid kind, expected one of " + ", ".join( kinds ) )
+                    sys.exit()
             case _:
                 continue
     
+    if manifest_path != "":
+        if name_is_set:
+            print_err( "-n/--name and -m/--manifest cannot be set simultaneously!" )
+            sys.exit()
+        create_from_manifest( manifest_path, { "kind": kind }, overwrite )
+
     if not(name_is_set):
-        print( termcolor.colored( "must set file name! run with -h or --help for more info", "red" ) )
+        print_err( "must set file name! run with -h or --help for more info" )
         sys.exit()
 
     file_path = name + ".py"
     if overwrite:
-        if pathlib.Path(file_path).is_file():
-            print( termcolor.colored( "cannot create script \"" + file_path + "\". file already exists", "red" ) )
+        if os.path.isfile( file_path ):
+            print_err( "cannot create script \"" + file_path + "\". file already exists" )
         else:
-            create_script( file_path )
+            create_script( name, kind )
     else:
-        create_script( file_path )
+        create_script( name, kind )
+
+if __name__ == "__main__":
+    main( sys.argv[1:] )
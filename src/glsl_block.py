@@ -0,0 +1,200 @@
+# * Description:  std140/std430 block layout with a matching padded C struct
+# * Author:       Alicia Amarilla ( smushyaa@gmail.com )
+# * File Created: October 19, 2026
+
+import templates
+import glsl_bundle
+from common import is_identifier
+
+# a field is name:type or name:type[count], types are the GLSL scalar, vector
+# and matrix types: float int uint bool double, vecN ivecN uvecN bvecN dvecN,
+# matN matCxR dmatN dmatCxR. bool is 4 bytes in a block and uint32_t in C.
+#
+# offsets follow the GLSL 4.60 specification, section 7.6.2.2:
+#   vec2 aligns to 2 components, vec3 and vec4 to 4
+#   matrices are arrays of column vectors
+#   std140 rounds the alignment and stride of arrays and matrix columns up to 16 bytes
+#   std430 uses the element alignment as is
+# the C struct spells out every padding byte, vectors become arrays of their
+# component type and padded array elements or matrix columns get an extra
+# dimension holding the padding, e.g. vec3 lights[4] in std140 is float lights[4][4].
+# static asserts pin every offset and the total size so a buffer can be
+# memcpy'd or persistently mapped without repacking.
+
+layouts = [ "std140", "std430" ]
+
+# component prefix: ( C type, size in bytes )
+components = {
+    "":  ( "float", 4 ),
+    "i": ( "int32_t", 4 ),
+    "u": ( "uint32_t", 4 ),
+    "b": ( "uint32_t", 4 ),
+    "d": ( "double", 8 ),
+}
+
+scalars = { "float": "", "int": "i", "uint": "u", "bool": "b", "double": "d" }
+
+class BlockError( Exception ):
+    pass
+
+def round_up( value:int, align:int ) -> int:
+    return ( value + align - 1 ) // align * align
+
+def parse_type( text:str ):
+    """returns ( component prefix, columns, rows ), rows is the vector size"""
+    if text in scalars:
+        return scalars[text], 1, 1
+    prefix = text[0] if text[0] in "iubd" else ""
+    rest   = text[len( prefix ):]
+    if rest.startswith( "vec" ) and rest[3:] in ( "2", "3", "4" ):
+        return prefix, 1, int( rest[3:] )
+    if rest.startswith( "mat" ) and prefix in ( "", "d" ):
+        dims = rest[3:]
+        if dims in ( "2", "3", "4" ):
+            return prefix, int( dims ), int( dims )
+        if len( dims ) == 3 and dims[0] in "234" and dims[1] == "x" and dims[2] in "234":
+            return prefix, int( dims[0] ), int( dims[2] )
+    raise BlockError( "unknown type \"" + text + "\"" )
+
+class Field:
+    def __init__( self, spec:str, layout:str ):
+        name, sep, glsl_type = spec.partition( ":" )
+        name      = name.strip()
+        glsl_type = glsl_type.strip()
+        if sep == "" or not( is_identifier( name ) ):
+            raise BlockError( "field \"" + spec + "\" must be name:type" )
+
+        self.count = 0
+        if glsl_type.endswith( "]" ) and "[" in glsl_type:
+            glsl_type, _, count = glsl_type[:-1].partition( "[" )
+            try:
+                self.count = int( count )
+            except ValueError:
+                raise BlockError( "field \"" + spec + "\" has an invalid array size" )
+            if self.count <= 0:
+                raise BlockError( "field \"" + spec + "\" has an invalid array size" )
+
+        self.name      = name
+        self.glsl_type = glsl_type
+        prefix, self.columns, self.rows = parse_type( glsl_type )
+        self.ctype, self.component = components[prefix]
+
+        # one column vector
+        align = self.component * ( 1 if self.rows == 1 else 2 if self.rows == 2 else 4 )
+        size  = self.component * self.rows
+        if self.columns > 1:
+            # matrix, an array of column vectors
+            self.column_stride = round_up( align, 16 ) if layout == "std140" else align
+            align = self.column_stride
+            size  = self.column_stride * self.columns
+        else:
+            self.column_stride = size
+
+        if self.count != 0:
+            if layout == "std140":
+                align = round_up( align, 16 )
+            self.stride = round_up( size, align )
+            size        = self.stride * self.count
+        else:
+            self.stride = size
+
+        self.align  = align
+        self.size   = size
+        self.offset = 0
+
+    def glsl( self ) -> str:
+        return self.glsl_type + " " + self.name + ( "[" + str(self.count) + "]" if self.count != 0 else "" )
+
+    def c( self ) -> str:
+        dims = ""
+        if self.count != 0:
+            dims += "[" + str(self.count) + "]"
+        if self.columns > 1:
+            dims += "[" + str(self.columns) + "][" + str(self.column_stride // self.component) + "]"
+        elif self.count != 0:
+            inner = self.stride // self.component
+            if inner != 1:
+                dims += "[" + str(inner) + "]"
+        elif self.rows != 1:
+            dims += "[" + str(self.rows) + "]"
+        return self.ctype + " " + self.name + dims
+
+def layout_block( field_specs:list, layout:str ):
+    """returns ( fields, size ) with offsets filled in"""
+    if not( layout in layouts ):
+        raise BlockError( "unknown layout \"" + layout + "\", expected " + " or ".join( layouts ) )
+    if len( field_specs ) == 0:
+        raise BlockError( "block needs at least one field" )
+
+    fields = []
+    names  = set()
+    offset = 0
+    align  = 1
+    for spec in field_specs:
+        field = Field( spec, layout )
+        if field.name in names:
+            raise BlockError( "field \"" + field.name + "\" is defined twice" )
+        names.add( field.name )
+        field.offset = round_up( offset, field.align )
+        offset       = field.offset + field.size
+        align        = max( align, field.align )
+        fields.append( field )
+
+    # a block is a structure, std140 rounds its alignment up to 16 bytes
+    if layout == "std140":
+        align = round_up( align, 16 )
+    return fields, round_up( offset, align )
+
+def render_glsl( block_name:str, fields:list, layout:str, storage:bool, binding:int, context:dict ) -> str:
+    body  = "layout(" + layout + ", binding = " + str(binding) + ") "
+    body += ( "buffer " if storage else "uniform " ) + block_name + " {\n"
+    for field in fields:
+        body += "    " + field.glsl() + "; /* offset " + str(field.offset) + ", size " + str(field.size) + " */\n"
+    body += "};\n"
+    return templates.render(
+        "glsl_block", body=body, block=block_name,
+        guard=glsl_bundle.identifier( block_name ) + "_GLSL", **context
+    )
+
+def render_header( block_name:str, fields:list, size:int, layout:str, context:dict ) -> str:
+    prefix = glsl_bundle.identifier( block_name )
+    assert_macro = prefix + "_STATIC_ASSERT"
+
+    body  = "#include <stddef.h>\n#include <stdint.h>\n\n"
+    body += "#if defined(__cplusplus) && ( __cplusplus >= 201103L || defined(_MSC_VER) )\n"
+    body += "    #define " + assert_macro + " static_assert\n"
+    body += "#elif !defined(__cplusplus) && defined(__STDC_VERSION__) && __STDC_VERSION__ >= 201112L\n"
+    body += "    #define " + assert_macro + " _Static_assert\n"
+    body += "#else\n"
+    body += "    /* before C11 and C++11 a negative array size fails the build instead */\n"
+    body += "    #define " + prefix + "_CONCAT_( a, b ) a##b\n"
+    body += "    #define " + prefix + "_CONCAT( a, b ) " + prefix + "_CONCAT_( a, b )\n"
+    body += (
+        "    #define " + assert_macro + "( condition, message ) typedef char " +
+        prefix + "_CONCAT( " + prefix.lower() + "_static_assert_, __LINE__ )[( condition ) ? 1 : -1]\n"
+    )
+    body += "#endif\n\n"
+    body += "#define " + prefix + "_SIZE " + str(size) + "\n\n"
+
+    body += "/* " + layout + " layout of " + block_name + " */\n"
+    body += "typedef struct " + block_name + " {\n"
+    offset  = 0
+    padding = 0
+    for field in fields:
+        if field.offset != offset:
+            body += "    uint8_t _pad" + str(padding) + "[" + str(field.offset - offset) + "];\n"
+            padding += 1
+        body += "    " + field.c() + "; /* offset " + str(field.offset) + " */\n"
+        offset = field.offset + field.size
+    if size != offset:
+        body += "    uint8_t _pad" + str(padding) + "[" + str(size - offset) + "];\n"
+    body += "} " + block_name + ";\n\n"
+
+    for field in fields:
+        body += (
+            assert_macro + "( offsetof( " + block_name + ", " + field.name + " ) == " +
+            str(field.offset) + ", \"" + block_name + "." + field.name + " offset\" );\n"
+        )
+    body += assert_macro + "( sizeof( " + block_name + " ) == " + prefix + "_SIZE, \"" + block_name + " size\" );\n"
+
+    return templates.render( "glsl_block_header", body=body, block=block_name, **context )
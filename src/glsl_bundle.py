@@ -0,0 +1,156 @@
+# * Description:  Packs glnew shaders into one binary bundle with a C offset header
+# * Author:       Alicia Amarilla ( smushyaa@gmail.com )
+# * File Created: October 19, 2026
+
+import os
+import struct
+import templates
+import glsl_flatten
+
+# bundle layout, all integers little endian:
+#   header  magic "GLSB", u32 version, u32 count, u32 names offset
+#   index   count * ( u32 name offset, u32 name length, u32 offset, u32 length, u64 hash )
+#   names   NUL terminated shader paths relative to the bundled directory
+#   sources NUL terminated shader sources, every source starts on an 8 byte boundary
+#
+# offsets are from the start of the bundle and lengths exclude the NUL so a
+# mapped or embedded bundle can be handed straight to glShaderSource.
+# hash is 64 bit FNV-1a of the source.
+
+magic       = b"GLSB"
+version     = 1
+alignment   = 8
+header_size = 16
+entry_size  = 24
+
+class BundleError( Exception ):
+    pass
+
+def fnv1a64( data:bytes ) -> int:
+    value = 0xcbf29ce484222325
+    for byte in data:
+        value ^= byte
+        value  = ( value * 0x100000001b3 ) & 0xffffffffffffffff
+    return value
+
+def identifier( text:str ) -> str:
+    ident = "".join( c if c.isalnum() else "_" for c in text ).upper()
+    if ident == "" or ident[0].isdigit():
+        ident = "_" + ident
+    return ident
+
+def c_string( text:str ) -> str:
+    """text as a C string literal, ? is escaped so -std=c89 trigraphs stay literal"""
+    return "\"" + text.replace( "\\", "\\\\" ).replace( "\"", "\\\"" ).replace( "?", "\\?" ) + "\""
+
+def align( value:int ) -> int:
+    return ( value + alignment - 1 ) & ~( alignment - 1 )
+
+def collect( root:str, exclude:str = "" ) -> list:
+    """returns a list of ( name, source bytes ) for every shader under root, skipping the exclude directory"""
+    shaders = []
+    for path in glsl_flatten.find_shaders( root, exclude ):
+        with open( path, "rb" ) as read_file:
+            source = read_file.read()
+        name = os.path.relpath( path, root ).replace( "\\", "/" )
+        shaders.append( ( name, source ) )
+    return shaders
+
+def pack( shaders:list ):
+    """returns ( bundle bytes, entries ), entries is a list of ( name, offset, length, hash )"""
+    names_offset = header_size + entry_size * len( shaders )
+    names        = b""
+    name_spans   = []
+    for name, _ in shaders:
+        encoded = name.encode( "utf-8" )
+        name_spans.append( ( names_offset + len( names ), len( encoded ) ) )
+        names += encoded + b"\0"
+
+    data        = bytearray()
+    data_offset = align( names_offset + len( names ) )
+    entries     = []
+    for name, source in shaders:
+        offset = data_offset + len( data )
+        entries.append( ( name, offset, len( source ), fnv1a64( source ) ) )
+        data += source + b"\0"
+        data += b"\0" * ( align( len( data ) ) - len( data ) )
+
+    bundle = bytearray( struct.pack( "<4sIII", magic, version, len( shaders ), names_offset ) )
+    for ( name, offset, length, hash ), ( name_offset, name_length ) in zip( entries, name_spans ):
+        bundle += struct.pack( "<IIIIQ", name_offset, name_length, offset, length, hash )
+    bundle += names
+    bundle += b"\0" * ( data_offset - len( bundle ) )
+    bundle += data
+    return bytes( bundle ), entries
+
+def render_header( bundle_name:str, bundle_file:str, entries:list, size:int, context:dict ) -> str:
+    prefix = identifier( bundle_name )
+    lower  = prefix.lower()
+
+    body  = "#define " + prefix + "_FILE " + c_string( bundle_file ) + "\n"
+    body += "#define " + prefix + "_SIZE " + str(size) + "\n"
+    body += "#define " + prefix + "_COUNT " + str(len( entries )) + "\n\n"
+
+    # the 64 bit hash is split in two halves, C89 has no long long
+    body += "typedef struct " + lower + "_entry {\n"
+    body += "    const char*   name;\n"
+    body += "    unsigned int  offset;\n"
+    body += "    unsigned int  length;\n"
+    body += "    unsigned long hash_high;\n"
+    body += "    unsigned long hash_low;\n"
+    body += "} " + lower + "_entry;\n\n"
+
+    used  = set()
+    ids   = []
+    for index, ( name, offset, length, hash ) in enumerate( entries ):
+        ident = prefix + "_" + identifier( name )
+        if ident in used:
+            ident += "_" + str(index)
+        used.add( ident )
+        ids.append( ident )
+
+    # an empty enum is invalid C and C89 rejects a trailing comma
+    if len( ids ) != 0:
+        body += "enum {\n"
+        body += ",\n".join( "    " + ident + " = " + str(index) for index, ident in enumerate( ids ) )
+        body += "\n};\n\n"
+
+    for ident, ( name, offset, length, hash ) in zip( ids, entries ):
+        body += "#define " + ident + "_OFFSET " + str(offset) + "u\n"
+        body += "#define " + ident + "_LENGTH " + str(length) + "u\n"
+        body += "#define " + ident + "_HASH_HIGH 0x{:08x}ul\n".format( hash >> 32 )
+        body += "#define " + ident + "_HASH_LOW 0x{:08x}ul\n".format( hash & 0xffffffff )
+    if len( entries ) != 0:
+        body += "\n"
+
+    body += "static const " + lower + "_entry " + prefix + "_ENTRIES[" + prefix + "_COUNT + 1] = {\n"
+    for ident, ( name, offset, length, hash ) in zip( ids, entries ):
+        body += "    { " + c_string( name ) + ", " + ident + "_OFFSET, " + ident + "_LENGTH, "
+        body += ident + "_HASH_HIGH, " + ident + "_HASH_LOW },\n"
+    body += "    { 0, 0, 0, 0, 0 }\n"
+    body += "};\n\n"
+
+    body += "/* pointer to the NUL terminated source of shader index inside a mapped or embedded bundle */\n"
+    body += "#define " + lower + "_source( bundle, index ) \\\n"
+    body += "    ((const char*)(bundle) + " + prefix + "_ENTRIES[(index)].offset)\n"
+    body += "#define " + lower + "_length( index ) ((int)" + prefix + "_ENTRIES[(index)].length)\n"
+
+    return templates.render( "glsl_bundle_header", body=body, bundle=bundle_name, **context )
+
+def bundle_tree( root:str, output_dir:str, bundle_name:str, context:dict ):
+    """bundles every shader under root, returns ( bundle path, header path, count )"""
+    bundle_path = os.path.join( output_dir, bundle_name + ".bin" )
+    header_path = os.path.join( output_dir, bundle_name + ".h" )
+
+    shaders = collect( root, output_dir )
+    if len( shaders ) == 0:
+        raise BundleError( "no shaders found in \"" + root + "\"" )
+    bundle, entries = pack( shaders )
+
+    os.makedirs( output_dir, exist_ok=True )
+    with open( bundle_path, "wb" ) as write_file:
+        write_file.write( bundle )
+    with open( header_path, "w", newline='\n' ) as write_file:
+        write_file.write( render_header( bundle_name, bundle_name + ".bin", entries, len( bundle ), context ) )
+
+    return bundle_path, header_path, len( entries )
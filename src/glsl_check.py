@@ -0,0 +1,146 @@
+# * Description:  Offline shader validation with a content hash cache and parallel workers
+# * Author:       Alicia Amarilla ( smushyaa@gmail.com )
+# * File Created: October 19, 2026
+
+import os
+import json
+import hashlib
+import glsl_flatten
+
+# every shader under the root is flattened in memory, defines are inserted after
+# the #version line and the result is passed to the validator command.
+# the validator command is split like a shell command line and these placeholders
+# are replaced in every argument:
+#   {input}  path of a temporary file holding the flattened source
+#   {output} path the validator may write SPIR-V to
+#   {stage}  stage name from glsl_flatten.shader_stages, vert, frag or comp
+# a shader passes when the command exits with 0.
+#
+# results are cached in <output dir>/.check_cache by sha256 of the validator
+# command, the defines and the flattened source (which holds the #version line),
+# so unchanged shaders are never validated again. SPIR-V output, when the
+# validator writes any, is cached as well and copied to <output dir>/<shader>.spv
+
+default_validator = "glslangValidator -G -S {stage} -o {output} {input}"
+
+cache_name = ".check_cache"
+
+class ValidatorError( Exception ):
+    pass
+
+def cache_key( command:str, defines:list, source:str ) -> str:
+    digest = hashlib.sha256()
+    digest.update( command.encode( "utf-8" ) + b"\0" )
+    digest.update( "\0".join( defines ).encode( "utf-8" ) + b"\0" )
+    digest.update( source.encode( "utf-8" ) )
+    return digest.hexdigest()
+
+def validate( command:str, source:str, stage:str, work_dir:str, key:str ):
+    """runs in a worker process. returns ( ok, log, spirv bytes or None )"""
+    import shlex
+    import subprocess
+
+    input_path  = os.path.join( work_dir, key + "." + stage )
+    output_path = os.path.join( work_dir, key + ".spv" )
+    with open( input_path, "w", newline='\n' ) as write_file:
+        write_file.write( source )
+
+    args = []
+    for arg in shlex.split( command, posix=( os.name != "nt" ) ):
+        arg = arg.replace( "{input}", input_path )
+        arg = arg.replace( "{output}", output_path )
+        arg = arg.replace( "{stage}", stage )
+        args.append( arg )
+
+    try:
+        proc = subprocess.run( args, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True )
+    except OSError as err:
+        raise ValidatorError( "could not run validator \"" + args[0] + "\": " + str(err) )
+    finally:
+        os.remove( input_path )
+
+    spirv = None
+    if os.path.isfile( output_path ):
+        with open( output_path, "rb" ) as read_file:
+            spirv = read_file.read()
+        os.remove( output_path )
+
+    return proc.returncode == 0, proc.stdout, spirv
+
+def load_result( cache_dir:str, key:str ):
+    try:
+        with open( os.path.join( cache_dir, key + ".json" ), "r" ) as read_file:
+            result = json.load( read_file )
+    except ( OSError, ValueError ):
+        return None
+    spirv = None
+    if result.get( "spirv", False ):
+        try:
+            with open( os.path.join( cache_dir, key + ".spv" ), "rb" ) as read_file:
+                spirv = read_file.read()
+        except OSError:
+            return None
+    return result["ok"], result["log"], spirv
+
+def save_result( cache_dir:str, key:str, ok:bool, log:str, spirv ):
+    if spirv is not None:
+        with open( os.path.join( cache_dir, key + ".spv" ), "wb" ) as write_file:
+            write_file.write( spirv )
+    with open( os.path.join( cache_dir, key + ".json" ), "w", newline='\n' ) as write_file:
+        json.dump( { "ok": ok, "log": log, "spirv": spirv is not None }, write_file )
+
+def check_tree( root:str, output_dir:str, command:str, defines:list, jobs:int ):
+    """validates every shader under root.
+    returns ( passed, cached, failed ), failed is a list of ( path, log ), cached counts cache hits"""
+    from concurrent.futures import ProcessPoolExecutor
+
+    cache_dir = os.path.join( output_dir, cache_name )
+    os.makedirs( cache_dir, exist_ok=True )
+
+    flattener = glsl_flatten.Flattener( root )
+    pending   = []
+    results   = {}
+    failed    = []
+    cached    = 0
+    for shader in glsl_flatten.find_shaders( root, output_dir ):
+        rel = os.path.relpath( shader, root ).replace( "\\", "/" )
+        try:
+            source, _ = flattener.flatten( shader )
+        except glsl_flatten.IncludeError as err:
+            failed.append( ( rel, str(err) ) )
+            continue
+        source = glsl_flatten.insert_defines( source, defines )
+        key    = cache_key( command, defines, source )
+
+        result = load_result( cache_dir, key )
+        if result is not None:
+            cached += 1
+            results[rel] = result
+        else:
+            pending.append( ( rel, key, source, glsl_flatten.shader_stages[os.path.splitext( shader )[1]] ) )
+
+    if len( pending ) != 0:
+        with ProcessPoolExecutor( max_workers=max( 1, min( jobs, len( pending ) ) ) ) as pool:
+            futures = [
+                ( rel, key, pool.submit( validate, command, source, stage, cache_dir, key ) )
+                for rel, key, source, stage in pending
+            ]
+            for rel, key, future in futures:
+                ok, log, spirv = future.result()
+                save_result( cache_dir, key, ok, log, spirv )
+                results[rel] = ( ok, log, spirv )
+
+    passed = []
+    for rel in sorted( results ):
+        ok, log, spirv = results[rel]
+        if not( ok ):
+            failed.append( ( rel, log ) )
+            continue
+        passed.append( rel )
+        if spirv is not None:
+            spirv_path = os.path.join( output_dir, rel + ".spv" )
+            os.makedirs( os.path.dirname( spirv_path ) or ".", exist_ok=True )
+            with open( spirv_path, "wb" ) as write_file:
+                write_file.write( spirv )
+
+    return passed, cached, failed
@@ -0,0 +1,193 @@
+# * Description:  Compute shader and C dispatch helper generation for glnew
+# * Author:       Alicia Amarilla ( smushyaa@gmail.com )
+# * File Created: October 19, 2026
+
+import os
+import common
+import templates
+import glsl_bundle
+
+# the workgroup size comes from, in order:
+#   --local_size X[,Y[,Z]]
+#   the --workgroup entry of the workgroup table
+#   the "default" entry of the workgroup table
+#   64,1,1
+#
+# the workgroup table is a .json or .toml table of name = [ x, y, z ],
+# e.g. { "default": [ 64 ], "image": [ 8, 8 ], "skinning": [ 128, 1, 1 ] }
+# it is --workgroup_table or the first of ./.scaffold/workgroups.{json,toml}
+# and <config dir>/workgroups.{json,toml} that exists.
+#
+# the dispatch helper rounds the problem size up to whole workgroups, calls
+# glDispatchCompute and issues glMemoryBarrier with the bits of every --barrier use.
+
+default_local_size = ( 64, 1, 1 )
+
+# limits every OpenGL 4.3 implementation supports
+max_local_size   = ( 1024, 1024, 64 )
+max_invocations  = 1024
+
+table_names = [ "workgroups.json", "workgroups.toml" ]
+
+barriers = {
+    "storage": "GL_SHADER_STORAGE_BARRIER_BIT",
+    "vertex":  "GL_VERTEX_ATTRIB_ARRAY_BARRIER_BIT",
+    "index":   "GL_ELEMENT_ARRAY_BARRIER_BIT",
+    "uniform": "GL_UNIFORM_BARRIER_BIT",
+    "command": "GL_COMMAND_BARRIER_BIT",
+    "image":   "GL_SHADER_IMAGE_ACCESS_BARRIER_BIT",
+    "texture": "GL_TEXTURE_FETCH_BARRIER_BIT",
+    "update":  "GL_BUFFER_UPDATE_BARRIER_BIT",
+    "all":     "GL_ALL_BARRIER_BITS",
+}
+
+class ComputeError( Exception ):
+    pass
+
+def local_size( value ) -> tuple:
+    """value is "X,Y,Z" or a list of one to three numbers, missing dimensions are 1"""
+    if isinstance( value, str ):
+        try:
+            value = [ int( part ) for part in value.split( "," ) ]
+        except ValueError:
+            raise ComputeError( "invalid local size \"" + value + "\"" )
+    if not( isinstance( value, list ) ) or not( 1 <= len( value ) <= 3 ) or not(
+        all( isinstance( v, int ) and not( isinstance( v, bool ) ) for v in value )
+    ):
+        raise ComputeError( "local size must be one to three numbers" )
+
+    size = tuple( value ) + ( 1, ) * ( 3 - len( value ) )
+    for axis, limit, dim in zip( "xyz", max_local_size, size ):
+        if not( 1 <= dim <= limit ):
+            raise ComputeError( "local_size_" + axis + " must be between 1 and " + str(limit) )
+    if size[0] * size[1] * size[2] > max_invocations:
+        raise ComputeError( "local size " + "x".join( str(d) for d in size ) + " exceeds " + str(max_invocations) + " invocations" )
+    return size
+
+def find_table() -> str:
+    for base in ( ".scaffold", common.config_dir() ):
+        for name in table_names:
+            path = os.path.join( base, name )
+            if os.path.isfile( path ):
+                return path
+    return ""
+
+def load_table( path:str ) -> dict:
+    try:
+        with open( path, "rb" ) as read_file:
+            data = read_file.read()
+    except OSError as err:
+        raise ComputeError( str(err) )
+
+    if os.path.splitext( path )[1].lower() == ".toml":
+        import tomllib
+        try:
+            table = tomllib.loads( data.decode( "utf-8" ) )
+        except ( ValueError, UnicodeDecodeError ) as err:
+            raise ComputeError( "invalid toml workgroup table: " + str(err) )
+    else:
+        import json
+        try:
+            table = json.loads( data )
+        except ValueError as err:
+            raise ComputeError( "invalid json workgroup table: " + str(err) )
+
+    if not( isinstance( table, dict ) ):
+        raise ComputeError( "workgroup table must be a table" )
+    sizes = {}
+    for name, value in table.items():
+        try:
+            sizes[name] = local_size( value )
+        except ComputeError as err:
+            raise ComputeError( path + ": " + name + ": " + str(err) )
+    return sizes
+
+def choose_local_size( explicit:str, workgroup:str, table_path:str ) -> tuple:
+    if explicit != "":
+        return local_size( explicit )
+
+    if table_path == "":
+        table_path = find_table()
+    if table_path == "":
+        if workgroup != "":
+            raise ComputeError( "workgroup \"" + workgroup + "\" requested but no workgroup table was found" )
+        return default_local_size
+
+    table = load_table( table_path )
+    if workgroup != "":
+        if not( workgroup in table ):
+            raise ComputeError( "workgroup \"" + workgroup + "\" is not in \"" + table_path + "\"" )
+        return table[workgroup]
+    return table.get( "default", default_local_size )
+
+def parse_buffer( spec:str, binding:int ) -> tuple:
+    """name or name:type, returns ( name, type, binding )"""
+    name, _, element = spec.partition( ":" )
+    if element == "":
+        element = "float"
+    if not( common.is_identifier( name ) ):
+        raise ComputeError( "invalid buffer name \"" + name + "\"" )
+    return name, element, binding
+
+def render_compute( context:dict, size:tuple, buffers:list, shared:bool ) -> str:
+    declarations = ""
+    for name, element, binding in buffers:
+        declarations += (
+            "layout(std430, binding = " + str(binding) + ") buffer " + name.capitalize() + "Buffer {\n"
+            "    " + element + " " + name + "[];\n"
+            "};\n"
+        )
+    if shared:
+        declarations += "shared float shared_data[gl_WorkGroupSize.x * gl_WorkGroupSize.y * gl_WorkGroupSize.z];\n"
+    if declarations != "":
+        declarations += "\n"
+
+    body = ""
+    if shared:
+        body = "    shared_data[gl_LocalInvocationIndex] = 0.0;\n    barrier();\n\n"
+
+    return templates.render(
+        "glsl_compute",
+        local_size_x=str(size[0]), local_size_y=str(size[1]), local_size_z=str(size[2]),
+        declarations=declarations, body=body, **context
+    )
+
+def render_dispatch( shader_name:str, size:tuple, uses:list, context:dict ) -> str:
+    prefix = glsl_bundle.identifier( os.path.splitext( os.path.basename( shader_name ) )[0] )
+    lower  = prefix.lower()
+
+    bits = []
+    for use in uses:
+        if not( use in barriers ):
+            raise ComputeError( "unknown barrier \"" + use + "\", expected one of " + ", ".join( barriers ) )
+        if not( barriers[use] in bits ):
+            bits.append( barriers[use] )
+
+    inline = prefix + "_INLINE"
+    body  = "#if defined(__cplusplus) || ( defined(__STDC_VERSION__) && __STDC_VERSION__ >= 199901L )\n"
+    body += "    #define " + inline + " static inline\n"
+    body += "#elif defined(__GNUC__) || defined(_MSC_VER)\n"
+    body += "    #define " + inline + " static __inline\n"
+    body += "#else\n"
+    body += "    #define " + inline + " static\n"
+    body += "#endif\n\n"
+    for axis, dim in zip( "XYZ", size ):
+        body += "#define " + prefix + "_LOCAL_SIZE_" + axis + " " + str(dim) + "u\n"
+    body += "#define " + prefix + "_BARRIER " + ( "(" + " | ".join( bits ) + ")" if len( bits ) != 0 else "0" ) + "\n\n"
+
+    body += "/* number of workgroups covering count invocations */\n"
+    body += inline + " unsigned int " + lower + "_groups( unsigned int count, unsigned int local_size ) {\n"
+    body += "    return ( count + local_size - 1u ) / local_size;\n"
+    body += "}\n\n"
+
+    body += "/* dispatch enough workgroups to cover a width * height * depth problem, the program must be bound */\n"
+    body += inline + " void " + lower + "_dispatch( unsigned int width, unsigned int height, unsigned int depth ) {\n"
+    body += "    glDispatchCompute(\n"
+    body += "        " + lower + "_groups( width, " + prefix + "_LOCAL_SIZE_X ),\n"
+    body += "        " + lower + "_groups( height, " + prefix + "_LOCAL_SIZE_Y ),\n"
+    body += "        " + lower + "_groups( depth, " + prefix + "_LOCAL_SIZE_Z ) );\n"
+    if len( bits ) != 0:
+        body += "    glMemoryBarrier( " + prefix + "_BARRIER );\n"
+    body += "}\n"
+
+    return templates.render( "glsl_compute_dispatch", body=body, shader=shader_name, **context )
@@ -0,0 +1,232 @@
+# * Description:  #include resolver and flattening pass for glnew shaders
+# * Author:       Alicia Amarilla ( smushyaa@gmail.com )
+# * File Created: October 19, 2026
+
+import os
+import json
+
+# #include "path" (or <path>) is resolved relative to the including file first
+# and then relative to the root of the shader tree.
+# every file is included at most once per shader, later includes of the
+# same file, cycles excepted, become comments so line numbers stay intact.
+# only includes outside of #if/#ifdef/#ifndef blocks count, a file included
+# inside a conditional block is written again wherever it is included, its
+# own include guard decides which copy the compiler keeps.
+# #version lines and #pragma once inside included files become comments as well.
+#
+# #line directives are written around every include, the source string number
+# is the index of the file in the source map comment at the end of the output.
+#
+# flattened shaders keep their path relative to the root inside the output directory.
+# the dependencies of every shader are stored in <output dir>/.flatten_cache.json
+# and a shader is only processed again when one of them changed.
+
+# shader file extensions and their stage names
+shader_stages = {
+    ".vs": "vert",
+    ".fs": "frag",
+    ".cs": "comp",
+}
+
+cache_name = ".flatten_cache.json"
+
+class IncludeError( Exception ):
+    pass
+
+def find_shaders( root:str, exclude:str = "" ) -> list:
+    shaders = []
+    exclude = os.path.abspath( exclude ) if exclude != "" else ""
+    for dirpath, dirnames, filenames in os.walk( root ):
+        if exclude != "":
+            dirnames[:] = [
+                d for d in dirnames
+                if os.path.abspath( os.path.join( dirpath, d ) ) != exclude
+            ]
+        dirnames.sort()
+        for filename in sorted( filenames ):
+            if os.path.splitext( filename )[1] in shader_stages:
+                shaders.append( os.path.join( dirpath, filename ) )
+    return shaders
+
+def include_target( line:str ):
+    # returns the included path of an #include line, None for any other line
+    stripped = line.strip()
+    if not( stripped.startswith( "#" ) ):
+        return None
+    directive = stripped[1:].lstrip()
+    if not( directive.startswith( "include" ) ):
+        return None
+    if len( directive ) > len( "include" ) and not( directive[len( "include" )] in " \t\"<" ):
+        return None
+    rest = directive[len( "include" ):].strip()
+    if len( rest ) >= 2 and ( ( rest[0] == "\"" and rest.find( "\"", 1 ) > 0 ) or ( rest[0] == "<" and rest.find( ">", 1 ) > 0 ) ):
+        close = "\"" if rest[0] == "\"" else ">"
+        return rest[1:rest.find( close, 1 )]
+    raise IncludeError( "malformed include: " + stripped )
+
+def is_directive( line:str, name:str ) -> bool:
+    stripped = line.strip()
+    if not( stripped.startswith( "#" ) ):
+        return False
+    words = stripped[1:].split()
+    return len( words ) != 0 and words[0] == name
+
+class Flattener:
+    def __init__( self, root:str ):
+        self.root  = os.path.abspath( root )
+        self.lines = {}
+
+    def read( self, path:str ) -> list:
+        # every file is read once per run no matter how many shaders include it
+        lines = self.lines.get( path )
+        if lines is None:
+            try:
+                with open( path, "r", encoding="utf-8" ) as read_file:
+                    lines = read_file.read().splitlines()
+            except OSError as err:
+                raise IncludeError( "could not read \"" + path + "\": " + str(err) )
+            self.lines[path] = lines
+        return lines
+
+    def resolve( self, target:str, including:str ) -> str:
+        for base in ( os.path.dirname( including ), self.root ):
+            path = os.path.normpath( os.path.join( base, target ) )
+            if os.path.isfile( path ):
+                return path
+        raise IncludeError( "could not find include \"" + target + "\" in \"" + including + "\"" )
+
+    def flatten( self, shader:str ):
+        """returns ( text, dependencies ), dependencies includes the shader itself"""
+        shader  = os.path.abspath( shader )
+        sources  = [ shader ]
+        included = set()
+        out      = []
+        stack    = []
+        # nesting of conditional blocks at the current line, across files
+        depth    = [ 0 ]
+
+        def emit( path:str, index:int ):
+            stack.append( path )
+            for number, line in enumerate( self.read( path ), 1 ):
+                if is_directive( line, "if" ) or is_directive( line, "ifdef" ) or is_directive( line, "ifndef" ):
+                    depth[0] += 1
+                elif is_directive( line, "endif" ):
+                    depth[0] = max( depth[0] - 1, 0 )
+
+                target = include_target( line )
+                if target is not None:
+                    resolved = self.resolve( target, path )
+                    if resolved in stack:
+                        chain = " -> ".join( os.path.relpath( p, self.root ) for p in stack + [ resolved ] )
+                        raise IncludeError( "circular include: " + chain )
+                    if resolved in included:
+                        out.append( "// " + line.strip() + " (already included)" )
+                        continue
+                    if depth[0] == 0:
+                        included.add( resolved )
+                    if not( resolved in sources ):
+                        sources.append( resolved )
+                    out.append( "#line 1 " + str(sources.index( resolved )) )
+                    emit( resolved, sources.index( resolved ) )
+                    out.append( "#line " + str(number + 1) + " " + str(index) )
+                elif index != 0 and ( is_directive( line, "version" ) or ( is_directive( line, "pragma" ) and "once" in line ) ):
+                    out.append( "// " + line.strip() )
+                else:
+                    out.append( line )
+            stack.pop()
+
+        emit( shader, 0 )
+
+        out.append( "" )
+        out.append( "// source strings:" )
+        for index, path in enumerate( sources ):
+            out.append( "//   " + str(index) + ": " + os.path.relpath( path, self.root ).replace( "\\", "/" ) )
+        return "\n".join( out ) + "\n", sources
+
+def define_line( define:str ) -> str:
+    # NAME or NAME=VALUE, like -D on a C compiler
+    name, _, value = define.partition( "=" )
+    if value == "":
+        value = "1"
+    return "#define " + name.strip() + " " + value.strip()
+
+def insert_defines( text:str, defines:list ) -> str:
+    """inserts a #define block right after the #version line of text,
+    followed by a #line directive so line numbers of source string 0 stay intact"""
+    if len( defines ) == 0:
+        return text
+
+    lines = text.split( "\n" )
+    at = 0
+    for idx, line in enumerate( lines ):
+        if is_directive( line, "version" ):
+            at = idx + 1
+            break
+
+    block = [ define_line( define ) for define in defines ]
+    block.append( "#line " + str(at + 1) + " 0" )
+    return "\n".join( lines[:at] + block + lines[at:] )
+
+def file_stamp( path:str ):
+    try:
+        st = os.stat( path )
+        return [ st.st_mtime_ns, st.st_size ]
+    except OSError:
+        return None
+
+def load_cache( output_dir:str ) -> dict:
+    try:
+        with open( os.path.join( output_dir, cache_name ), "r" ) as read_file:
+            cache = json.load( read_file )
+        if isinstance( cache, dict ):
+            return cache
+    except ( OSError, ValueError ):
+        pass
+    return {}
+
+def save_cache( output_dir:str, cache:dict ):
+    with open( os.path.join( output_dir, cache_name ), "w", newline='\n' ) as write_file:
+        json.dump( cache, write_file, indent=1, sort_keys=True )
+
+def up_to_date( entry, output_path:str ) -> bool:
+    if not( isinstance( entry, dict ) ) or not( os.path.isfile( output_path ) ):
+        return False
+    for path, stamp in entry.get( "deps", {} ).items():
+        if file_stamp( path ) != stamp:
+            return False
+    return len( entry.get( "deps", {} ) ) != 0
+
+def flatten_tree( root:str, output_dir:str, force:bool = False ):
+    """flattens every shader under root into output_dir.
+    returns ( flattened, unchanged, failed ), failed is a list of ( path, error )"""
+    flattener = Flattener( root )
+    cache     = {} if force else load_cache( output_dir )
+    new_cache = {}
+
+    flattened = []
+    unchanged = []
+    failed    = []
+    for shader in find_shaders( root, output_dir ):
+        rel         = os.path.relpath( shader, root ).replace( "\\", "/" )
+        output_path = os.path.join( output_dir, rel )
+
+        if up_to_date( cache.get( rel ), output_path ):
+            new_cache[rel] = cache[rel]
+            unchanged.append( rel )
+            continue
+
+        try:
+            text, deps = flattener.flatten( shader )
+            os.makedirs( os.path.dirname( output_path ) or ".", exist_ok=True )
+            with open( output_path, "w", newline='\n' ) as write_file:
+                write_file.write( text )
+        except ( IncludeError, OSError ) as err:
+            failed.append( ( rel, str(err) ) )
+            continue
+
+        new_cache[rel] = { "deps": { path: file_stamp( path ) for path in deps } }
+        flattened.append( rel )
+
+    os.makedirs( output_dir, exist_ok=True )
+    save_cache( output_dir, new_cache )
+    return flattened, unchanged, failed
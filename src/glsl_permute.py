@@ -0,0 +1,551 @@
+# * Description:  Shader permutation generator with preprocessed output dedup
+# * Author:       Alicia Amarilla ( smushyaa@gmail.com )
+# * File Created: October 19, 2026
+
+import os
+import glsl_flatten
+import glsl_bundle
+
+# permutation spec, .json or .toml:
+#   root     directory shaders and includes are relative to. default = directory of the spec
+#   shaders  list of shader paths relative to root
+#   axes     list of tables with a "name" and optional "values"
+#            an axis without values is a switch, off leaves the define out
+#            and on writes #define NAME 1
+#            an axis with values writes #define NAME <value> for each value
+#
+# every combination of axis values is flattened, the define block is inserted
+# after #version and conditionals are resolved. combinations whose resolved
+# source (comments and blank lines removed, macros expanded) is
+# identical share one variant file, <shader>.<variant id><ext> in the output directory.
+#
+# each axis takes enough bits of the permutation mask to index its values,
+# the first axis starts at bit 0. the generated header maps every mask to a
+# variant id, masks with an out of range value index map to the invalid id.
+
+max_mask_bits = 16
+
+class PermuteError( Exception ):
+    pass
+
+class Axis:
+    def __init__( self, name:str, values ):
+        self.name   = name
+        self.switch = values is None
+        self.values = [ 0, 1 ] if values is None else values
+        self.bits   = max( 1, ( len( self.values ) - 1 ).bit_length() )
+        self.shift  = 0
+
+    def define( self, index:int ):
+        # returns the define for --define style insertion, None when the switch is off
+        if self.switch:
+            return self.name if index != 0 else None
+        return self.name + "=" + str(self.values[index])
+
+def load_spec( path:str ):
+    """returns ( root, shaders, axes )"""
+    try:
+        with open( path, "rb" ) as read_file:
+            data = read_file.read()
+    except OSError as err:
+        raise PermuteError( str(err) )
+
+    if os.path.splitext( path )[1].lower() == ".toml":
+        import tomllib
+        try:
+            spec = tomllib.loads( data.decode( "utf-8" ) )
+        except ( ValueError, UnicodeDecodeError ) as err:
+            raise PermuteError( "invalid toml spec: " + str(err) )
+    else:
+        import json
+        try:
+            spec = json.loads( data )
+        except ValueError as err:
+            raise PermuteError( "invalid json spec: " + str(err) )
+
+    if not( isinstance( spec, dict ) ):
+        raise PermuteError( "permutation spec must be a table" )
+
+    root = os.path.join( os.path.dirname( path ), spec.get( "root", "." ) )
+    shaders = spec.get( "shaders" )
+    if not( isinstance( shaders, list ) ) or len( shaders ) == 0 or not( all( isinstance( s, str ) for s in shaders ) ):
+        raise PermuteError( "spec \"shaders\" must be a non empty list of paths" )
+    for shader in shaders:
+        if not( os.path.splitext( shader )[1] in glsl_flatten.shader_stages ):
+            raise PermuteError( "\"" + shader + "\" is not a shader file" )
+
+    axes  = []
+    names = set()
+    for idx, item in enumerate( spec.get( "axes", [] ) ):
+        if isinstance( item, str ):
+            item = { "name": item }
+        if not( isinstance( item, dict ) ) or not( isinstance( item.get( "name" ), str ) ) or item["name"] == "":
+            raise PermuteError( "spec axis " + str(idx) + " has no name" )
+        values = item.get( "values" )
+        if values is not None:
+            if not( isinstance( values, list ) ) or len( values ) == 0:
+                raise PermuteError( "values of axis \"" + item["name"] + "\" must be a non empty list" )
+            if not( all( isinstance( v, ( int, str ) ) and not( isinstance( v, bool ) ) for v in values ) ):
+                raise PermuteError( "values of axis \"" + item["name"] + "\" must be numbers or strings" )
+        if item["name"] in names:
+            raise PermuteError( "axis \"" + item["name"] + "\" is defined twice" )
+        names.add( item["name"] )
+        axes.append( Axis( item["name"], values ) )
+
+    shift = 0
+    for axis in axes:
+        axis.shift = shift
+        shift     += axis.bits
+    if shift > max_mask_bits:
+        raise PermuteError( "axes need " + str(shift) + " mask bits, at most " + str(max_mask_bits) + " are supported" )
+
+    return root, shaders, axes
+
+# conditional evaluation
+
+def strip_comments( text:str ) -> list:
+    lines    = []
+    in_block = False
+    for line in text.split( "\n" ):
+        out = ""
+        idx = 0
+        while idx < len( line ):
+            if in_block:
+                end = line.find( "*/", idx )
+                if end < 0:
+                    idx = len( line )
+                else:
+                    in_block = False
+                    idx      = end + 2
+                    out     += " "
+            elif line.startswith( "//", idx ):
+                break
+            elif line.startswith( "/*", idx ):
+                in_block = True
+                idx     += 2
+            else:
+                out += line[idx]
+                idx += 1
+        lines.append( out )
+    return lines
+
+operators = [ "<<", ">>", "<=", ">=", "==", "!=", "&&", "||" ]
+
+def tokenize( text:str ) -> list:
+    tokens = []
+    idx    = 0
+    while idx < len( text ):
+        c = text[idx]
+        if c.isspace():
+            idx += 1
+        elif c.isalpha() or c == "_":
+            end = idx + 1
+            while end < len( text ) and ( text[end].isalnum() or text[end] == "_" ):
+                end += 1
+            tokens.append( text[idx:end] )
+            idx = end
+        elif c.isdigit():
+            end = idx + 1
+            while end < len( text ) and ( text[end].isalnum() or text[end] == "." ):
+                end += 1
+            tokens.append( text[idx:end] )
+            idx = end
+        elif text[idx:idx + 2] in operators:
+            tokens.append( text[idx:idx + 2] )
+            idx += 2
+        else:
+            tokens.append( c )
+            idx += 1
+    return tokens
+
+def is_identifier( token:str ) -> bool:
+    return token[0].isalpha() or token[0] == "_"
+
+def call_arguments( tokens:list, idx:int, name:str ):
+    """tokens[idx] is the ( of a macro call, returns ( arguments, index after the ) )"""
+    args  = [ [] ]
+    depth = 0
+    idx  += 1
+    while idx < len( tokens ):
+        token = tokens[idx]
+        idx  += 1
+        if token == ")" and depth == 0:
+            return args, idx
+        if token == "," and depth == 0:
+            args.append( [] )
+            continue
+        if token == "(":
+            depth += 1
+        elif token == ")":
+            depth -= 1
+        args[-1].append( token )
+    raise PermuteError( "unterminated call of macro \"" + name + "\"" )
+
+def paste( tokens:list ) -> list:
+    # GLSL token pasting, the tokenizer splits ## into two #
+    out = []
+    idx = 0
+    while idx < len( tokens ):
+        if tokens[idx] == "#" and idx + 1 < len( tokens ) and tokens[idx + 1] == "#" and len( out ) != 0 and idx + 2 < len( tokens ):
+            out[-1] += tokens[idx + 2]
+            idx     += 3
+        else:
+            out.append( tokens[idx] )
+            idx += 1
+    return out
+
+def expand( tokens:list, macros:dict, active:tuple = () ) -> list:
+    # object like macros are strings, function like macros ( parameters, body ).
+    # a macro is never expanded inside itself
+    out = []
+    idx = 0
+    while idx < len( tokens ):
+        token = tokens[idx]
+        value = macros.get( token )
+        idx  += 1
+        if value is None or token in active:
+            out.append( token )
+        elif isinstance( value, str ):
+            out += expand( tokenize( value ), macros, active + ( token, ) )
+        elif idx < len( tokens ) and tokens[idx] == "(":
+            params, body = value
+            args, idx = call_arguments( tokens, idx, token )
+            if len( params ) == 0 and args == [ [] ]:
+                args = []
+            if len( args ) != len( params ):
+                raise PermuteError( "macro \"" + token + "\" takes " + str(len( params )) + " arguments, " + str(len( args )) + " given" )
+            # arguments are fully expanded before substitution
+            values = { param: expand( arg, macros, active ) for param, arg in zip( params, args ) }
+            result = []
+            for body_token in tokenize( body ):
+                result += values.get( body_token, [ body_token ] )
+            out += expand( paste( result ), macros, active + ( token, ) )
+        else:
+            # a function like macro name without arguments is left alone
+            out.append( token )
+    return out
+
+def parse_define( rest:str ):
+    """returns ( name, value ) of a #define, see expand for the value"""
+    name = tokenize( rest )[0] if rest != "" else ""
+    body = rest[len( name ):]
+    if not( body.startswith( "(" ) ):
+        return name, body.strip()
+    end = body.find( ")" )
+    if end < 0:
+        raise PermuteError( "unterminated parameter list of macro \"" + name + "\"" )
+    params = [ param.strip() for param in body[1:end].split( "," ) ]
+    if params == [ "" ]:
+        params = []
+    if not( all( param != "" and is_identifier( param ) for param in params ) ):
+        raise PermuteError( "invalid parameter list of macro \"" + name + "\"" )
+    return name, ( params, body[end + 1:].strip() )
+
+binary_precedence = {
+    "||": 1, "&&": 2, "|": 3, "^": 4, "&": 5,
+    "==": 6, "!=": 6, "<": 7, ">": 7, "<=": 7, ">=": 7,
+    "<<": 8, ">>": 8, "+": 9, "-": 9, "*": 10, "/": 10, "%": 10,
+}
+
+def number( token:str ) -> int:
+    digits = token.rstrip( "uUlL" )
+    try:
+        if digits.lower().startswith( "0x" ):
+            return int( digits, 16 )
+        if len( digits ) > 1 and digits.startswith( "0" ):
+            return int( digits, 8 )
+        return int( digits )
+    except ValueError:
+        raise PermuteError( "invalid number \"" + token + "\" in #if" )
+
+class Expression:
+    def __init__( self, tokens:list ):
+        self.tokens = tokens
+        self.pos    = 0
+
+    def peek( self ):
+        return self.tokens[self.pos] if self.pos < len( self.tokens ) else None
+
+    def take( self ) -> str:
+        token = self.peek()
+        if token is None:
+            raise PermuteError( "unexpected end of #if expression" )
+        self.pos += 1
+        return token
+
+    def evaluate( self ) -> int:
+        value = self.ternary()
+        if self.peek() is not None:
+            raise PermuteError( "unexpected \"" + self.peek() + "\" in #if expression" )
+        return value
+
+    def ternary( self ) -> int:
+        cond = self.binary( 1 )
+        if self.peek() != "?":
+            return cond
+        self.take()
+        a = self.ternary()
+        if self.take() != ":":
+            raise PermuteError( "expected : in #if expression" )
+        b = self.ternary()
+        return a if cond else b
+
+    def binary( self, min_precedence:int ) -> int:
+        left = self.unary()
+        while True:
+            op = self.peek()
+            precedence = binary_precedence.get( op, 0 )
+            if precedence < min_precedence:
+                return left
+            self.take()
+            right = self.binary( precedence + 1 )
+            left  = apply( op, left, right )
+
+    def unary( self ) -> int:
+        token = self.take()
+        if token == "!":
+            return int( not( self.unary() ) )
+        if token == "-":
+            return -self.unary()
+        if token == "+":
+            return self.unary()
+        if token == "~":
+            return ~self.unary()
+        if token == "(":
+            value = self.ternary()
+            if self.take() != ")":
+                raise PermuteError( "expected ) in #if expression" )
+            return value
+        if token[0].isdigit():
+            return number( token )
+        if is_identifier( token ):
+            # identifiers left after expansion are undefined, like in C
+            return 0
+        raise PermuteError( "unexpected \"" + token + "\" in #if expression" )
+
+def apply( op:str, a:int, b:int ) -> int:
+    if op in ( "/", "%" ) and b == 0:
+        raise PermuteError( "division by zero in #if expression" )
+    match op:
+        case "||": return int( bool( a ) or bool( b ) )
+        case "&&": return int( bool( a ) and bool( b ) )
+        case "|":  return a | b
+        case "^":  return a ^ b
+        case "&":  return a & b
+        case "==": return int( a == b )
+        case "!=": return int( a != b )
+        case "<":  return int( a < b )
+        case ">":  return int( a > b )
+        case "<=": return int( a <= b )
+        case ">=": return int( a >= b )
+        case "<<": return a << b
+        case ">>": return a >> b
+        case "+":  return a + b
+        case "-":  return a - b
+        case "*":  return a * b
+        case "/":  return int( a / b )
+        case "%":  return a - b * int( a / b )
+
+def evaluate( expression:str, macros:dict ) -> int:
+    tokens   = tokenize( expression )
+    resolved = []
+    idx      = 0
+    while idx < len( tokens ):
+        if tokens[idx] == "defined":
+            if idx + 1 < len( tokens ) and tokens[idx + 1] == "(":
+                if idx + 3 >= len( tokens ) or tokens[idx + 3] != ")":
+                    raise PermuteError( "malformed defined() in #if expression" )
+                name = tokens[idx + 2]
+                idx += 4
+            elif idx + 1 < len( tokens ):
+                name = tokens[idx + 1]
+                idx += 2
+            else:
+                raise PermuteError( "malformed defined in #if expression" )
+            resolved.append( "1" if name in macros else "0" )
+        else:
+            resolved.append( tokens[idx] )
+            idx += 1
+    return Expression( expand( resolved, macros ) ).evaluate()
+
+def preprocess( text:str ) -> str:
+    """resolves conditionals and macros of text.
+    returns the active lines with comments, blank lines, #define, #undef and #line removed"""
+    macros = {}
+    out    = []
+    # every entry is ( parent active, branch taken, active )
+    stack  = []
+    active = True
+
+    for number, line in enumerate( strip_comments( text ), 1 ):
+        stripped = line.strip()
+        if stripped == "":
+            continue
+        if not( stripped.startswith( "#" ) ):
+            if active:
+                out.append( " ".join( expand( tokenize( stripped ), macros ) ) )
+            continue
+
+        # any whitespace separates the directive from its arguments, "#define\tX 1" included
+        parts     = stripped[1:].split( None, 1 ) + [ "", "" ]
+        directive = parts[0]
+        rest      = parts[1].strip()
+        try:
+            match directive:
+                case "if" | "ifdef" | "ifndef":
+                    if directive == "ifdef":
+                        value = rest.split()[0] in macros if rest != "" else False
+                    elif directive == "ifndef":
+                        value = not( rest.split()[0] in macros ) if rest != "" else False
+                    else:
+                        value = active and evaluate( rest, macros ) != 0
+                    stack.append( ( active, active and value, active and value ) )
+                case "elif":
+                    if len( stack ) == 0:
+                        raise PermuteError( "#elif without #if" )
+                    parent, taken, _ = stack.pop()
+                    value = parent and not( taken ) and evaluate( rest, macros ) != 0
+                    stack.append( ( parent, taken or value, value ) )
+                case "else":
+                    if len( stack ) == 0:
+                        raise PermuteError( "#else without #if" )
+                    parent, taken, _ = stack.pop()
+                    stack.append( ( parent, True, parent and not( taken ) ) )
+                case "endif":
+                    if len( stack ) == 0:
+                        raise PermuteError( "#endif without #if" )
+                    stack.pop()
+                case "define":
+                    if active:
+                        name, value = parse_define( rest )
+                        macros[name] = value
+                case "undef":
+                    if active and rest != "":
+                        macros.pop( rest.split()[0], None )
+                case "line":
+                    pass
+                case _:
+                    if active:
+                        out.append( " ".join( stripped.split() ) )
+        except PermuteError as err:
+            raise PermuteError( "line " + str(number) + ": " + str(err) )
+        active = stack[-1][2] if len( stack ) != 0 else True
+
+    if len( stack ) != 0:
+        raise PermuteError( "unterminated #if" )
+    return "\n".join( out )
+
+# generation
+
+def combinations( axes:list ) -> list:
+    """returns a list of ( mask, defines ) for every combination of axis values"""
+    result = [ ( 0, [] ) ]
+    for axis in axes:
+        result = [
+            ( mask | ( index << axis.shift ), defines + ( [ axis.define( index ) ] if axis.define( index ) is not None else [] ) )
+            for mask, defines in result
+            for index in range( len( axis.values ) )
+        ]
+    return sorted( result )
+
+def variant_name( rel:str, variant:int ) -> str:
+    base, ext = os.path.splitext( rel )
+    return base + "." + str(variant) + ext
+
+def permute_shader( flattener, shader:str, axes:list ):
+    """returns ( variants, table ), variants is a list of ( variant text, defines )
+    and table maps every valid mask to its variant id"""
+    text, _  = flattener.flatten( shader )
+    variants = []
+    seen     = {}
+    table    = {}
+    for mask, defines in combinations( axes ):
+        source = glsl_flatten.insert_defines( text, defines )
+        try:
+            key = preprocess( source )
+        except PermuteError as err:
+            raise PermuteError( os.path.relpath( shader, flattener.root ) + ": " + str(err) )
+        variant = seen.get( key )
+        if variant is None:
+            variant   = len( variants )
+            seen[key] = variant
+            variants.append( ( source, defines ) )
+        table[mask] = variant
+    return variants, table
+
+def render_header( spec_name:str, axes:list, shaders:list, context:dict ) -> str:
+    """shaders is a list of ( rel, variants, table )"""
+    import templates
+
+    prefix = glsl_bundle.identifier( spec_name )
+    lower  = prefix.lower()
+    bits   = sum( axis.bits for axis in axes )
+
+    body  = "#define " + prefix + "_MASK_BITS " + str(bits) + "\n"
+    body += "#define " + prefix + "_MASK_COUNT " + str(1 << bits) + "\n\n"
+    for axis in axes:
+        ident = prefix + "_" + glsl_bundle.identifier( axis.name )
+        body += "#define " + ident + "_SHIFT " + str(axis.shift) + "\n"
+        body += "#define " + ident + "_MASK 0x{:x}u\n".format( ( ( 1 << axis.bits ) - 1 ) << axis.shift )
+        if not( axis.switch ):
+            body += "/* " + axis.name + ": " + ", ".join(
+                str(index) + " = " + str(value) for index, value in enumerate( axis.values )
+            ) + " */\n"
+    if len( axes ) != 0:
+        body += "\n"
+
+    body += "/* variant id of a permutation mask, ( value index << AXIS_SHIFT ) | ... */\n"
+    body += "#define " + lower + "_variant( table, mask ) ((table)[(mask) & (" + prefix + "_MASK_COUNT - 1)])\n\n"
+
+    for rel, variants, table in shaders:
+        ident   = prefix + "_" + glsl_bundle.identifier( rel )
+        invalid = 0xff if len( variants ) < 0xff else 0xffff
+        kind    = "unsigned char" if invalid == 0xff else "unsigned short"
+
+        body += "/* " + rel + " */\n"
+        body += "#define " + ident + "_VARIANT_COUNT " + str(len( variants )) + "\n"
+        body += "#define " + ident + "_INVALID 0x{:x}\n".format( invalid )
+        body += "static const " + kind + " " + ident + "_VARIANTS[" + prefix + "_MASK_COUNT] = {"
+        for mask in range( 1 << bits ):
+            if mask % 16 == 0:
+                body += "\n   "
+            body += " " + str(table.get( mask, invalid )) + ","
+        body += "\n};\n"
+        body += "static const char* const " + ident + "_VARIANT_FILES[" + ident + "_VARIANT_COUNT] = {\n"
+        for variant in range( len( variants ) ):
+            body += "    \"" + variant_name( rel, variant ) + "\",\n"
+        body += "};\n\n"
+
+    return templates.render( "glsl_permute_header", body=body.rstrip( "\n" ) + "\n", spec=spec_name, **context )
+
+def permute_spec( spec_path:str, output_dir:str, context:dict ):
+    """writes every unique variant and <output_dir>/<spec name>.h.
+    returns ( header path, permutation count, variant count )"""
+    root, shaders, axes = load_spec( spec_path )
+    spec_name = os.path.splitext( os.path.basename( spec_path ) )[0]
+    flattener = glsl_flatten.Flattener( root )
+
+    results = []
+    files   = []
+    for shader in shaders:
+        rel = shader.replace( "\\", "/" )
+        try:
+            variants, table = permute_shader( flattener, os.path.join( root, shader ), axes )
+        except glsl_flatten.IncludeError as err:
+            raise PermuteError( rel + ": " + str(err) )
+        results.append( ( rel, variants, table ) )
+        for variant, ( source, _ ) in enumerate( variants ):
+            files.append( ( os.path.join( output_dir, variant_name( rel, variant ) ), source ) )
+
+    for path, source in files:
+        os.makedirs( os.path.dirname( path ) or ".", exist_ok=True )
+        with open( path, "w", newline='\n' ) as write_file:
+            write_file.write( source )
+
+    header_path = os.path.join( output_dir, spec_name + ".h" )
+    os.makedirs( output_dir, exist_ok=True )
+    with open( header_path, "w", newline='\n' ) as write_file:
+        write_file.write( render_header( spec_name, axes, results, context ) )
+
+    permutations = sum( len( table ) for _, _, table in results )
+    return header_path, permutations, len( files )
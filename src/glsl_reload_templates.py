@@ -0,0 +1,318 @@
+# * Description:  Built-in templates of glnew --hot_reload, imported by templates.py on first use
+# * Author:       Alicia Amarilla ( smushyaa@gmail.com )
+# * File Created: October 19, 2026
+
+builtin = {
+    # glnew --hot_reload, lower and upper are the module name in lower and upper case
+    "glsl_reload_header": (
+        "{{info}}{{guard_begin}}\n"
+        "\n"
+        "/* shader hot reload, generated by glnew --hot_reload\n"
+        " *\n"
+        " * on linux the shader directory and its subdirectories are watched with\n"
+        " * inotify, elsewhere (or when inotify is unavailable) the files of every\n"
+        " * registered program are polled for a new modification time.\n"
+        " * changes are queued and programs are rebuilt in {{lower}}_frame(), call it\n"
+        " * once per frame on the render thread. a program that fails to build keeps\n"
+        " * its last good handle. a changed file that is not a stage of any program\n"
+        " * (an include) rebuilds every program.\n"
+        " *\n"
+        " * the module makes no graphics api calls, programs are built and destroyed\n"
+        " * through the callbacks given to {{lower}}_init(). */\n"
+        "\n"
+        "#define {{upper}}_MAX_PROGRAMS 64\n"
+        "#define {{upper}}_MAX_PATH     256\n"
+        "#define {{upper}}_MAX_STAGES   3\n"
+        "\n"
+        "/* builds a program from up to MAX_STAGES shader paths, unused stages are NULL.\n"
+        " * returns the program handle, or 0 after writing a message to log */\n"
+        "typedef unsigned int {{lower}}_build_fn(\n"
+        "    const char* const paths[{{upper}}_MAX_STAGES], char* log, int log_size, void* user );\n"
+        "/* releases a handle returned by build */\n"
+        "typedef void {{lower}}_destroy_fn( unsigned int handle, void* user );\n"
+        "\n"
+        "typedef struct {{lower}}_program {\n"
+        "    unsigned int handle;\n"
+        "    int          failed;\n"
+        "    int          dirty;\n"
+        "    char         paths[{{upper}}_MAX_STAGES][{{upper}}_MAX_PATH];\n"
+        "    long long    stamps[{{upper}}_MAX_STAGES];\n"
+        "} {{lower}}_program;\n"
+        "\n"
+        "/* returns 1 when shader_dir is watched with inotify, 0 when files are polled */\n"
+        "int {{lower}}_init(\n"
+        "    const char* shader_dir, {{lower}}_build_fn* build, {{lower}}_destroy_fn* destroy, void* user );\n"
+        "/* paths are relative to shader_dir, pass NULL for unused stages.\n"
+        " * the program is built immediately, returns NULL when MAX_PROGRAMS is reached */\n"
+        "{{lower}}_program* {{lower}}_register( const char* vertex, const char* fragment, const char* compute );\n"
+        "/* rebuilds programs whose files changed, returns the number of successful rebuilds */\n"
+        "int {{lower}}_frame( void );\n"
+        "/* destroys every program and stops watching */\n"
+        "void {{lower}}_shutdown( void );\n"
+        "{{guard_end}}"
+    ),
+    "glsl_reload_source": (
+        "{{info}}#if defined(__linux__) && !defined(_DEFAULT_SOURCE)\n"
+        "    /* inotify, dirent and snprintf under -std=c99 */\n"
+        "    #define _DEFAULT_SOURCE\n"
+        "#endif\n"
+        "#include \"{{include}}\"\n"
+        "\n"
+        "#include <stdio.h>\n"
+        "#include <string.h>\n"
+        "#include <sys/stat.h>\n"
+        "\n"
+        "#if defined(__linux__)\n"
+        "    #include <dirent.h>\n"
+        "    #include <unistd.h>\n"
+        "    #include <sys/inotify.h>\n"
+        "    #define {{upper}}_INOTIFY 1\n"
+        "    #define {{upper}}_MAX_WATCHES 128\n"
+        "#endif\n"
+        "\n"
+        "static struct {\n"
+        "    char                 dir[{{upper}}_MAX_PATH];\n"
+        "    {{lower}}_build_fn*   build;\n"
+        "    {{lower}}_destroy_fn* destroy;\n"
+        "    void*                user;\n"
+        "    {{lower}}_program     programs[{{upper}}_MAX_PROGRAMS];\n"
+        "    int                  count;\n"
+        "    int                  poll;\n"
+        "#if defined({{upper}}_INOTIFY)\n"
+        "    int                  fd;\n"
+        "    int                  watch_count;\n"
+        "    int                  watches[{{upper}}_MAX_WATCHES];\n"
+        "    char                 watch_dirs[{{upper}}_MAX_WATCHES][{{upper}}_MAX_PATH];\n"
+        "#endif\n"
+        "} {{lower}}_state;\n"
+        "\n"
+        "static long long {{lower}}_stamp( const char* path ) {\n"
+        "    struct stat st;\n"
+        "    if( path[0] == 0 || stat( path, &st ) != 0 ) {\n"
+        "        return -1;\n"
+        "    }\n"
+        "    return (long long)st.st_mtime;\n"
+        "}\n"
+        "\n"
+        "static int {{lower}}_build( {{lower}}_program* program ) {\n"
+        "    const char* paths[{{upper}}_MAX_STAGES];\n"
+        "    char log[1024];\n"
+        "    unsigned int handle;\n"
+        "    int i;\n"
+        "\n"
+        "    for( i = 0; i < {{upper}}_MAX_STAGES; ++i ) {\n"
+        "        paths[i] = program->paths[i][0] ? program->paths[i] : NULL;\n"
+        "    }\n"
+        "    log[0] = 0;\n"
+        "    program->dirty = 0;\n"
+        "\n"
+        "    handle = {{lower}}_state.build( paths, log, (int)sizeof(log), {{lower}}_state.user );\n"
+        "    if( !handle ) {\n"
+        "        /* keep the last good program */\n"
+        "        program->failed = 1;\n"
+        "        fprintf( stderr, \"{{lower}}: build failed, keeping last good program\\n%s\\n\", log );\n"
+        "        return 0;\n"
+        "    }\n"
+        "\n"
+        "    if( program->handle && {{lower}}_state.destroy ) {\n"
+        "        {{lower}}_state.destroy( program->handle, {{lower}}_state.user );\n"
+        "    }\n"
+        "    program->handle = handle;\n"
+        "    program->failed = 0;\n"
+        "    return 1;\n"
+        "}\n"
+        "\n"
+        "#if defined({{upper}}_INOTIFY)\n"
+        "static void {{lower}}_watch( const char* dir ) {\n"
+        "    DIR* handle;\n"
+        "    struct dirent* entry;\n"
+        "    struct stat st;\n"
+        "    char path[{{upper}}_MAX_PATH];\n"
+        "    int wd;\n"
+        "\n"
+        "    if( {{lower}}_state.watch_count == {{upper}}_MAX_WATCHES ) {\n"
+        "        return;\n"
+        "    }\n"
+        "    wd = inotify_add_watch( {{lower}}_state.fd, dir, IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE );\n"
+        "    if( wd < 0 ) {\n"
+        "        return;\n"
+        "    }\n"
+        "    {{lower}}_state.watches[{{lower}}_state.watch_count] = wd;\n"
+        "    snprintf( {{lower}}_state.watch_dirs[{{lower}}_state.watch_count], {{upper}}_MAX_PATH, \"%s\", dir );\n"
+        "    {{lower}}_state.watch_count++;\n"
+        "\n"
+        "    handle = opendir( dir );\n"
+        "    if( !handle ) {\n"
+        "        return;\n"
+        "    }\n"
+        "    while( (entry = readdir( handle )) ) {\n"
+        "        if( entry->d_name[0] == '.' ) {\n"
+        "            continue;\n"
+        "        }\n"
+        "        if( snprintf( path, sizeof(path), \"%s/%s\", dir, entry->d_name ) >= (int)sizeof(path) ) {\n"
+        "            continue;\n"
+        "        }\n"
+        "        if( stat( path, &st ) == 0 && S_ISDIR( st.st_mode ) ) {\n"
+        "            {{lower}}_watch( path );\n"
+        "        }\n"
+        "    }\n"
+        "    closedir( handle );\n"
+        "}\n"
+        "\n"
+        "static const char* {{lower}}_watch_dir( int wd ) {\n"
+        "    int i;\n"
+        "    for( i = 0; i < {{lower}}_state.watch_count; ++i ) {\n"
+        "        if( {{lower}}_state.watches[i] == wd ) {\n"
+        "            return {{lower}}_state.watch_dirs[i];\n"
+        "        }\n"
+        "    }\n"
+        "    return NULL;\n"
+        "}\n"
+        "\n"
+        "static void {{lower}}_changed( const char* path ) {\n"
+        "    int i, stage, found = 0;\n"
+        "    for( i = 0; i < {{lower}}_state.count; ++i ) {\n"
+        "        for( stage = 0; stage < {{upper}}_MAX_STAGES; ++stage ) {\n"
+        "            if( strcmp( {{lower}}_state.programs[i].paths[stage], path ) == 0 ) {\n"
+        "                {{lower}}_state.programs[i].dirty = 1;\n"
+        "                found = 1;\n"
+        "            }\n"
+        "        }\n"
+        "    }\n"
+        "    if( !found ) {\n"
+        "        /* most likely an include, rebuild everything */\n"
+        "        for( i = 0; i < {{lower}}_state.count; ++i ) {\n"
+        "            {{lower}}_state.programs[i].dirty = 1;\n"
+        "        }\n"
+        "    }\n"
+        "}\n"
+        "#endif\n"
+        "\n"
+        "static void {{lower}}_poll( void ) {\n"
+        "    int i, stage;\n"
+        "    long long stamp;\n"
+        "    for( i = 0; i < {{lower}}_state.count; ++i ) {\n"
+        "        {{lower}}_program* program = &{{lower}}_state.programs[i];\n"
+        "        for( stage = 0; stage < {{upper}}_MAX_STAGES; ++stage ) {\n"
+        "            if( !program->paths[stage][0] ) {\n"
+        "                continue;\n"
+        "            }\n"
+        "            stamp = {{lower}}_stamp( program->paths[stage] );\n"
+        "            if( stamp != program->stamps[stage] ) {\n"
+        "                program->stamps[stage] = stamp;\n"
+        "                program->dirty = 1;\n"
+        "            }\n"
+        "        }\n"
+        "    }\n"
+        "}\n"
+        "\n"
+        "int {{lower}}_init(\n"
+        "    const char* shader_dir, {{lower}}_build_fn* build, {{lower}}_destroy_fn* destroy, void* user\n"
+        ") {\n"
+        "    memset( &{{lower}}_state, 0, sizeof({{lower}}_state) );\n"
+        "    snprintf( {{lower}}_state.dir, {{upper}}_MAX_PATH, \"%s\", shader_dir );\n"
+        "    {{lower}}_state.build   = build;\n"
+        "    {{lower}}_state.destroy = destroy;\n"
+        "    {{lower}}_state.user    = user;\n"
+        "    {{lower}}_state.poll    = 1;\n"
+        "\n"
+        "#if defined({{upper}}_INOTIFY)\n"
+        "    {{lower}}_state.fd = inotify_init1( IN_NONBLOCK | IN_CLOEXEC );\n"
+        "    if( {{lower}}_state.fd >= 0 ) {\n"
+        "        {{lower}}_watch( shader_dir );\n"
+        "        if( {{lower}}_state.watch_count != 0 ) {\n"
+        "            {{lower}}_state.poll = 0;\n"
+        "        } else {\n"
+        "            close( {{lower}}_state.fd );\n"
+        "            {{lower}}_state.fd = -1;\n"
+        "        }\n"
+        "    }\n"
+        "#endif\n"
+        "    return !{{lower}}_state.poll;\n"
+        "}\n"
+        "\n"
+        "{{lower}}_program* {{lower}}_register( const char* vertex, const char* fragment, const char* compute ) {\n"
+        "    const char* names[{{upper}}_MAX_STAGES];\n"
+        "    {{lower}}_program* program;\n"
+        "    int stage;\n"
+        "\n"
+        "    if( {{lower}}_state.count == {{upper}}_MAX_PROGRAMS ) {\n"
+        "        return NULL;\n"
+        "    }\n"
+        "    names[0] = vertex;\n"
+        "    names[1] = fragment;\n"
+        "    names[2] = compute;\n"
+        "\n"
+        "    program = &{{lower}}_state.programs[{{lower}}_state.count++];\n"
+        "    memset( program, 0, sizeof(*program) );\n"
+        "    for( stage = 0; stage < {{upper}}_MAX_STAGES; ++stage ) {\n"
+        "        if( names[stage] ) {\n"
+        "            if( snprintf( program->paths[stage], {{upper}}_MAX_PATH, \"%s/%s\", {{lower}}_state.dir, names[stage] ) >= {{upper}}_MAX_PATH ) {\n"
+        "                fprintf( stderr, \"{{lower}}: path of %s is too long\\n\", names[stage] );\n"
+        "            }\n"
+        "            program->stamps[stage] = {{lower}}_stamp( program->paths[stage] );\n"
+        "        }\n"
+        "    }\n"
+        "    {{lower}}_build( program );\n"
+        "    return program;\n"
+        "}\n"
+        "\n"
+        "int {{lower}}_frame( void ) {\n"
+        "    int i, rebuilt = 0;\n"
+        "\n"
+        "    if( {{lower}}_state.poll ) {\n"
+        "        {{lower}}_poll();\n"
+        "    }\n"
+        "#if defined({{upper}}_INOTIFY)\n"
+        "    else {\n"
+        "        char buffer[4096] __attribute__(( aligned( __alignof__( struct inotify_event ) ) ));\n"
+        "        char path[{{upper}}_MAX_PATH * 2];\n"
+        "        ssize_t size;\n"
+        "        while( (size = read( {{lower}}_state.fd, buffer, sizeof(buffer) )) > 0 ) {\n"
+        "            char* at = buffer;\n"
+        "            while( at < buffer + size ) {\n"
+        "                const struct inotify_event* event = (const struct inotify_event*)at;\n"
+        "                const char* dir = {{lower}}_watch_dir( event->wd );\n"
+        "                at += sizeof(struct inotify_event) + event->len;\n"
+        "                if( !dir || !event->len ) {\n"
+        "                    continue;\n"
+        "                }\n"
+        "                if( snprintf( path, sizeof(path), \"%s/%s\", dir, event->name ) >= (int)sizeof(path) ) {\n"
+        "                    continue;\n"
+        "                }\n"
+        "                if( event->mask & IN_ISDIR ) {\n"
+        "                    if( event->mask & IN_CREATE ) {\n"
+        "                        {{lower}}_watch( path );\n"
+        "                    }\n"
+        "                } else if( !(event->mask & IN_CREATE) ) {\n"
+        "                    {{lower}}_changed( path );\n"
+        "                }\n"
+        "            }\n"
+        "        }\n"
+        "    }\n"
+        "#endif\n"
+        "\n"
+        "    for( i = 0; i < {{lower}}_state.count; ++i ) {\n"
+        "        if( {{lower}}_state.programs[i].dirty ) {\n"
+        "            rebuilt += {{lower}}_build( &{{lower}}_state.programs[i] );\n"
+        "        }\n"
+        "    }\n"
+        "    return rebuilt;\n"
+        "}\n"
+        "\n"
+        "void {{lower}}_shutdown( void ) {\n"
+        "    int i;\n"
+        "    for( i = 0; i < {{lower}}_state.count; ++i ) {\n"
+        "        if( {{lower}}_state.programs[i].handle && {{lower}}_state.destroy ) {\n"
+        "            {{lower}}_state.destroy( {{lower}}_state.programs[i].handle, {{lower}}_state.user );\n"
+        "        }\n"
+        "    }\n"
+        "#if defined({{upper}}_INOTIFY)\n"
+        "    if( {{lower}}_state.fd >= 0 && !{{lower}}_state.poll ) {\n"
+        "        close( {{lower}}_state.fd );\n"
+        "    }\n"
+        "#endif\n"
+        "    memset( &{{lower}}_state, 0, sizeof({{lower}}_state) );\n"
+        "}\n"
+    ),
+}
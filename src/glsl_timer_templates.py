@@ -0,0 +1,286 @@
+# * Description:  Built-in templates of glnew --gpu_timer, imported by templates.py on first use
+# * Author:       Alicia Amarilla ( smushyaa@gmail.com )
+# * File Created: October 19, 2026
+
+builtin = {
+    # glnew --gpu_timer, passes and pass_names are the enum and name lines of the generated passes
+    "glsl_timer_header": (
+        "{{info}}{{guard_begin}}\n"
+        "\n"
+        "/* gpu pass timers, generated by glnew --gpu_timer\n"
+        " *\n"
+        " * every pass owns one GL_TIME_ELAPSED query per frame in flight. results are\n"
+        " * read back {{upper}}_LATENCY frames after they were issued, only when\n"
+        " * GL_QUERY_RESULT_AVAILABLE says so, so the pipeline never waits on a query.\n"
+        " * a result that is still not available is counted as dropped.\n"
+        " * time elapsed queries cannot nest, begin while another pass is running is ignored.\n"
+        " * the module is C89, GLuint64 has to come from the included GL header.\n"
+        " *\n"
+        " * call {{lower}}_init() after the context is current, {{lower}}_frame() at\n"
+        " * the start of every frame and wrap passes in {{upper}}_SCOPE( pass ) or\n"
+        " * {{lower}}_begin()/{{lower}}_end(). */\n"
+        "\n"
+        "#define {{upper}}_LATENCY    {{latency}}\n"
+        "#define {{upper}}_MAX_PASSES 32\n"
+        "#define {{upper}}_MAX_NAME   32\n"
+        "#define {{upper}}_HISTORY    4096\n"
+        "\n"
+        "/* passes known at generation time, more can be added with {{lower}}_pass() */\n"
+        "enum {\n"
+        "{{passes}}    {{upper}}_PASS_COUNT\n"
+        "};\n"
+        "\n"
+        "/* nanoseconds are kept in doubles, exact up to 104 days per query */\n"
+        "typedef struct {{lower}}_stats {\n"
+        "    double        last_ns;\n"
+        "    double        min_ns;\n"
+        "    double        max_ns;\n"
+        "    double        average_ns;\n"
+        "    unsigned long samples;\n"
+        "    unsigned long dropped;\n"
+        "} {{lower}}_stats;\n"
+        "\n"
+        "/* creates the query objects and registers the generated passes, returns 0 on failure */\n"
+        "int {{lower}}_init( void );\n"
+        "void {{lower}}_shutdown( void );\n"
+        "/* reads back the results of frame - {{upper}}_LATENCY and starts a new frame */\n"
+        "void {{lower}}_frame( void );\n"
+        "/* returns the id of a named pass, registering it on first use. -1 when full */\n"
+        "int {{lower}}_pass( const char* name );\n"
+        "void {{lower}}_begin( int pass );\n"
+        "void {{lower}}_end( int pass );\n"
+        "const {{lower}}_stats* {{lower}}_get( int pass );\n"
+        "/* average in milliseconds */\n"
+        "double {{lower}}_milliseconds( int pass );\n"
+        "/* write the last {{upper}}_HISTORY samples, returns 0 on failure.\n"
+        " * csv has frame,pass,milliseconds rows. trace json can be opened in\n"
+        " * chrome://tracing or perfetto, passes are laid out back to back on a gpu time axis */\n"
+        "int {{lower}}_export_csv( const char* path );\n"
+        "int {{lower}}_export_trace( const char* path );\n"
+        "\n"
+        "/* loop flag of {{upper}}_SCOPE, declared outside the loop for C89. every scope\n"
+        " * clears it on entry and sets it on exit, nested scopes still run once each */\n"
+        "extern int {{lower}}_scope_;\n"
+        "#define {{upper}}_SCOPE( pass ) \\\n"
+        "    for( {{lower}}_scope_ = ( {{lower}}_begin( pass ), 0 ); !{{lower}}_scope_; {{lower}}_end( pass ), {{lower}}_scope_ = 1 )\n"
+        "{{guard_end}}"
+    ),
+    "glsl_timer_source": (
+        "{{info}}#include \"{{include}}\"\n"
+        "#include {{gl_include}}\n"
+        "\n"
+        "#include <stdio.h>\n"
+        "#include <string.h>\n"
+        "\n"
+        "typedef struct {{lower}}_sample {\n"
+        "    unsigned long frame;\n"
+        "    double        ns;\n"
+        "    int           pass;\n"
+        "} {{lower}}_sample;\n"
+        "\n"
+        "static struct {\n"
+        "    GLuint          queries[{{upper}}_LATENCY][{{upper}}_MAX_PASSES];\n"
+        "    unsigned char   issued[{{upper}}_LATENCY][{{upper}}_MAX_PASSES];\n"
+        "    char            names[{{upper}}_MAX_PASSES][{{upper}}_MAX_NAME];\n"
+        "    {{lower}}_stats  stats[{{upper}}_MAX_PASSES];\n"
+        "    /* ring of the last {{upper}}_HISTORY samples, next is the oldest once it is full */\n"
+        "    {{lower}}_sample history[{{upper}}_HISTORY];\n"
+        "    unsigned int    history_next;\n"
+        "    unsigned int    history_used;\n"
+        "    unsigned long   frame;\n"
+        "    int             pass_count;\n"
+        "    int             active;\n"
+        "    int             ready;\n"
+        "} {{lower}}_state;\n"
+        "\n"
+        "int {{lower}}_scope_ = 0;\n"
+        "\n"
+        "static const char* {{lower}}_generated[] = {\n"
+        "{{pass_names}}    NULL\n"
+        "};\n"
+        "\n"
+        "int {{lower}}_init( void ) {\n"
+        "    int i;\n"
+        "    memset( &{{lower}}_state, 0, sizeof({{lower}}_state) );\n"
+        "    {{lower}}_state.active = -1;\n"
+        "\n"
+        "    glGenQueries( {{upper}}_LATENCY * {{upper}}_MAX_PASSES, &{{lower}}_state.queries[0][0] );\n"
+        "    if( glGetError() != GL_NO_ERROR ) {\n"
+        "        return 0;\n"
+        "    }\n"
+        "    for( i = 0; {{lower}}_generated[i]; ++i ) {\n"
+        "        {{lower}}_pass( {{lower}}_generated[i] );\n"
+        "    }\n"
+        "    {{lower}}_state.ready = 1;\n"
+        "    return 1;\n"
+        "}\n"
+        "\n"
+        "void {{lower}}_shutdown( void ) {\n"
+        "    if( {{lower}}_state.ready ) {\n"
+        "        if( {{lower}}_state.active >= 0 ) {\n"
+        "            glEndQuery( GL_TIME_ELAPSED );\n"
+        "        }\n"
+        "        glDeleteQueries( {{upper}}_LATENCY * {{upper}}_MAX_PASSES, &{{lower}}_state.queries[0][0] );\n"
+        "    }\n"
+        "    memset( &{{lower}}_state, 0, sizeof({{lower}}_state) );\n"
+        "}\n"
+        "\n"
+        "static void {{lower}}_record( unsigned long frame, int pass, double ns ) {\n"
+        "    {{lower}}_stats* stats = &{{lower}}_state.stats[pass];\n"
+        "    {{lower}}_sample* sample;\n"
+        "\n"
+        "    stats->last_ns = ns;\n"
+        "    if( !stats->samples || ns < stats->min_ns ) {\n"
+        "        stats->min_ns = ns;\n"
+        "    }\n"
+        "    if( ns > stats->max_ns ) {\n"
+        "        stats->max_ns = ns;\n"
+        "    }\n"
+        "    /* exponential moving average, follows changes within a few dozen frames */\n"
+        "    stats->average_ns = stats->samples ? stats->average_ns + ( ns - stats->average_ns ) * 0.05 : ns;\n"
+        "    stats->samples++;\n"
+        "\n"
+        "    sample = &{{lower}}_state.history[{{lower}}_state.history_next];\n"
+        "    sample->frame = frame;\n"
+        "    sample->pass  = pass;\n"
+        "    sample->ns    = ns;\n"
+        "    {{lower}}_state.history_next = ( {{lower}}_state.history_next + 1 ) % {{upper}}_HISTORY;\n"
+        "    if( {{lower}}_state.history_used < {{upper}}_HISTORY ) {\n"
+        "        {{lower}}_state.history_used++;\n"
+        "    }\n"
+        "}\n"
+        "\n"
+        "void {{lower}}_frame( void ) {\n"
+        "    unsigned int slot;\n"
+        "    int pass;\n"
+        "\n"
+        "    if( !{{lower}}_state.ready ) {\n"
+        "        return;\n"
+        "    }\n"
+        "    if( {{lower}}_state.active >= 0 ) {\n"
+        "        {{lower}}_end( {{lower}}_state.active );\n"
+        "    }\n"
+        "\n"
+        "    {{lower}}_state.frame++;\n"
+        "    slot = (unsigned int)( {{lower}}_state.frame % {{upper}}_LATENCY );\n"
+        "    for( pass = 0; pass < {{lower}}_state.pass_count; ++pass ) {\n"
+        "        GLint available = 0;\n"
+        "        GLuint64 ns = 0;\n"
+        "        if( !{{lower}}_state.issued[slot][pass] ) {\n"
+        "            continue;\n"
+        "        }\n"
+        "        {{lower}}_state.issued[slot][pass] = 0;\n"
+        "\n"
+        "        glGetQueryObjectiv( {{lower}}_state.queries[slot][pass], GL_QUERY_RESULT_AVAILABLE, &available );\n"
+        "        if( !available ) {\n"
+        "            /* never wait, the query is simply reused */\n"
+        "            {{lower}}_state.stats[pass].dropped++;\n"
+        "            continue;\n"
+        "        }\n"
+        "        glGetQueryObjectui64v( {{lower}}_state.queries[slot][pass], GL_QUERY_RESULT, &ns );\n"
+        "        {{lower}}_record( {{lower}}_state.frame - {{upper}}_LATENCY, pass, (double)ns );\n"
+        "    }\n"
+        "}\n"
+        "\n"
+        "int {{lower}}_pass( const char* name ) {\n"
+        "    char clean[{{upper}}_MAX_NAME];\n"
+        "    int  length, pass;\n"
+        "    /* names are written unescaped to csv and json, lookups compare the cleaned name */\n"
+        "    for( length = 0; name[length] != '\\0' && length < {{upper}}_MAX_NAME - 1; ++length ) {\n"
+        "        char c = name[length];\n"
+        "        clean[length] = ( c == '\"' || c == '\\\\' || c == ',' || c == '\\n' ) ? '_' : c;\n"
+        "    }\n"
+        "    clean[length] = '\\0';\n"
+        "\n"
+        "    for( pass = 0; pass < {{lower}}_state.pass_count; ++pass ) {\n"
+        "        if( strcmp( {{lower}}_state.names[pass], clean ) == 0 ) {\n"
+        "            return pass;\n"
+        "        }\n"
+        "    }\n"
+        "    if( {{lower}}_state.pass_count == {{upper}}_MAX_PASSES ) {\n"
+        "        return -1;\n"
+        "    }\n"
+        "    pass = {{lower}}_state.pass_count++;\n"
+        "    memcpy( {{lower}}_state.names[pass], clean, (size_t)length + 1 );\n"
+        "    return pass;\n"
+        "}\n"
+        "\n"
+        "void {{lower}}_begin( int pass ) {\n"
+        "    unsigned int slot = (unsigned int)( {{lower}}_state.frame % {{upper}}_LATENCY );\n"
+        "    if(\n"
+        "        !{{lower}}_state.ready || pass < 0 || pass >= {{lower}}_state.pass_count ||\n"
+        "        {{lower}}_state.active >= 0 || {{lower}}_state.issued[slot][pass]\n"
+        "    ) {\n"
+        "        return;\n"
+        "    }\n"
+        "    glBeginQuery( GL_TIME_ELAPSED, {{lower}}_state.queries[slot][pass] );\n"
+        "    {{lower}}_state.active = pass;\n"
+        "}\n"
+        "\n"
+        "void {{lower}}_end( int pass ) {\n"
+        "    unsigned int slot = (unsigned int)( {{lower}}_state.frame % {{upper}}_LATENCY );\n"
+        "    if( !{{lower}}_state.ready || pass < 0 || {{lower}}_state.active != pass ) {\n"
+        "        return;\n"
+        "    }\n"
+        "    glEndQuery( GL_TIME_ELAPSED );\n"
+        "    {{lower}}_state.issued[slot][pass] = 1;\n"
+        "    {{lower}}_state.active = -1;\n"
+        "}\n"
+        "\n"
+        "const {{lower}}_stats* {{lower}}_get( int pass ) {\n"
+        "    if( pass < 0 || pass >= {{lower}}_state.pass_count ) {\n"
+        "        return NULL;\n"
+        "    }\n"
+        "    return &{{lower}}_state.stats[pass];\n"
+        "}\n"
+        "\n"
+        "double {{lower}}_milliseconds( int pass ) {\n"
+        "    const {{lower}}_stats* stats = {{lower}}_get( pass );\n"
+        "    return stats ? stats->average_ns / 1000000.0 : 0.0;\n"
+        "}\n"
+        "\n"
+        "/* i-th oldest sample of the history */\n"
+        "static const {{lower}}_sample* {{lower}}_history( unsigned int i ) {\n"
+        "    unsigned int first = {{lower}}_state.history_used < {{upper}}_HISTORY ? 0 : {{lower}}_state.history_next;\n"
+        "    return &{{lower}}_state.history[( first + i ) % {{upper}}_HISTORY];\n"
+        "}\n"
+        "\n"
+        "int {{lower}}_export_csv( const char* path ) {\n"
+        "    unsigned int i;\n"
+        "    FILE* file = fopen( path, \"w\" );\n"
+        "    if( !file ) {\n"
+        "        return 0;\n"
+        "    }\n"
+        "    fprintf( file, \"frame,pass,milliseconds\\n\" );\n"
+        "    for( i = 0; i < {{lower}}_state.history_used; ++i ) {\n"
+        "        const {{lower}}_sample* sample = {{lower}}_history( i );\n"
+        "        fprintf(\n"
+        "            file, \"%lu,%s,%.6f\\n\", sample->frame,\n"
+        "            {{lower}}_state.names[sample->pass], sample->ns / 1000000.0 );\n"
+        "    }\n"
+        "    return fclose( file ) == 0;\n"
+        "}\n"
+        "\n"
+        "int {{lower}}_export_trace( const char* path ) {\n"
+        "    unsigned int i;\n"
+        "    double ts = 0.0;\n"
+        "    FILE* file = fopen( path, \"w\" );\n"
+        "    if( !file ) {\n"
+        "        return 0;\n"
+        "    }\n"
+        "    fprintf( file, \"{\\\"displayTimeUnit\\\":\\\"ns\\\",\\\"traceEvents\\\":[\" );\n"
+        "    for( i = 0; i < {{lower}}_state.history_used; ++i ) {\n"
+        "        const {{lower}}_sample* sample = {{lower}}_history( i );\n"
+        "        double dur = sample->ns / 1000.0;\n"
+        "        fprintf(\n"
+        "            file, \"%s\\n{\\\"name\\\":\\\"%s\\\",\\\"cat\\\":\\\"gpu\\\",\\\"ph\\\":\\\"X\\\",\\\"pid\\\":0,\\\"tid\\\":0,\"\n"
+        "            \"\\\"ts\\\":%.3f,\\\"dur\\\":%.3f,\\\"args\\\":{\\\"frame\\\":%lu}}\",\n"
+        "            i == 0 ? \"\" : \",\",\n"
+        "            {{lower}}_state.names[sample->pass], ts, dur, sample->frame );\n"
+        "        ts += dur;\n"
+        "    }\n"
+        "    fprintf( file, \"\\n]}\\n\" );\n"
+        "    return fclose( file ) == 0;\n"
+        "}\n"
+    ),
+}
@@ -0,0 +1,148 @@
+# * Description:  Manifest loading and batched file writing for cnew, glnew and pynew
+# * Author:       Alicia Amarilla ( smushyaa@gmail.com )
+# * File Created: October 19, 2026
+
+import sys
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+# manifest formats:
+#
+# json: either a list of entries or an object
+#       { "defaults": { ... }, "files": [ ... ] }
+# toml: [defaults] table and [[files]] array of tables
+# anything else (or "-" for stdin): one name per line,
+#       blank lines and lines starting with # are ignored
+#
+# an entry is either a name string or a table with a "name" key and
+# any per-file options, keys are the long option names of the tool
+# e.g. { "name": "core/math", "description": "math functions", "c": true }
+#
+# cproj --workspace reads the same format with a "projects" list instead of "files"
+
+class ManifestError( Exception ):
+    pass
+
+def normalize_entries( files, defaults, key:str = "files" ) -> list:
+    if not(isinstance( files, list )):
+        raise ManifestError( "manifest \"" + key + "\" must be a list" )
+    if not(isinstance( defaults, dict )):
+        raise ManifestError( "manifest \"defaults\" must be a table" )
+
+    entries = []
+    for idx, item in enumerate( files ):
+        entry = dict( defaults )
+        if isinstance( item, str ):
+            entry["name"] = item
+        elif isinstance( item, dict ):
+            entry.update( item )
+        else:
+            raise ManifestError( "manifest entry " + str(idx) + " must be a string or a table" )
+
+        if not(isinstance( entry.get( "name" ), str )) or entry["name"] == "":
+            raise ManifestError( "manifest entry " + str(idx) + " has no name" )
+        entries.append( entry )
+    return entries
+
+def parse_lines( text:str ) -> list:
+    names = []
+    for line in text.splitlines():
+        line = line.strip()
+        if line == "" or line.startswith( "#" ):
+            continue
+        names.append( line )
+    return names
+
+def load_manifest( path:str, key:str = "files" ) -> list:
+    if path == "-":
+        return normalize_entries( parse_lines( sys.stdin.read() ), {} )
+
+    try:
+        with open( path, "rb" ) as read_file:
+            data = read_file.read()
+    except OSError as err:
+        raise ManifestError( str(err) )
+
+    ext = os.path.splitext( path )[1].lower()
+    if ext == ".json":
+        import json
+        try:
+            root = json.loads( data )
+        except ValueError as err:
+            raise ManifestError( "invalid json manifest: " + str(err) )
+    elif ext == ".toml":
+        import tomllib
+        try:
+            root = tomllib.loads( data.decode( "utf-8" ) )
+        except ( ValueError, UnicodeDecodeError ) as err:
+            raise ManifestError( "invalid toml manifest: " + str(err) )
+    else:
+        return normalize_entries( parse_lines( data.decode( "utf-8" ) ), {} )
+
+    if isinstance( root, list ):
+        return normalize_entries( root, {} )
+    if isinstance( root, dict ):
+        return normalize_entries( root.get( key, [] ), root.get( "defaults", {} ), key )
+    raise ManifestError( "manifest must be a list or a table" )
+
+def existing_files( paths ) -> set:
+    # one scandir per distinct parent directory instead of one stat per file
+    existing = set()
+    scanned  = set()
+    for path in paths:
+        parent = os.path.dirname( path ) or "."
+        if parent in scanned:
+            continue
+        scanned.add( parent )
+        try:
+            with os.scandir( parent ) as it:
+                for dir_entry in it:
+                    if dir_entry.is_file():
+                        existing.add( os.path.normpath( os.path.join( parent, dir_entry.name ) ) )
+        except OSError:
+            pass
+    return existing
+
+def write_text( path:str, text:str ):
+    with open( path, "w+", newline='\n' ) as write_file:
+        write_file.write( text )
+
+def write_files( files:list, overwrite:bool ):
+    """files is a list of ( path, text ) pairs.
+    returns ( created, skipped, failed ), failed is a list of ( path, error )"""
+    existing = set()
+    if not(overwrite):
+        existing = existing_files( [ path for path, _ in files ] )
+
+    pending = []
+    skipped = []
+    for path, text in files:
+        if os.path.normpath( path ) in existing:
+            skipped.append( path )
+        else:
+            pending.append( ( path, text ) )
+
+    created = []
+    failed  = []
+    if len( pending ) != 0:
+        workers = min( 32, len( pending ) )
+        with ThreadPoolExecutor( max_workers=workers ) as pool:
+            futures = [ ( path, pool.submit( write_text, path, text ) ) for path, text in pending ]
+            for path, future in futures:
+                try:
+                    future.result()
+                    created.append( path )
+                except OSError as err:
+                    failed.append( ( path, str(err) ) )
+
+    return created, skipped, failed
+
+def summary( created, skipped, failed ) -> str:
+    msg = "created " + str(len( created )) + " file"
+    if len( created ) != 1:
+        msg += "s"
+    if len( skipped ) != 0:
+        msg += ", skipped " + str(len( skipped )) + " existing (use -o or --overwrite to overwrite)"
+    if len( failed ) != 0:
+        msg += ", " + str(len( failed )) + " failed"
+    return msg
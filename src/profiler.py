@@ -0,0 +1,139 @@
+# * Description:  --profile support shared by cnew, cproj, glnew and pynew
+# * Author:       Alicia Amarilla ( smushyaa@gmail.com )
+# * File Created: October 19, 2026
+
+import sys
+import os
+import time
+
+# usage:
+#   arg_list = profiler.setup( arg_list )  first thing in main, strips profiling options
+#   profiler.mark( "write" )               ends the current phase and starts a new one
+# marks cost a single check when profiling is disabled.
+#
+# --profile               print phase times and counts of stat/open/write/mkdir/scandir calls on exit
+# --profile_file [string] also run under cProfile and dump pstats to given path
+
+help_lines = [
+    " --profile          [switch]: print time spent in each phase and file system operation counts on exit",
+    " --profile_file     [string]: also run under cProfile and write pstats output to given path",
+]
+
+start   = time.perf_counter()
+enabled = False
+phase   = "imports"
+phase_start = start
+phases  = {}
+counts  = { "stat": 0, "open": 0, "write": 0, "mkdir": 0, "scandir": 0 }
+profile_file = ""
+profile = None
+
+class CountedFile:
+    def __init__( self, file ):
+        self._file = file
+
+    def write( self, data ):
+        counts["write"] += 1
+        return self._file.write( data )
+
+    def __enter__( self ):
+        self._file.__enter__()
+        return self
+
+    def __exit__( self, *exc ):
+        return self._file.__exit__( *exc )
+
+    def __iter__( self ):
+        return iter( self._file )
+
+    def __getattr__( self, name ):
+        return getattr( self._file, name )
+
+def counted( name:str, func ):
+    def wrapper( *args, **kwargs ):
+        counts[name] += 1
+        return func( *args, **kwargs )
+    return wrapper
+
+def install_counters():
+    import builtins
+    real_open = builtins.open
+    def counted_open( *args, **kwargs ):
+        counts["open"] += 1
+        return CountedFile( real_open( *args, **kwargs ) )
+    builtins.open = counted_open
+
+    # os.path.isfile/isdir/exists and glob all go through these
+    os.stat    = counted( "stat", os.stat )
+    os.lstat   = counted( "stat", os.lstat )
+    os.mkdir   = counted( "mkdir", os.mkdir )
+    os.scandir = counted( "scandir", os.scandir )
+
+def setup( arg_list:list ) -> list:
+    global enabled, profile_file, profile
+
+    remaining = []
+    idx = 0
+    while idx < len( arg_list ):
+        arg = arg_list[idx]
+        if arg == "--profile":
+            enabled = True
+        elif arg == "--profile_file" or arg.startswith( "--profile_file=" ):
+            if arg == "--profile_file":
+                idx += 1
+                value = arg_list[idx] if idx < len( arg_list ) else ""
+            else:
+                value = arg[len( "--profile_file=" ):]
+            if value == "":
+                from common import print_fatal
+                print_fatal( "--profile_file is missing a path!" )
+            enabled = True
+            profile_file = value
+        else:
+            remaining.append( arg )
+        idx += 1
+
+    if enabled:
+        import atexit
+        install_counters()
+        atexit.register( report )
+        if profile_file != "":
+            import cProfile
+            profile = cProfile.Profile()
+            profile.enable()
+        mark( "arguments" )
+
+    return remaining
+
+def mark( name:str ):
+    global phase, phase_start
+    if not(enabled):
+        return
+    now = time.perf_counter()
+    phases[phase] = phases.get( phase, 0.0 ) + ( now - phase_start )
+    phase       = name
+    phase_start = now
+
+def report():
+    mark( "" )
+    if profile is not None:
+        profile.disable()
+
+    total = time.perf_counter() - start
+    lines = [ "profile: {:.2f} ms since first import".format( total * 1000.0 ) ]
+    for name, seconds in phases.items():
+        percent = 0.0
+        if total > 0.0:
+            percent = seconds / total * 100.0
+        lines.append( "  {:<12} {:>9.2f} ms {:>5.1f}%".format( name, seconds * 1000.0, percent ) )
+    lines.append( "  " + "  ".join( name + " " + str(count) for name, count in counts.items() ) )
+
+    if profile is not None:
+        try:
+            profile.dump_stats( profile_file )
+            lines.append( "  wrote pstats to \"" + profile_file + "\"" )
+        except OSError as err:
+            lines.append( "  failed to write pstats: " + str(err) )
+
+    # the report goes to stderr so it never mixes with generated output
+    sys.stderr.write( "\n".join( lines ) + "\n" )
@@ -0,0 +1,247 @@
+# * Description:  Built-in templates of pynew --kind pipeline, imported by templates.py on first use
+# * Author:       Alicia Amarilla ( smushyaa@gmail.com )
+# * File Created: October 19, 2026
+
+builtin = {
+    # pynew --kind pipeline, see create_py.py
+    "py_pipeline": (
+        "{{info}}"
+        "import sys\n"
+        "import os\n"
+        "import time\n"
+        "import itertools\n"
+        "import threading\n"
+        "import queue\n"
+        "from collections import deque\n"
+        "\n"
+        "# streaming pipeline:\n"
+        "#   read_records  generator, reads every input in chunk_size blocks and yields one record per line\n"
+        "#   stages        functions that map a batch (list of records) to a batch, run in order\n"
+        "#   write_batch   writes one output batch with a single write call\n"
+        "#\n"
+        "# batches flow from a reader thread through a bounded queue into a thread or\n"
+        "# process pool and out to the writer in input order. at most queue_size\n"
+        "# batches are buffered and 2 * jobs batches are in flight, so memory stays\n"
+        "# bounded no matter how large the input is.\n"
+        "#\n"
+        "# stages have to be module level functions so the process pool can pickle them,\n"
+        "# use --pool process for CPU bound stages and the default thread pool for I/O\n"
+        "# bound stages or stages that release the GIL.\n"
+        "\n"
+        "chunk_size = 1 << 20\n"
+        "batch_size = 4096\n"
+        "queue_size = 8\n"
+        "\n"
+        "stages = []\n"
+        "\n"
+        "def stage( function ):\n"
+        "    \"\"\"decorator, appends function to the pipeline stages\"\"\"\n"
+        "    stages.append( function )\n"
+        "    return function\n"
+        "\n"
+        "@stage\n"
+        "def parse( batch:list ) -> list:\n"
+        "    return [ record.decode( \"utf-8\", \"replace\" ).rstrip( \"\\r\" ) for record in batch ]\n"
+        "\n"
+        "@stage\n"
+        "def transform( batch:list ) -> list:\n"
+        "    return [ record for record in batch if record != \"\" ]\n"
+        "\n"
+        "class Stats:\n"
+        "    def __init__( self ):\n"
+        "        self.bytes_read = 0\n"
+        "        self.records    = 0\n"
+        "        self.batches    = 0\n"
+        "        self.stage_time = [ 0.0 ] * len( stages )\n"
+        "        self.write_time = 0.0\n"
+        "        self.start      = time.perf_counter()\n"
+        "\n"
+        "    def report( self, stream ):\n"
+        "        elapsed = max( time.perf_counter() - self.start, 1e-9 )\n"
+        "        stream.write( \"{{name}}: \" + str(self.records) + \" records in \" + str(self.batches) + \" batches, \" )\n"
+        "        stream.write( \"%.3fs, %.0f records/s, %.2f MB/s\\n\" % (\n"
+        "            elapsed, self.records / elapsed, self.bytes_read / elapsed / ( 1 << 20 )\n"
+        "        ) )\n"
+        "        for function, seconds in zip( stages, self.stage_time ):\n"
+        "            stream.write( \"    %-16s %.3fs\\n\" % ( function.__name__, seconds ) )\n"
+        "        stream.write( \"    %-16s %.3fs\\n\" % ( \"write\", self.write_time ) )\n"
+        "\n"
+        "def read_records( paths:list, stats:Stats ):\n"
+        "    \"\"\"yields the lines of every input, - reads stdin\"\"\"\n"
+        "    for path in paths:\n"
+        "        stream = sys.stdin.buffer if path == \"-\" else open( path, \"rb\" )\n"
+        "        try:\n"
+        "            tail = b\"\"\n"
+        "            while True:\n"
+        "                chunk = stream.read( chunk_size )\n"
+        "                if not( chunk ):\n"
+        "                    break\n"
+        "                stats.bytes_read += len( chunk )\n"
+        "                lines = ( tail + chunk ).split( b\"\\n\" )\n"
+        "                tail  = lines.pop()\n"
+        "                yield from lines\n"
+        "            if tail != b\"\":\n"
+        "                yield tail\n"
+        "        finally:\n"
+        "            if stream is not sys.stdin.buffer:\n"
+        "                stream.close()\n"
+        "\n"
+        "def batched( records, size:int ):\n"
+        "    iterator = iter( records )\n"
+        "    while True:\n"
+        "        batch = list( itertools.islice( iterator, size ) )\n"
+        "        if len( batch ) == 0:\n"
+        "            return\n"
+        "        yield batch\n"
+        "\n"
+        "def prefetch( iterable, size:int ):\n"
+        "    \"\"\"runs iterable in a thread, yields its items through a bounded queue\"\"\"\n"
+        "    items = queue.Queue( maxsize=size )\n"
+        "    done  = object()\n"
+        "    error = []\n"
+        "\n"
+        "    def produce():\n"
+        "        try:\n"
+        "            for item in iterable:\n"
+        "                items.put( item )\n"
+        "        except BaseException as err:\n"
+        "            error.append( err )\n"
+        "        items.put( done )\n"
+        "\n"
+        "    thread = threading.Thread( target=produce, daemon=True )\n"
+        "    thread.start()\n"
+        "    while True:\n"
+        "        item = items.get()\n"
+        "        if item is done:\n"
+        "            break\n"
+        "        yield item\n"
+        "    thread.join()\n"
+        "    if len( error ) != 0:\n"
+        "        raise error[0]\n"
+        "\n"
+        "def run_stages( batch:list ) -> tuple:\n"
+        "    \"\"\"runs in a worker, returns ( batch, seconds spent in every stage )\"\"\"\n"
+        "    times = []\n"
+        "    for function in stages:\n"
+        "        start = time.perf_counter()\n"
+        "        batch = function( batch )\n"
+        "        times.append( time.perf_counter() - start )\n"
+        "    return batch, times\n"
+        "\n"
+        "def process( batches, pool, jobs:int, stats:Stats ):\n"
+        "    \"\"\"yields processed batches in input order\"\"\"\n"
+        "    pending = deque()\n"
+        "    for batch in batches:\n"
+        "        pending.append( pool.submit( run_stages, batch ) )\n"
+        "        if len( pending ) >= 2 * jobs:\n"
+        "            yield collect( pending.popleft(), stats )\n"
+        "    while len( pending ) != 0:\n"
+        "        yield collect( pending.popleft(), stats )\n"
+        "\n"
+        "def collect( future, stats:Stats ) -> list:\n"
+        "    batch, times = future.result()\n"
+        "    stats.batches += 1\n"
+        "    stats.records += len( batch )\n"
+        "    for idx, seconds in enumerate( times ):\n"
+        "        stats.stage_time[idx] += seconds\n"
+        "    return batch\n"
+        "\n"
+        "def write_batch( stream, batch:list ):\n"
+        "    if len( batch ) != 0:\n"
+        "        stream.write( ( \"\\n\".join( batch ) + \"\\n\" ).encode( \"utf-8\" ) )\n"
+        "\n"
+        "def run( paths:list, output:str, pool_kind:str, jobs:int, size:int, stats:Stats ):\n"
+        "    from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor\n"
+        "\n"
+        "    executor = ProcessPoolExecutor if pool_kind == \"process\" else ThreadPoolExecutor\n"
+        "    stream   = sys.stdout.buffer if output == \"-\" else open( output, \"wb\", buffering=chunk_size )\n"
+        "    try:\n"
+        "        with executor( max_workers=jobs ) as pool:\n"
+        "            batches = prefetch( batched( read_records( paths, stats ), size ), queue_size )\n"
+        "            for batch in process( batches, pool, jobs, stats ):\n"
+        "                start = time.perf_counter()\n"
+        "                write_batch( stream, batch )\n"
+        "                stats.write_time += time.perf_counter() - start\n"
+        "    finally:\n"
+        "        if stream is sys.stdout.buffer:\n"
+        "            stream.flush()\n"
+        "        else:\n"
+        "            stream.close()\n"
+        "\n"
+        "def print_help():\n"
+        "    print( \"{{name}}: streaming pipeline\" )\n"
+        "    print( \" usage: {{name}}.py [options] [input ...], no input or - reads stdin\" )\n"
+        "    print( \"    -o, --output [string]: output file, default stdout\" )\n"
+        "    print( \"    -j, --jobs   [number]: worker count, default cpu count\" )\n"
+        "    print( \"    --pool       [string]: thread or process, default thread\" )\n"
+        "    print( \"    --batch      [number]: records per batch, default \" + str(batch_size) )\n"
+        "    print( \"    --profile    [switch]: run under cProfile and print the slowest functions to stderr\" )\n"
+        "    print( \"                           (process pool workers are not profiled)\" )\n"
+        "    print( \"    --bench      [switch]: print throughput and time spent in every stage to stderr\" )\n"
+        "    print( \"    -h, --help:            print this help message and exit\" )\n"
+        "\n"
+        "def main( arg_list:list ) -> int:\n"
+        "    import getopt\n"
+        "\n"
+        "    try:\n"
+        "        args, paths = getopt.gnu_getopt(\n"
+        "            arg_list, \"ho:j:\", [ \"help\", \"output=\", \"jobs=\", \"pool=\", \"batch=\", \"profile\", \"bench\" ]\n"
+        "        )\n"
+        "    except getopt.error as err:\n"
+        "        sys.stderr.write( str(err) + \"\\n\" )\n"
+        "        return 2\n"
+        "\n"
+        "    output    = \"-\"\n"
+        "    jobs      = os.cpu_count() or 1\n"
+        "    pool_kind = \"thread\"\n"
+        "    size      = batch_size\n"
+        "    profile   = False\n"
+        "    bench     = False\n"
+        "    for arg, value in args:\n"
+        "        if arg in ( \"-h\", \"--help\" ):\n"
+        "            print_help()\n"
+        "            return 0\n"
+        "        if arg in ( \"-o\", \"--output\" ):\n"
+        "            output = value\n"
+        "        if arg in ( \"-j\", \"--jobs\" ) or arg == \"--batch\":\n"
+        "            if not( value.isdigit() ) or int( value ) == 0:\n"
+        "                sys.stderr.write( arg + \" must be a positive number\\n\" )\n"
+        "                return 2\n"
+        "            if arg == \"--batch\":\n"
+        "                size = int( value )\n"
+        "            else:\n"
+        "                jobs = int( value )\n"
+        "        if arg == \"--pool\":\n"
+        "            if not( value in ( \"thread\", \"process\" ) ):\n"
+        "                sys.stderr.write( \"--pool must be thread or process\\n\" )\n"
+        "                return 2\n"
+        "            pool_kind = value\n"
+        "        if arg == \"--profile\":\n"
+        "            profile = True\n"
+        "        if arg == \"--bench\":\n"
+        "            bench = True\n"
+        "\n"
+        "    stats = Stats()\n"
+        "    if profile:\n"
+        "        import cProfile\n"
+        "        import pstats\n"
+        "\n"
+        "        profiler = cProfile.Profile()\n"
+        "        profiler.enable()\n"
+        "    try:\n"
+        "        run( paths or [ \"-\" ], output, pool_kind, jobs, size, stats )\n"
+        "    except OSError as err:\n"
+        "        sys.stderr.write( \"{{name}}: \" + str(err) + \"\\n\" )\n"
+        "        return 1\n"
+        "    finally:\n"
+        "        if profile:\n"
+        "            profiler.disable()\n"
+        "            pstats.Stats( profiler, stream=sys.stderr ).sort_stats( \"cumulative\" ).print_stats( 20 )\n"
+        "    if bench:\n"
+        "        stats.report( sys.stderr )\n"
+        "    return 0\n"
+        "\n"
+        "if __name__ == \"__main__\":\n"
+        "    sys.exit( main( sys.argv[1:] ) )\n"
+    ),
+}
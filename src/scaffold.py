@@ -0,0 +1,62 @@
+# * Description:  Multi-call entry point for cnew, cproj, glnew and pynew
+# * Author:       Alicia Amarilla ( smushyaa@gmail.com )
+# * File Created: October 19, 2026
+
+import sys
+# imported first only to start the profiler timer, setup is left to each command
+import profiler
+
+# usage:
+#   scaffold <command> [options]
+# or link/copy the scaffold archive as cnew, cproj, glnew or pynew
+# and the command is taken from the program name.
+# only the module of the selected command is ever imported.
+
+commands = {
+    "cnew":  "create_c",
+    "cproj": "create_cproj",
+    "glnew": "create_glsl",
+    "pynew": "create_py",
+}
+
+def display_help():
+    from common import print_help
+    print_help( "scaffold: multi-call entry point" )
+    print_help( " usage: scaffold <command> [options]" )
+    print_help( "\ncommands:" )
+    print_help( " cnew:  create new C/C++ header and/or source files" )
+    print_help( " cproj: manage simple C/C++ project" )
+    print_help( " glnew: create new GLSL vertex and/or fragment source files" )
+    print_help( " pynew: create new Python script" )
+    print_help( "\nrun scaffold <command> -h for help on a command" )
+    print_help( "when invoked as cnew, cproj, glnew or pynew the command can be omitted" )
+
+def program_name( path:str ) -> str:
+    name = path.replace( "\\", "/" ).rsplit( "/", 1 )[-1]
+    for ext in ( ".pyz", ".py", ".exe", ".bat", ".cmd" ):
+        if name.endswith( ext ):
+            return name[:-len( ext )]
+    return name
+
+def run( argv:list ):
+    command  = program_name( argv[0] )
+    arg_list = argv[1:]
+
+    if not( command in commands ):
+        if len( arg_list ) == 0 or arg_list[0] in ( "-h", "--help" ):
+            display_help()
+            sys.exit(0)
+        command  = arg_list[0]
+        arg_list = arg_list[1:]
+        if not( command in commands ):
+            from common import print_fatal
+            print_fatal( "unknown command \"" + command + "\"" )
+
+    module = __import__( commands[command] )
+    module.main( arg_list )
+
+def main():
+    run( sys.argv )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+# * Description:  Cached cproj skeleton snapshots materialized with reflink or copy_file_range
+# * Author:       Alicia Amarilla ( smushyaa@gmail.com )
+# * File Created: October 19, 2026
+
+import sys
+import os
+import common
+import templates
+
+# cproj --init renders the same files for every project with the same language,
+# version and flags. they are rendered once with placeholders for the project
+# specific fields and stored in <cache dir>/skeletons/<key>, the key covers
+# the language, version, flags, author and every template init uses (built-in
+# text and user template path, mtime and size).
+#
+# a file without placeholders is stored as is and copied into new projects
+# with a reflink (FICLONE) where the filesystem supports it, copy_file_range
+# otherwise and a plain copy as the last resort. a file with placeholders is
+# stored as <file>.in and patched while it is copied.
+#
+# a snapshot is written to a temporary directory and renamed into place, so
+# concurrent inits (cproj --workspace) never see a partial snapshot.
+
+placeholders = {
+    "name": "\0name\0",
+    "date": "\0date\0",
+    "year": "\0year\0",
+    "src":  "\0src\0",
+}
+
+patch_suffix = ".in"
+
+# linux _IOW( 0x94, 9, int )
+FICLONE = 0x40049409
+
+def fingerprint( parts:list, template_names:list ) -> str:
+    import hashlib
+
+    found  = templates.find_user_templates()
+    digest = hashlib.sha256()
+    digest.update( repr( parts ).encode( "utf-8" ) )
+    digest.update( templates.author().encode( "utf-8" ) )
+    for name in template_names:
+        digest.update( repr( ( name, templates.builtin_text( name ), found.get( name ) ) ).encode( "utf-8" ) )
+    return digest.hexdigest()[:24]
+
+def snapshot_dir( key:str ) -> str:
+    return os.path.join( common.cache_dir(), "skeletons", key )
+
+def render_files( files:list, context:dict ) -> dict:
+    """files is a list of ( path, template ), returns path -> text with placeholders"""
+    context = dict( context )
+    context.update( placeholders )
+    context["info"] = templates.render( "cproj_info", **context )
+    return { path: templates.render( template, **context ) for path, template in files }
+
+def store( key:str, rendered:dict ) -> str:
+    """writes a snapshot, returns its directory or "" when the cache is not writable"""
+    final = snapshot_dir( key )
+    tmp   = final + "." + str(os.getpid()) + ".tmp"
+    try:
+        for path, text in rendered.items():
+            if "\0" in text:
+                path += patch_suffix
+            full = os.path.join( tmp, path )
+            os.makedirs( os.path.dirname( full ), exist_ok=True )
+            with open( full, "w", newline='\n' ) as write_file:
+                write_file.write( text )
+        os.rename( tmp, final )
+    except OSError:
+        remove_tree( tmp )
+        # another process stored the same snapshot first
+        return final if os.path.isdir( final ) else ""
+    return final
+
+def remove_tree( path:str ):
+    import shutil
+    shutil.rmtree( path, ignore_errors=True )
+
+def reflink( read_file, write_file ) -> bool:
+    if sys.platform != "linux":
+        return False
+    import fcntl
+    try:
+        fcntl.ioctl( write_file.fileno(), FICLONE, read_file.fileno() )
+    except OSError:
+        return False
+    return True
+
+def copy_file( src:str, dst:str ):
+    with open( src, "rb" ) as read_file, open( dst, "wb" ) as write_file:
+        if reflink( read_file, write_file ):
+            return
+        if hasattr( os, "copy_file_range" ):
+            size   = os.fstat( read_file.fileno() ).st_size
+            copied = 0
+            try:
+                while copied < size:
+                    count = os.copy_file_range( read_file.fileno(), write_file.fileno(), size - copied )
+                    if count == 0:
+                        break
+                    copied += count
+            except OSError:
+                pass
+            if copied == size:
+                return
+            read_file.seek( 0 )
+            write_file.seek( 0 )
+            write_file.truncate()
+        write_file.write( read_file.read() )
+
+def patch( text:str, values:dict ) -> str:
+    for field, placeholder in placeholders.items():
+        text = text.replace( placeholder, values.get( field, "" ) )
+    return text
+
+def materialize( snapshot:str, rendered, paths:list, dst_dir:str, values:dict ):
+    """creates paths below dst_dir from the snapshot directory, or from the
+    rendered files when there is no snapshot"""
+    for path in paths:
+        dst = os.path.join( dst_dir, path )
+        if snapshot == "":
+            text = rendered[path]
+        else:
+            src = os.path.join( snapshot, path )
+            if os.path.isfile( src ):
+                copy_file( src, dst )
+                continue
+            with open( src + patch_suffix, "r", newline='' ) as read_file:
+                text = read_file.read()
+        with open( dst, "w", newline='' ) as write_file:
+            write_file.write( patch( text, values ) )
+
+def create( key_parts:list, files:list, context:dict, dst_dir:str, paths:list, values:dict ):
+    """creates the given paths of files ( path, template ) below dst_dir"""
+    key      = fingerprint( key_parts, [ "cproj_info" ] + [ template for _, template in files ] )
+    snapshot = snapshot_dir( key )
+    rendered = None
+    if not( os.path.isdir( snapshot ) ):
+        rendered = render_files( files, context )
+        snapshot = store( key, rendered )
+    try:
+        materialize( snapshot, rendered, paths, dst_dir, values )
+    except OSError:
+        if snapshot == "":
+            raise
+        # damaged snapshot, render it again next time
+        remove_tree( snapshot )
+        materialize( "", render_files( files, context ), paths, dst_dir, values )
@@ -0,0 +1,351 @@
+# * Description:  File templates for cnew, cproj, glnew and pynew with a compiled template cache
+# * Author:       Alicia Amarilla ( smushyaa@gmail.com )
+# * File Created: October 19, 2026
+
+import sys
+import os
+import marshal
+import common
+
+# templates are plain text with {{field}} placeholders, there is no other syntax.
+# a template named "c_header" is looked up as "c_header.tmpl" in, in order:
+#   ./.scaffold/templates         (project templates)
+#   $SCAFFOLD_TEMPLATES           (user templates, defaults to <config dir>/scaffold/templates)
+# and falls back to the built-in template below.
+#
+# user template files are compiled once into a list of literal/field parts and
+# stored in <cache dir>/scaffold/templates.cache, an entry is reused for as long
+# as the mtime and size of its file are unchanged.
+#
+# fields available everywhere: author ($SCAFFOLD_AUTHOR or the default author), date, year
+# run this module with a directory to write out the built-in templates as a starting point.
+#
+# the large templates of optional features live in their own modules, listed in
+# lazy_modules, which are only imported when one of their templates is rendered.
+
+extension = ".tmpl"
+
+builtin = {
+    # cnew, glnew
+    "c_info": (
+        "/**\n"
+        " * Description:  {{description}}\n"
+        " * Author:       {{author}}\n"
+        " * File Created: {{date}}\n"
+        "*/\n"
+    ),
+    "c_header":       "{{info}}#pragma once",
+    "c_header_guard": "{{info}}#if !defined({{guard}})\n#define {{guard}} 1\n#endif\n",
+    "c_header_empty": "{{info}}",
+    "c_source":       "{{info}}#include \"{{include}}\"",
+    "c_source_empty": "{{info}}",
+    "glsl_vertex": (
+        "{{info}}#version {{version}}\n\n"
+        "out struct{\n    \n} v2f;\n\n"
+        "void main() {\n    \n}\n"
+    ),
+    "glsl_fragment": (
+        "{{info}}#version {{version}}\n\n"
+        "in struct{\n    \n} v2f;\n\n"
+        "out vec4 FRAG_COLOR;\n"
+        "void main() {\n    \n}\n"
+    ),
+    "glsl_compute": (
+        "{{info}}#version {{version}}\n\n"
+        "layout(local_size_x = {{local_size_x}}, local_size_y = {{local_size_y}}, local_size_z = {{local_size_z}}) in;\n\n"
+        "{{declarations}}"
+        "void main() {\n{{body}}    \n}\n"
+    ),
+    "glsl_compute_dispatch": (
+        "{{info}}{{guard_begin}}\n\n"
+        "/* dispatch helper for {{shader}}, include after the OpenGL 4.3+ function loader */\n\n"
+        "{{body}}{{guard_end}}"
+    ),
+    # glnew --bundle, guard_begin is #pragma once or the opening of a header guard
+    "glsl_bundle_header": "{{info}}{{guard_begin}}\n\n/* generated by glnew --bundle, do not edit */\n\n{{body}}{{guard_end}}",
+    "glsl_permute_header": "{{info}}{{guard_begin}}\n\n/* generated by glnew --permute, do not edit */\n\n{{body}}{{guard_end}}",
+    "glsl_block_header": "{{info}}{{guard_begin}}\n\n/* generated by glnew --block, do not edit */\n\n{{body}}{{guard_end}}",
+    "glsl_block": "{{info}}#if !defined({{guard}})\n#define {{guard}} 1\n\n{{body}}\n#endif /* {{guard}} */\n",
+
+    # pynew
+    "py_info": (
+        "# * Description:  {{description}}\n"
+        "# * Author:       {{author}}\n"
+        "# * File Created: {{date}}\n"
+        "\n"
+    ),
+    "py_script": "{{info}}import sys\n\nif __name__ == \"__main__\":\n    sys.exit()",
+
+    # cproj
+    "cproj_info": (
+        "/**\n"
+        "    * Description:  {{description}}\n"
+        "    * Author:       {{author}}\n"
+        "    * File Created: {{date}}\n"
+        "*/\n"
+    ),
+    "cproj_main":      "{{info}}\nint main( int argc, char* argv[] ) {\n    return 0;\n}\n",
+    "cproj_pch":       "{{info}}",
+    "cproj_gitignore": "build\n.vscode\ncompile_flags.txt\n*.d\n*.o\n*.gch",
+    "cproj_readme":    "# {{name}}\n",
+    "cproj_todo":      "# {{name}} todo list\n\n - [ ] ",
+    "cproj_launch": (
+        "{\n"
+        "    \"version\": \"0.2.0\",\n"
+        "    \"configuarations\": [\n"
+        "        {\n"
+        "            \"name\": \"(gdb) Launch\",\n"
+        "            \"type\": \"cppdbg\",\n"
+        "            \"request\": \"launch\",\n"
+        "            \"program\": \"${workspaceFolder}/build/debug/{{name}}.exe\",\n"
+        "            \"args\": [],\n"
+        "            \"stopAtEntry\": false,\n"
+        "            \"cwd\": \"${workspaceFolder}\",\n"
+        "            \"environment\": [],\n"
+        "            \"externalConsole\": false,\n"
+        "            \"MIMode\": \"gdb\",\n"
+        "            \"miDebuggerPath\": \"C:/msys64/mingw64/bin/gdb.exe\",\n"
+        "            \"setupCommands\": [\n"
+        "                {\n"
+        "                    \"description\": \"Enable pretty-printing for gdb\",\n"
+        "                    \"text\": \"-enable-pretty-printing\",\n"
+        "                    \"ignoreFailures\": true\n"
+        "                }\n"
+        "            ]\n"
+        "        }\n"
+        "    ]\n"
+        "}"
+    ),
+    # cflags is one flag per line, each followed by a newline
+    "cproj_compile_flags": "{{compiler}}\n-std={{version}}\n-I./src\n-D_CLANGD=1\n{{cflags}}",
+    # makeflags is a space separated list with a leading space
+    "cproj_makefile": (
+        "# Desired compiler and C/C++ version\n"
+        "CC = {{compiler}} -std={{version}}\n"
+        "# change between DEBUG/RELEASE\n\n"
+        "# RELEASE BUILD\n"
+        "# CFLAGS = $(RELEASE)\n"
+        "# LNKFLAGS = --static -mwindows\n"
+        "# TARGETDIR = ./build/release\n\n"
+        "# DEBUG BUILD\n"
+        "CFLAGS = $(DEBUG)\n"
+        "LNKFLAGS = --static\n"
+        "TARGETDIR = ./build/debug\n\n"
+        "# executable name\n"
+        "EXE = {{name}}.exe\n\n"
+        "# source code paths\n"
+        "SRC = {{src}}\n\n"
+        "# defines\n"
+        "DEF ={{makeflags}}\n\n"
+        "# pre-compiled header\n"
+        "PCH = ./src/pch\n\n"
+        "# linker flags\n"
+        "LNK = -static-libstdc++ -static-libgcc -lmingw32\n\n"
+        "# DO NOT EDIT BEYOND THIS POINT!!! ======================================\n\n"
+        "DEBUG   = $(DFLAGS) $(foreach D, $(INC), -I$(D)) $(DEPFLAGS)\n"
+        "RELEASE = $(RFLAGS) $(foreach D, $(INC), -I$(D)) $(DEPFLAGS)\n\n"
+        "BINARY = $(TARGETDIR)/($EXE)\n\n"
+        "WARN     = -Wall -Wextra\n"
+        "DFLAGS   = $(WARN) $(DEF) -O0 -g -D DEBUG -march=native\n"
+        "RFLAGS   = $(DEF) -O2 -march=native\n"
+        "DEPFLAGS = -MP -MD\n"
+        "INC      = ./src\n\n"
+        "CPP  = $(foreach D, $(SRC), $(wildcard $(D)/*.cpp))\n"
+        "C    = $(foreach D, $(SRC), $(wildcard $(D)/*.c))\n"
+        "OBJ  = $(patsubst %.c,%.o, $(C)) $(patsubst %.cpp,%.o, $(CPP))\n"
+        "DEPS = $(patsubst %.c,%.d, $(C)) $(patsubst %.cpp,%.d, $(CPP))\n\n"
+        "PCH_TARG = $(PCH).gch\n\n"
+        "all: $(PCH_TARG) $(BINARY)\n\n"
+        "run: all\n\t$(BINARY)\n\n"
+        "-include $(DEPS)\n"
+        "$(BINARY): $(OBJ)\n"
+        "\t$(CC) -o $@ $(LIB) $^ $(LNK) $(LNKFLAGS)\n\n"
+        "%.o: %.c\n"
+        "\t$(CC) $(CFLAGS) -c -o $@ $<\n\n"
+        "%.o: %.cpp\n"
+        "\t$(CC) $(CFLAGS) -c -o $@ $<\n\n"
+        "$(PCH_TARG): $(PCH){{pch_ext}}\n"
+        "\t$(CC) $(CFLAGS) $(PCH){{pch_ext}} -o $(PCH_TARG)\n\n"
+        "clean:\n\trm *.d, *.o, *.gch -r\n\n"
+        ".PHONY: all clean run\n"
+    ),
+}
+
+lazy_modules = {
+    "c_io_header":        "c_io_templates",
+    "c_io_source":        "c_io_templates",
+    "glsl_reload_header": "glsl_reload_templates",
+    "glsl_reload_source": "glsl_reload_templates",
+    "glsl_timer_header":  "glsl_timer_templates",
+    "glsl_timer_source":  "glsl_timer_templates",
+    "py_pipeline":        "py_pipeline_templates",
+}
+
+def load_builtin( module_name:str ):
+    builtin.update( __import__( module_name ).builtin )
+
+def builtin_text( name:str ) -> str:
+    if not( name in builtin ) and name in lazy_modules:
+        load_builtin( lazy_modules[name] )
+    return builtin[name]
+
+class TemplateError( Exception ):
+    pass
+
+def compile_template( text:str, name:str ) -> tuple:
+    # even indices are literals, odd indices are field names
+    parts = []
+    pos   = 0
+    while True:
+        begin = text.find( "{{", pos )
+        if begin < 0:
+            parts.append( text[pos:] )
+            break
+        end = text.find( "}}", begin + 2 )
+        if end < 0:
+            raise TemplateError( "template \"" + name + "\" has an unterminated {{" )
+        field = text[begin + 2:end].strip()
+        if field == "":
+            raise TemplateError( "template \"" + name + "\" has an empty field" )
+        parts.append( text[pos:begin] )
+        parts.append( field )
+        pos = end + 2
+    return tuple( parts )
+
+def template_dirs() -> list:
+    user_dir = os.environ.get( "SCAFFOLD_TEMPLATES", "" )
+    if user_dir == "":
+        user_dir = os.path.join( common.config_dir(), "templates" )
+    return [ os.path.join( ".scaffold", "templates" ), user_dir ]
+
+def cache_path() -> str:
+    return os.path.join( common.cache_dir(), "templates.cache" )
+
+def find_user_templates() -> dict:
+    # name -> ( path, mtime_ns, size ), earlier directories win
+    found = {}
+    for directory in template_dirs():
+        try:
+            with os.scandir( directory ) as it:
+                for entry in it:
+                    if not( entry.name.endswith( extension ) ):
+                        continue
+                    name = entry.name[:-len( extension )]
+                    if name in found or not( entry.is_file() ):
+                        continue
+                    st = entry.stat()
+                    found[name] = ( os.path.abspath( entry.path ), st.st_mtime_ns, st.st_size )
+        except OSError:
+            continue
+    return found
+
+def load_cache() -> dict:
+    try:
+        with open( cache_path(), "rb" ) as read_file:
+            cache = marshal.load( read_file )
+        if isinstance( cache, dict ):
+            return cache
+    except ( OSError, EOFError, ValueError, TypeError ):
+        pass
+    return {}
+
+def save_cache( cache:dict ):
+    path = cache_path()
+    tmp  = path + "." + str(os.getpid())
+    try:
+        os.makedirs( os.path.dirname( path ), exist_ok=True )
+        with open( tmp, "wb" ) as write_file:
+            marshal.dump( cache, write_file )
+        os.replace( tmp, path )
+    except OSError:
+        # the cache is only an optimization
+        try:
+            os.remove( tmp )
+        except OSError:
+            pass
+
+compiled = None
+
+def load() -> dict:
+    global compiled
+    if compiled is not None:
+        return compiled
+
+    compiled = {}
+    found = find_user_templates()
+    if len( found ) != 0:
+        cache = load_cache()
+        dirty = False
+        for name, ( path, mtime, size ) in found.items():
+            entry = cache.get( path )
+            if entry is not None and entry[0] == mtime and entry[1] == size:
+                compiled[name] = entry[2]
+                continue
+            try:
+                with open( path, "r", encoding="utf-8" ) as read_file:
+                    parts = compile_template( read_file.read(), name )
+            except OSError as err:
+                raise TemplateError( "could not read template \"" + path + "\": " + str(err) )
+            compiled[name] = parts
+            cache[path]    = ( mtime, size, parts )
+            dirty = True
+        if dirty:
+            save_cache( cache )
+    return compiled
+
+def author() -> str:
+    return os.environ.get( "SCAFFOLD_AUTHOR", common.author )
+
+def default_field( field:str, template:str ) -> str:
+    match field:
+        case "author":
+            return author()
+        case "date":
+            return common.today_string()
+        case "year":
+            return common.today_string()[-4:]
+        case _:
+            raise TemplateError( "template \"" + template + "\" uses unknown field \"" + field + "\"" )
+
+def get( name:str ) -> tuple:
+    parts = load().get( name )
+    if parts is None:
+        parts = compile_template( builtin_text( name ), name )
+        compiled[name] = parts
+    return parts
+
+def render( template:str, /, **context ) -> str:
+    # positional only so "name" can be used as a field
+    try:
+        parts = get( template )
+        text  = [ parts[0] ]
+        for idx in range( 1, len( parts ), 2 ):
+            field = parts[idx]
+            value = context.get( field )
+            if value is None:
+                value = default_field( field, template )
+                context[field] = value
+            text.append( str(value) )
+            text.append( parts[idx + 1] )
+    except TemplateError as err:
+        common.print_fatal( str(err) )
+    return "".join( text )
+
+if __name__ == "__main__":
+    if len( sys.argv ) != 2 or sys.argv[1] in ( "-h", "--help" ):
+        common.print_help( "templates: write the built-in templates to given directory" )
+        common.print_help( " usage: templates.py <directory>" )
+        common.print_help( " template directories: " + ", ".join( template_dirs() ) )
+        sys.exit(0)
+
+    for module_name in sorted( set( lazy_modules.values() ) ):
+        load_builtin( module_name )
+    os.makedirs( sys.argv[1], exist_ok=True )
+    for name, text in builtin.items():
+        path = os.path.join( sys.argv[1], name + extension )
+        if os.path.isfile( path ):
+            common.print_err( "template \"" + path + "\" already exists" )
+            continue
+        with open( path, "w", newline='\n' ) as write_file:
+            write_file.write( text )
+        common.print_status( "created template \"" + path + "\"" )
@@ -0,0 +1,23 @@
+# * Description:  Shared pytest setup, makes the modules in src importable
+# * Author:       Alicia Amarilla ( smushyaa@gmail.com )
+# * File Created: October 19, 2026
+
+import sys
+import os
+
+import pytest
+
+root_dir = os.path.dirname( os.path.dirname( os.path.abspath( __file__ ) ) )
+src_dir  = os.path.join( root_dir, "src" )
+
+if not( src_dir in sys.path ):
+    sys.path.insert( 0, src_dir )
+
+@pytest.fixture( autouse=True )
+def user_dirs( tmp_path_factory, monkeypatch ):
+    # template caches and skeleton snapshots never touch the real user directories
+    home = tmp_path_factory.mktemp( "home" )
+    monkeypatch.setenv( "XDG_CACHE_HOME", str(home / "cache") )
+    monkeypatch.setenv( "XDG_CONFIG_HOME", str(home / "config") )
+    monkeypatch.delenv( "SCAFFOLD_TEMPLATES", raising=False )
+    monkeypatch.delenv( "SCAFFOLD_AUTHOR", raising=False )
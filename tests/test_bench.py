@@ -0,0 +1,66 @@
+# * Description:  Tests for the result and baseline handling of bench.py
+# * Author:       Alicia Amarilla ( smushyaa@gmail.com )
+# * File Created: October 19, 2026
+
+import sys
+import os
+import json
+import importlib.util
+import subprocess
+
+import pytest
+
+from conftest import root_dir
+
+bench_path = os.path.join( root_dir, "bench.py" )
+spec  = importlib.util.spec_from_file_location( "bench", bench_path )
+bench = importlib.util.module_from_spec( spec )
+spec.loader.exec_module( bench )
+
+def test_result():
+    assert bench.result( [ 3.0, 1.0, 2.0 ], 4 ) == {
+        "median_ms": 2.0, "min_ms": 1.0, "max_ms": 3.0, "runs": 3, "files_per_s": 2000.0,
+    }
+    assert not( "files_per_s" in bench.result( [ 1.0 ] ) )
+
+def test_compare_threshold():
+    baseline = { "startup.cnew": { "median_ms": 100.0 }, "startup.cproj": { "median_ms": 100.0 } }
+    assert not( bench.compare( { "startup.cnew": { "median_ms": 109.0 } }, baseline, 10.0 ) )
+    assert bench.compare( { "startup.cnew": { "median_ms": 111.0 } }, baseline, 10.0 )
+    # cases missing from the baseline are not compared
+    assert not( bench.compare( { "init.cproj": { "median_ms": 1000.0 } }, baseline, 10.0 ) )
+
+def test_failing_command_raises( tmp_path ):
+    with pytest.raises( bench.CaseError, match="exited with 3:\nbroken" ):
+        bench.run( [ sys.executable, "-c", "import sys; sys.stderr.write( 'broken' ); sys.exit( 3 )" ], str(tmp_path) )
+
+def test_startup_against_baseline( tmp_path ):
+    output   = os.path.join( str(tmp_path), "startup.json" )
+    baseline = os.path.join( str(tmp_path), "baseline.json" )
+    cmd      = [ sys.executable, bench_path, "-c", "startup", "-n", "1" ]
+
+    proc = subprocess.run( cmd + [ "-o", output ], stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True )
+    assert proc.returncode == 0, proc.stdout
+    with open( output, "r" ) as read_file:
+        report = json.load( read_file )
+    assert sorted( report["results"] ) == [ "startup.cnew", "startup.cproj", "startup.glnew", "startup.pynew" ]
+
+    # a baseline no run can beat is reported as a regression
+    for res in report["results"].values():
+        res["median_ms"] = 0.001
+    with open( baseline, "w", newline='\n' ) as write_file:
+        json.dump( report, write_file )
+    proc = subprocess.run( cmd + [ "-b", baseline ], stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True )
+    assert proc.returncode == 1
+    assert "REGRESSION" in proc.stdout
+
+@pytest.mark.parametrize( "tool", list( bench.scripts ) )
+def test_startup_skips_optional_imports( tmp_path, tool:str ):
+    # gettext shows up as a failed lookup, re and locale are what it would pull in
+    proc = subprocess.run(
+        [ sys.executable, "-X", "importtime" ] + bench.command( "src", tool )[1:] + bench.startup_args( tool, 0 ),
+        cwd=str(tmp_path), stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+    )
+    assert proc.returncode == 0, proc.stderr
+    imported = set( line.rsplit( "|", 1 )[1].strip() for line in proc.stderr.splitlines() if line.startswith( "import time:" ) )
+    assert not( imported & { "re", "locale", "c_io_templates", "glsl_reload_templates", "glsl_timer_templates", "py_pipeline_templates" } )
@@ -0,0 +1,110 @@
+# * Description:  Compile and run test of the cnew --io module
+# * Author:       Alicia Amarilla ( smushyaa@gmail.com )
+# * File Created: October 19, 2026
+
+import sys
+import os
+import shutil
+import threading
+import subprocess
+
+import pytest
+
+from conftest import src_dir
+
+# copies the records of argv[1] to argv[2] as "<length>:<record>" lines
+main_source = """#include "fio.h"
+#include <stdio.h>
+#include <string.h>
+
+int main( int argc, char** argv ) {
+    fio_view    view;
+    fio_lines   lines;
+    fio_writer  writer;
+    const char* record;
+    size_t      length;
+    char        prefix[32];
+    if( argc != 3 || fio_view_open( &view, argv[1], FIO_SEQUENTIAL ) != 0 ) {
+        return 1;
+    }
+    /* a tiny buffer so records go through both the buffered and the direct path */
+    if( fio_writer_open( &writer, argv[2], 8 ) != 0 ) {
+        return 1;
+    }
+    fio_lines_init( &lines, &view, '\\n' );
+    while( fio_lines_next( &lines, &record, &length ) ) {
+        sprintf( prefix, "%lu:", (unsigned long)length );
+        fio_write( &writer, prefix, strlen( prefix ) );
+        fio_write( &writer, record, length );
+        fio_write( &writer, "\\n", 1 );
+    }
+    if( fio_writer_close( &writer ) != 0 ) {
+        return 1;
+    }
+    printf( "%d ", view.mapped );
+    fio_view_close( &view );
+    return 0;
+}
+"""
+
+text     = "alpha\r\n\nno newline at the end of a longer record"
+expected = "5:alpha\n0:\n40:no newline at the end of a longer record\n"
+
+def build( cwd:str, std:str ) -> str:
+    proc = subprocess.run(
+        [ sys.executable, os.path.join( src_dir, "create_c.py" ), "--io", "fio", "-c", "-q" ],
+        cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True
+    )
+    assert proc.returncode == 0, proc.stdout
+    with open( os.path.join( cwd, "main.c" ), "w", newline='\n' ) as write_file:
+        write_file.write( main_source )
+    subprocess.run(
+        [ "gcc", "-std=" + std, "-Wall", "-Wextra", "-pedantic", "-Werror", "-o", "main", "main.c", "fio.c" ],
+        cwd=cwd, check=True
+    )
+    return os.path.join( cwd, "main" )
+
+def read( path:str ) -> str:
+    with open( path, "r", newline='' ) as read_file:
+        return read_file.read()
+
+@pytest.mark.skipif( shutil.which( "gcc" ) is None or os.name == "nt", reason="needs gcc on posix" )
+@pytest.mark.parametrize( "std", [ "c89", "c99", "c11" ] )
+def test_io_file_and_pipe( tmp_path, std:str ):
+    cwd  = str(tmp_path)
+    main = build( cwd, std )
+    with open( os.path.join( cwd, "in.txt" ), "w", newline='' ) as write_file:
+        write_file.write( text )
+
+    # regular files are mapped
+    proc = subprocess.run( [ main, "in.txt", "out.txt" ], cwd=cwd, stdout=subprocess.PIPE, text=True )
+    assert ( proc.returncode, proc.stdout ) == ( 0, "1 " )
+    assert read( os.path.join( cwd, "out.txt" ) ) == expected
+
+    # a pipe on stdin is read into a buffer, "-" writes to stdout
+    proc = subprocess.run( [ main, "-", "-" ], cwd=cwd, input=text.encode(), stdout=subprocess.PIPE )
+    assert ( proc.returncode, proc.stdout.decode() ) == ( 0, expected + "0 " )
+
+    # empty files are not mapped
+    open( os.path.join( cwd, "empty.txt" ), "w" ).close()
+    proc = subprocess.run( [ main, "empty.txt", "out.txt" ], cwd=cwd, stdout=subprocess.PIPE, text=True )
+    assert ( proc.returncode, proc.stdout ) == ( 0, "0 " )
+    assert read( os.path.join( cwd, "out.txt" ) ) == ""
+
+@pytest.mark.skipif( shutil.which( "gcc" ) is None or not( hasattr( os, "mkfifo" ) ), reason="needs gcc and fifos" )
+def test_io_fifo_is_opened_once( tmp_path ):
+    cwd  = str(tmp_path)
+    main = build( cwd, "c99" )
+    fifo = os.path.join( cwd, "in.fifo" )
+    os.mkfifo( fifo )
+
+    # the writer blocks until the fifo is opened for reading, a second open would hang
+    def feed():
+        with open( fifo, "w", newline='' ) as write_file:
+            write_file.write( text )
+    feeder = threading.Thread( target=feed )
+    feeder.start()
+    proc = subprocess.run( [ main, fifo, "out.txt" ], cwd=cwd, stdout=subprocess.PIPE, text=True, timeout=10 )
+    feeder.join()
+    assert ( proc.returncode, proc.stdout ) == ( 0, "0 " )
+    assert read( os.path.join( cwd, "out.txt" ) ) == expected
@@ -0,0 +1,76 @@
+# * Description:  Tests for the Makefile SRC and compile_commands.json sync of cproj --watch
+# * Author:       Alicia Amarilla ( smushyaa@gmail.com )
+# * File Created: October 19, 2026
+
+import os
+import json
+import shutil
+
+import pytest
+
+import cproj_watch
+
+def write( rel:str, text:str = "" ):
+    os.makedirs( os.path.dirname( rel ) or ".", exist_ok=True )
+    with open( rel, "w", newline='\n' ) as write_file:
+        write_file.write( text )
+
+def src_line() -> str:
+    with open( "Makefile", "r" ) as read_file:
+        return [ line.rstrip( "\n" ) for line in read_file if line.startswith( "SRC = " ) ][0]
+
+def database() -> list:
+    with open( "compile_commands.json", "r" ) as read_file:
+        return [ ( entry["file"], entry["arguments"] ) for entry in json.load( read_file ) ]
+
+@pytest.fixture
+def project( tmp_path, monkeypatch ):
+    monkeypatch.chdir( tmp_path )
+    write( "Makefile", "CC = gcc\n\nSRC = ./src ./external ./src/gone\n\nall:\n" )
+    write( "compile_flags.txt", "gcc\n-std=c99\n" )
+    write( "compile_commands.json", "[]\n" )
+    write( "src/main.c" )
+    write( "src/notes.txt" )
+    write( "src/sub/b.cpp" )
+    write( "src/.cache/skipped.c" )
+    write( "external/lib.c" )
+    return tmp_path
+
+def sync() -> cproj_watch.Watcher:
+    watcher = cproj_watch.Watcher( True, False )
+    watcher.dirty.add( cproj_watch.src_root )
+    watcher.sync()
+    return watcher
+
+def test_update_src():
+    dirs = [ "src", os.path.join( "src", "a" ) ]
+    assert cproj_watch.update_src( [ "./src", "./lib", "./src/old", "./src/" ], dirs ) == [ "./src", "./lib", "./src/a" ]
+
+def test_sync_writes_src_and_database( project ):
+    sync()
+    assert src_line() == "SRC = ./src ./external ./src/sub"
+    assert database() == [
+        ( "src/main.c", [ "gcc", "-std=c99", "-c", "src/main.c", "-o", "src/main.o" ] ),
+        ( "external/lib.c", [ "gcc", "-std=c99", "-c", "external/lib.c", "-o", "external/lib.o" ] ),
+        ( "src/sub/b.cpp", [ "gcc", "-std=c99", "-c", "src/sub/b.cpp", "-o", "src/sub/b.o" ] ),
+    ]
+
+def test_poll_picks_up_changes( project ):
+    watcher = sync()
+    stamp   = os.stat( "Makefile" ).st_mtime_ns
+
+    # nothing changed, nothing is written
+    watcher.poll()
+    assert not( watcher.pending() )
+    watcher.sync()
+    assert os.stat( "Makefile" ).st_mtime_ns == stamp
+
+    shutil.rmtree( "src/sub" )
+    write( "src/new/c.c" )
+    # make sure the directory mtime moves even on coarse clocks
+    os.utime( "src", ns=( stamp + 1000000000, stamp + 1000000000 ) )
+    watcher.poll()
+    assert watcher.pending()
+    watcher.sync()
+    assert src_line() == "SRC = ./src ./external ./src/new"
+    assert [ file for file, _ in database() ] == [ "src/main.c", "external/lib.c", "src/new/c.c" ]
@@ -0,0 +1,95 @@
+# * Description:  Tests for cproj --workspace manifests and the top-level Makefile
+# * Author:       Alicia Amarilla ( smushyaa@gmail.com )
+# * File Created: October 19, 2026
+
+import sys
+import os
+import json
+import subprocess
+
+import pytest
+
+import cproj_workspace
+from conftest import src_dir
+
+workspace = {
+    "defaults": { "c": True, "flags": [ "-DWORKSPACE" ] },
+    "projects": [
+        "core",
+        { "name": "app", "path": "apps/app", "dirs": "ui", "depends": [ "core" ] },
+    ],
+}
+
+def write_manifest( tmp_path, manifest:dict ) -> str:
+    path = os.path.join( str(tmp_path), "workspace.json" )
+    with open( path, "w", newline='\n' ) as write_file:
+        json.dump( manifest, write_file )
+    return path
+
+def read( *parts ) -> str:
+    with open( os.path.join( *parts ), "r" ) as read_file:
+        return read_file.read()
+
+def test_load_normalizes_entries( tmp_path ):
+    entries = cproj_workspace.load( write_manifest( tmp_path, workspace ) )
+    assert [ ( e["name"], e["path"], e["c"], e["dirs"], e["flags"], e["depends"] ) for e in entries ] == [
+        ( "core", "core", True, [], [ "-DWORKSPACE" ], [] ),
+        ( "app", "apps/app", True, [ "ui" ], [ "-DWORKSPACE" ], [ "core" ] ),
+    ]
+
+@pytest.mark.parametrize( "projects", [
+    [ "core", "core" ],
+    [ "all" ],
+    [ "my app" ],
+    [ { "name": "app", "depends": [ "missing" ] } ],
+    [ { "name": "app", "dirs": [ 1 ] } ],
+] )
+def test_load_rejects_invalid_projects( tmp_path, projects:list ):
+    with pytest.raises( SystemExit ):
+        cproj_workspace.load( write_manifest( tmp_path, { "projects": projects } ) )
+
+def test_render_makefile():
+    entries = [
+        { "name": "core", "path": "core", "depends": [] },
+        { "name": "app", "path": "apps\\app", "depends": [ "core" ] },
+    ]
+    makefile = cproj_workspace.render_makefile( ".", entries )
+    assert makefile.startswith( cproj_workspace.makefile_marker + "\n" )
+    assert "PROJECTS = core app\n" in makefile
+    assert "core:\n\t$(MAKE) -C core $(PROJECT_CONFIG)\n" in makefile
+    assert "app: core\n\t$(MAKE) -C apps/app $(PROJECT_CONFIG)\n" in makefile
+    assert "clean:\n\t-$(MAKE) -C core clean\n\t-$(MAKE) -C apps/app clean\n" in makefile
+
+def run_workspace( tmp_path ) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [ sys.executable, os.path.join( src_dir, "create_cproj.py" ), "--workspace", "workspace.json", "-j", "2" ],
+        cwd=str(tmp_path), stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True
+    )
+
+def test_workspace_init_then_no_op( tmp_path ):
+    write_manifest( tmp_path, workspace )
+
+    proc = run_workspace( tmp_path )
+    assert proc.returncode == 0, proc.stdout
+    assert "2 projects, 2 initialized, 0 updated, 0 with errors, 0 failed" in proc.stdout
+    assert os.path.isdir( os.path.join( str(tmp_path), "apps", "app", "src", "ui" ) )
+    assert "-DWORKSPACE" in read( str(tmp_path), "core", "compile_flags.txt" )
+    assert "gcc" in read( str(tmp_path), "core", "Makefile" ).split( "\n", 2 )[1]
+    makefile = read( str(tmp_path), "Makefile" )
+
+    # the manifest describes the projects, running it again changes nothing
+    proc = run_workspace( tmp_path )
+    assert proc.returncode == 0, proc.stdout
+    assert "2 projects, 0 initialized, 2 updated, 0 with errors, 0 failed" in proc.stdout
+    assert read( str(tmp_path), "Makefile" ) == makefile
+    assert read( str(tmp_path), "core", "compile_flags.txt" ).count( "-DWORKSPACE" ) == 1
+
+def test_foreign_makefile_is_kept( tmp_path ):
+    write_manifest( tmp_path, { "projects": [ "core" ] } )
+    with open( os.path.join( str(tmp_path), "Makefile" ), "w", newline='\n' ) as write_file:
+        write_file.write( "all:\n" )
+
+    proc = run_workspace( tmp_path )
+    assert proc.returncode == 255
+    assert "was not generated by cproj --workspace" in proc.stdout
+    assert read( str(tmp_path), "Makefile" ) == "all:\n"
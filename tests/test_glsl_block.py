@@ -0,0 +1,103 @@
+# * Description:  Tests for std140/std430 offsets of glnew --block
+# * Author:       Alicia Amarilla ( smushyaa@gmail.com )
+# * File Created: October 19, 2026
+
+import sys
+import os
+import shutil
+import subprocess
+
+import pytest
+
+import glsl_block
+from conftest import src_dir
+
+fields = [
+    "pos:vec3", "intensity:float", "color:vec4", "lights:vec3[4]",
+    "model:mat4", "uv:vec2", "flags:uint[3]", "normal:mat3",
+]
+
+def offsets( field_specs:list, layout:str ):
+    laid_out, size = glsl_block.layout_block( field_specs, layout )
+    return [ ( field.name, field.offset ) for field in laid_out ], size
+
+def test_std140_offsets():
+    assert offsets( fields, "std140" ) == ( [
+        ( "pos", 0 ), ( "intensity", 12 ), ( "color", 16 ), ( "lights", 32 ),
+        ( "model", 96 ), ( "uv", 160 ), ( "flags", 176 ), ( "normal", 224 ),
+    ], 272 )
+
+def test_std430_offsets():
+    assert offsets( fields, "std430" ) == ( [
+        ( "pos", 0 ), ( "intensity", 12 ), ( "color", 16 ), ( "lights", 32 ),
+        ( "model", 96 ), ( "uv", 160 ), ( "flags", 168 ), ( "normal", 192 ),
+    ], 240 )
+
+@pytest.mark.parametrize( "layout, stride, size", [ ( "std140", 16, 32 ), ( "std430", 4, 8 ) ] )
+def test_scalar_array_stride( layout:str, stride:int, size:int ):
+    laid_out, block_size = glsl_block.layout_block( [ "weights:float[2]" ], layout )
+    assert ( laid_out[0].stride, block_size ) == ( stride, size )
+
+def test_double_vectors():
+    assert offsets( [ "d:double", "v:dvec3", "m:dmat2x3" ], "std430" ) == (
+        [ ( "d", 0 ), ( "v", 32 ), ( "m", 64 ) ], 128
+    )
+
+def test_c_declarations_spell_out_padding():
+    std140, _ = glsl_block.layout_block( fields, "std140" )
+    std430, _ = glsl_block.layout_block( fields, "std430" )
+    assert [ field.c() for field in std140 ] == [
+        "float pos[3]", "float intensity", "float color[4]", "float lights[4][4]",
+        "float model[4][4]", "float uv[2]", "uint32_t flags[3][4]", "float normal[3][4]",
+    ]
+    assert std430[6].c() == "uint32_t flags[3]"
+
+@pytest.mark.parametrize( "specs, message", [
+    ( [], "block needs at least one field" ),
+    ( [ "a:float", "a:int" ], "field \"a\" is defined twice" ),
+    ( [ "a:vec5" ], "unknown type \"vec5\"" ),
+    ( [ "a:float[0]" ], "invalid array size" ),
+    ( [ "9a:float" ], "must be name:type" ),
+] )
+def test_invalid_fields( specs:list, message:str ):
+    with pytest.raises( glsl_block.BlockError ) as err:
+        glsl_block.layout_block( specs, "std140" )
+    assert message in str(err.value)
+
+@pytest.mark.skipif( shutil.which( "gcc" ) is None, reason="needs gcc" )
+@pytest.mark.parametrize( "layout", glsl_block.layouts )
+@pytest.mark.parametrize( "std", [ "c89", "c11" ] )
+def test_header_asserts_hold( tmp_path, layout:str, std:str ):
+    laid_out, size = glsl_block.layout_block( fields, layout )
+    context = { "info": "", "guard_begin": "#pragma once", "guard_end": "" }
+    header  = glsl_block.render_header( "Scene", laid_out, size, layout, context )
+
+    source = os.path.join( str(tmp_path), "scene.c" )
+    with open( os.path.join( str(tmp_path), "scene.h" ), "w", newline='\n' ) as write_file:
+        write_file.write( header )
+    with open( source, "w", newline='\n' ) as write_file:
+        write_file.write( "#include \"scene.h\"\nint main( void ) { return 0; }\n" )
+    proc = subprocess.run(
+        [ "gcc", "-std=" + std, "-Wall", "-Wextra", "-pedantic", "-Werror", "-fsyntax-only", source ],
+        stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True
+    )
+    assert proc.returncode == 0, proc.stdout
+
+def glnew( cwd:str, *args ) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [ sys.executable, os.path.join( src_dir, "create_glsl.py" ) ] + list( args ),
+        cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True
+    )
+
+def test_fields_only_with_block( tmp_path ):
+    cwd  = str(tmp_path)
+    proc = glnew( cwd, "--block", "scene", "pos:vec3", "-q", "color:vec4" )
+    assert proc.returncode == 0, proc.stdout
+    with open( os.path.join( cwd, "scene.glsl" ), "r" ) as read_file:
+        assert "color" in read_file.read()
+
+    # every other mode used to drop them silently
+    for args in ( [ "shader", "extra" ], [ "--hot_reload", "reload", "pos:vec3" ], [ "--check", cwd, "stray" ] ):
+        proc = glnew( cwd, *args )
+        assert proc.returncode == 255
+        assert "unexpected argument" in proc.stdout
@@ -0,0 +1,132 @@
+# * Description:  Tests for the binary layout and C header of glnew --bundle
+# * Author:       Alicia Amarilla ( smushyaa@gmail.com )
+# * File Created: October 19, 2026
+
+import os
+import shutil
+import struct
+import subprocess
+
+import pytest
+
+import glsl_bundle
+
+context = { "info": "", "guard_begin": "#pragma once", "guard_end": "" }
+
+def write( root, rel:str, data:bytes ) -> str:
+    path = os.path.join( str(root), rel )
+    os.makedirs( os.path.dirname( path ), exist_ok=True )
+    with open( path, "wb" ) as write_file:
+        write_file.write( data )
+    return path
+
+def test_fnv1a64():
+    assert glsl_bundle.fnv1a64( b"" ) == 0xcbf29ce484222325
+    assert glsl_bundle.fnv1a64( b"a" ) == 0xaf63dc4c8601ec8c
+
+def test_pack_layout():
+    shaders = [ ( "a.vs", b"void main() {}\n" ), ( "post/blur.fs", b"#version 450\n" ) ]
+    bundle, entries = glsl_bundle.pack( shaders )
+
+    magic, version, count, names_offset = struct.unpack_from( "<4sIII", bundle, 0 )
+    assert ( magic, version, count ) == ( b"GLSB", 1, 2 )
+    assert names_offset == glsl_bundle.header_size + glsl_bundle.entry_size * 2
+
+    for index, ( name, source ) in enumerate( shaders ):
+        name_offset, name_length, offset, length, hash = struct.unpack_from(
+            "<IIIIQ", bundle, glsl_bundle.header_size + glsl_bundle.entry_size * index
+        )
+        assert bundle[name_offset:name_offset + name_length + 1] == name.encode( "utf-8" ) + b"\0"
+        assert offset % glsl_bundle.alignment == 0
+        assert bundle[offset:offset + length + 1] == source + b"\0"
+        assert hash == glsl_bundle.fnv1a64( source )
+        assert entries[index] == ( name, offset, length, hash )
+    assert len( bundle ) % glsl_bundle.alignment == 0
+
+def test_collect_names_are_relative( tmp_path ):
+    write( tmp_path, "b/c.fs", b"c" )
+    write( tmp_path, "a.vs", b"a" )
+    write( tmp_path, "notes.txt", b"not a shader" )
+    assert glsl_bundle.collect( str(tmp_path) ) == [ ( "a.vs", b"a" ), ( "b/c.fs", b"c" ) ]
+
+reader_source = """#include "shaders.h"
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+
+int main( void ) {
+    static char bundle[SHADERS_SIZE];
+    FILE* file = fopen( SHADERS_FILE, "rb" );
+    int   i;
+    if( !file || fread( bundle, 1, SHADERS_SIZE, file ) != SHADERS_SIZE ) {
+        return 2;
+    }
+    fclose( file );
+    for( i = 0; i < SHADERS_COUNT; ++i ) {
+        const char* source = shaders_source( bundle, i );
+        if( (int)strlen( source ) != shaders_length( i ) ) {
+            return 3;
+        }
+        printf( "%s:%s:%08lx%08lx|", SHADERS_ENTRIES[i].name, source, SHADERS_ENTRIES[i].hash_high, SHADERS_ENTRIES[i].hash_low );
+    }
+    return SHADERS_ENTRIES[SHADERS_COUNT].name != 0;
+}
+"""
+
+def compile_reader( output, std:str ) -> subprocess.CompletedProcess:
+    write( output, "main.c", reader_source.encode( "utf-8" ) )
+    subprocess.run(
+        [ "gcc", "-std=" + std, "-Wall", "-Wextra", "-pedantic", "-Werror", "-o", "reader", "main.c" ],
+        cwd=str(output), check=True
+    )
+    return subprocess.run( [ os.path.join( str(output), "reader" ) ], cwd=str(output), stdout=subprocess.PIPE, text=True )
+
+@pytest.mark.skipif( shutil.which( "gcc" ) is None, reason="needs gcc" )
+@pytest.mark.parametrize( "std", [ "c89", "c99", "c11" ] )
+def test_header_reads_bundle( tmp_path, std:str ):
+    root   = tmp_path / "shaders"
+    output = tmp_path / "out"
+    write( root, "a.vs", b"A" )
+    write( root, "post/blur.fs", b"BLUR" )
+
+    bundle_path, header_path, count = glsl_bundle.bundle_tree( str(root), str(output), "shaders", context )
+    assert count == 2
+
+    proc = compile_reader( output, std )
+    assert ( proc.returncode, proc.stdout ) == ( 0, "a.vs:A:{:016x}|post/blur.fs:BLUR:{:016x}|".format(
+        glsl_bundle.fnv1a64( b"A" ), glsl_bundle.fnv1a64( b"BLUR" )
+    ) )
+
+@pytest.mark.skipif( shutil.which( "gcc" ) is None or os.name == "nt", reason="needs gcc and quotes in file names" )
+def test_header_escapes_names( tmp_path ):
+    root   = tmp_path / "shaders"
+    output = tmp_path / "out"
+    # ??= is the trigraph for # under -std=c89
+    write( root, "say \"hi\"??=.vs", b"Q" )
+
+    glsl_bundle.bundle_tree( str(root), str(output), "shaders", context )
+    proc = compile_reader( output, "c89" )
+    assert proc.returncode == 0
+    assert proc.stdout.startswith( "say \"hi\"??=.vs:Q:" )
+
+def test_empty_directory_is_an_error( tmp_path ):
+    write( tmp_path, "notes.txt", b"not a shader" )
+    with pytest.raises( glsl_bundle.BundleError, match="no shaders found" ):
+        glsl_bundle.bundle_tree( str(tmp_path), str(tmp_path / "out"), "shaders", context )
+    assert not( os.path.exists( str(tmp_path / "out") ) )
+
+@pytest.mark.skipif( shutil.which( "gcc" ) is None, reason="needs gcc" )
+def test_header_without_entries_compiles( tmp_path ):
+    # render_header is also used directly, no entries leaves out the enum
+    write( tmp_path, "shaders.h", glsl_bundle.render_header( "shaders", "shaders.bin", [], 16, context ).encode( "utf-8" ) )
+    write( tmp_path, "main.c", b"#include \"shaders.h\"\nint main( void ) { return SHADERS_ENTRIES[SHADERS_COUNT].name != 0; }\n" )
+    subprocess.run(
+        [ "gcc", "-std=c89", "-Wall", "-Wextra", "-pedantic", "-Werror", "-o", "main", "main.c" ],
+        cwd=str(tmp_path), check=True
+    )
+
+def test_bundle_skips_output_dir( tmp_path ):
+    write( tmp_path, "a.vs", b"a" )
+    write( tmp_path, "out/a.vs", b"flattened copy" )
+    _, _, count = glsl_bundle.bundle_tree( str(tmp_path), str(tmp_path / "out"), "shaders", context )
+    assert count == 1
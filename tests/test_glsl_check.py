@@ -0,0 +1,71 @@
+# * Description:  Tests for the validation cache of glnew --check
+# * Author:       Alicia Amarilla ( smushyaa@gmail.com )
+# * File Created: October 19, 2026
+
+import sys
+import os
+
+import glsl_check
+
+# stands in for glslangValidator, counts its runs, fails on "error"
+# and writes the stage name as SPIR-V
+validator_source = """import sys
+stage, input_path, output_path, runs_path = sys.argv[1:]
+with open( runs_path, "a" ) as runs:
+    runs.write( stage + "\\n" )
+with open( input_path ) as read_file:
+    source = read_file.read()
+if "error" in source:
+    print( "ERROR: " + stage + " shader has an error" )
+    sys.exit( 1 )
+with open( output_path, "wb" ) as write_file:
+    write_file.write( stage.encode() )
+"""
+
+def write( root, rel:str, text:str ) -> str:
+    path = os.path.join( str(root), rel )
+    os.makedirs( os.path.dirname( path ), exist_ok=True )
+    with open( path, "w", newline='\n' ) as write_file:
+        write_file.write( text )
+    return path
+
+def runs( tmp_path ) -> list:
+    try:
+        with open( os.path.join( str(tmp_path), "runs.txt" ) ) as read_file:
+            return read_file.read().split()
+    except OSError:
+        return []
+
+def check( tmp_path, defines:list = [] ):
+    validator = write( tmp_path, "validator.py", validator_source )
+    command   = " ".join( [
+        sys.executable, validator, "{stage}", "{input}", "{output}", os.path.join( str(tmp_path), "runs.txt" )
+    ] )
+    root = os.path.join( str(tmp_path), "shaders" )
+    return glsl_check.check_tree( root, os.path.join( root, "out" ), command, defines, 2 )
+
+def test_cache_hit_and_miss( tmp_path ):
+    write( tmp_path, "shaders/a.vs", "#version 450\nvoid main() {}\n" )
+    write( tmp_path, "shaders/b.fs", "#version 450\nvoid main() {}\n" )
+
+    assert check( tmp_path ) == ( [ "a.vs", "b.fs" ], 0, [] )
+    assert sorted( runs( tmp_path ) ) == [ "frag", "vert" ]
+    with open( os.path.join( str(tmp_path), "shaders", "out", "a.vs.spv" ), "rb" ) as read_file:
+        assert read_file.read() == b"vert"
+
+    # unchanged shaders are never validated again
+    assert check( tmp_path ) == ( [ "a.vs", "b.fs" ], 2, [] )
+    assert len( runs( tmp_path ) ) == 2
+
+    # a changed shader or different defines miss the cache
+    write( tmp_path, "shaders/b.fs", "#version 450\nvoid main() { }\n" )
+    assert check( tmp_path ) == ( [ "a.vs", "b.fs" ], 1, [] )
+    assert check( tmp_path, [ "FOG" ] ) == ( [ "a.vs", "b.fs" ], 0, [] )
+    assert len( runs( tmp_path ) ) == 5
+
+def test_failures_are_cached_with_their_log( tmp_path ):
+    write( tmp_path, "shaders/a.vs", "#version 450\nerror\n" )
+
+    assert check( tmp_path ) == ( [], 0, [ ( "a.vs", "ERROR: vert shader has an error\n" ) ] )
+    assert check( tmp_path ) == ( [], 1, [ ( "a.vs", "ERROR: vert shader has an error\n" ) ] )
+    assert runs( tmp_path ) == [ "vert" ]
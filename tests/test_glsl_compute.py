@@ -0,0 +1,66 @@
+# * Description:  Tests for workgroup sizes and the dispatch helper of glnew --compute
+# * Author:       Alicia Amarilla ( smushyaa@gmail.com )
+# * File Created: October 19, 2026
+
+import os
+import shutil
+import subprocess
+
+import pytest
+
+import glsl_compute
+
+context = { "info": "", "guard_begin": "#pragma once", "guard_end": "" }
+
+def test_local_size():
+    assert glsl_compute.local_size( "8,8" ) == ( 8, 8, 1 )
+    assert glsl_compute.local_size( [ 256 ] ) == ( 256, 1, 1 )
+    for value in ( "8,x", [ 0 ], [ 1, 1, 65 ], [ 64, 32 ], [ 1, 2, 3, 4 ] ):
+        with pytest.raises( glsl_compute.ComputeError ):
+            glsl_compute.local_size( value )
+
+def test_workgroup_table( tmp_path ):
+    path = os.path.join( str(tmp_path), "workgroups.toml" )
+    with open( path, "w", newline='\n' ) as write_file:
+        write_file.write( "default = [ 128 ]\nimage = [ 8, 8 ]\n" )
+
+    assert glsl_compute.choose_local_size( "4", "image", path ) == ( 4, 1, 1 )
+    assert glsl_compute.choose_local_size( "", "image", path ) == ( 8, 8, 1 )
+    assert glsl_compute.choose_local_size( "", "", path ) == ( 128, 1, 1 )
+    with pytest.raises( glsl_compute.ComputeError, match="is not in" ):
+        glsl_compute.choose_local_size( "", "missing", path )
+
+def test_unknown_barrier():
+    with pytest.raises( glsl_compute.ComputeError, match="unknown barrier" ):
+        glsl_compute.render_dispatch( "cull.cs", ( 8, 8, 1 ), [ "everything" ], context )
+
+dispatch_source = """#include <stdio.h>
+#define GL_SHADER_STORAGE_BARRIER_BIT 0x2000u
+#define GL_COMMAND_BARRIER_BIT 0x40u
+static unsigned int barrier_bits = 0;
+static void glDispatchCompute( unsigned int x, unsigned int y, unsigned int z ) { printf( "%u %u %u ", x, y, z ); }
+static void glMemoryBarrier( unsigned int bits ) { barrier_bits = bits; }
+#include "cull_dispatch.h"
+
+int main( void ) {
+    cull_dispatch( 100, 9, 1 );
+    printf( "%x", barrier_bits );
+    return 0;
+}
+"""
+
+@pytest.mark.skipif( shutil.which( "gcc" ) is None, reason="needs gcc" )
+@pytest.mark.parametrize( "std", [ "c89", "c99", "c11" ] )
+def test_dispatch_rounds_up_to_workgroups( tmp_path, std:str ):
+    header = glsl_compute.render_dispatch( "cull.cs", ( 8, 8, 1 ), [ "storage", "command", "storage" ], context )
+    with open( os.path.join( str(tmp_path), "cull_dispatch.h" ), "w", newline='\n' ) as write_file:
+        write_file.write( header )
+    with open( os.path.join( str(tmp_path), "main.c" ), "w", newline='\n' ) as write_file:
+        write_file.write( dispatch_source )
+
+    subprocess.run(
+        [ "gcc", "-std=" + std, "-Wall", "-Wextra", "-pedantic", "-Werror", "-o", "main", "main.c" ],
+        cwd=str(tmp_path), check=True
+    )
+    proc = subprocess.run( [ os.path.join( str(tmp_path), "main" ) ], stdout=subprocess.PIPE, text=True )
+    assert proc.stdout == "13 2 1 2040"
@@ -0,0 +1,97 @@
+# * Description:  Tests for include flattening and #line output of glnew --flatten
+# * Author:       Alicia Amarilla ( smushyaa@gmail.com )
+# * File Created: October 19, 2026
+
+import os
+
+import pytest
+
+import glsl_flatten
+
+def write( root, rel:str, text:str ) -> str:
+    path = os.path.join( str(root), rel )
+    os.makedirs( os.path.dirname( path ), exist_ok=True )
+    with open( path, "w", newline='\n' ) as write_file:
+        write_file.write( text )
+    return path
+
+def test_line_directives_around_includes( tmp_path ):
+    write( tmp_path, "lib/common.glsl", "#pragma once\nfloat square( float x ) { return x * x; }\n" )
+    write( tmp_path, "lib/light.glsl", "#include \"common.glsl\"\nvec3 light() { return vec3( square( 2.0 ) ); }\n" )
+    shader = write( tmp_path, "a.fs", (
+        "#version 450\n"
+        "#include \"lib/light.glsl\"\n"
+        "#include <lib/common.glsl>\n"
+        "void main() {}\n"
+    ) )
+
+    text, deps = glsl_flatten.Flattener( str(tmp_path) ).flatten( shader )
+    assert text == (
+        "#version 450\n"
+        "#line 1 1\n"
+        "#line 1 2\n"
+        "// #pragma once\n"
+        "float square( float x ) { return x * x; }\n"
+        "#line 2 1\n"
+        "vec3 light() { return vec3( square( 2.0 ) ); }\n"
+        "#line 3 0\n"
+        "// #include <lib/common.glsl> (already included)\n"
+        "void main() {}\n"
+        "\n"
+        "// source strings:\n"
+        "//   0: a.fs\n"
+        "//   1: lib/light.glsl\n"
+        "//   2: lib/common.glsl\n"
+    )
+    assert deps == [ os.path.join( str(tmp_path), p ) for p in ( "a.fs", "lib/light.glsl", "lib/common.glsl" ) ]
+
+def test_version_in_include_is_commented( tmp_path ):
+    write( tmp_path, "inc.glsl", "#version 450\nconst int N = 4;\n" )
+    shader = write( tmp_path, "a.vs", "#version 450\n#include \"inc.glsl\"\n" )
+
+    text, _ = glsl_flatten.Flattener( str(tmp_path) ).flatten( shader )
+    assert text.splitlines()[:5] == [ "#version 450", "#line 1 1", "// #version 450", "const int N = 4;", "#line 3 0" ]
+
+def test_circular_include( tmp_path ):
+    write( tmp_path, "a.glsl", "#include \"b.glsl\"\n" )
+    write( tmp_path, "b.glsl", "#include \"a.glsl\"\n" )
+    shader = write( tmp_path, "c.fs", "#include \"a.glsl\"\n" )
+
+    with pytest.raises( glsl_flatten.IncludeError, match="circular include: c.fs -> a.glsl -> b.glsl -> a.glsl" ):
+        glsl_flatten.Flattener( str(tmp_path) ).flatten( shader )
+
+def test_includes_in_conditional_blocks( tmp_path ):
+    write( tmp_path, "x.glsl", "const int X = 1;\n" )
+    shader = write( tmp_path, "a.fs", (
+        "#ifdef A\n"
+        "#include \"x.glsl\"\n"
+        "#else\n"
+        "#include \"x.glsl\"\n"
+        "#endif\n"
+        "#include \"x.glsl\"\n"
+        "#include \"x.glsl\"\n"
+    ) )
+
+    text, deps = glsl_flatten.Flattener( str(tmp_path) ).flatten( shader )
+    # both branches get the file, the first include outside the block as well
+    assert text.splitlines()[:14] == [
+        "#ifdef A", "#line 1 1", "const int X = 1;", "#line 3 0",
+        "#else", "#line 1 1", "const int X = 1;", "#line 5 0",
+        "#endif", "#line 1 1", "const int X = 1;", "#line 7 0",
+        "// #include \"x.glsl\" (already included)", "",
+    ]
+    assert deps == [ shader, os.path.join( str(tmp_path), "x.glsl" ) ]
+
+def test_insert_defines_keeps_line_numbers():
+    text = "#version 450\nvoid main() {}\n"
+    assert glsl_flatten.insert_defines( text, [ "FOG", "LIGHTS=4" ] ) == (
+        "#version 450\n#define FOG 1\n#define LIGHTS 4\n#line 2 0\nvoid main() {}\n"
+    )
+
+def test_flatten_tree_skips_unchanged( tmp_path ):
+    root   = tmp_path / "shaders"
+    output = root / "out"
+    write( root, "a.vs", "#version 450\nvoid main() {}\n" )
+
+    assert glsl_flatten.flatten_tree( str(root), str(output) ) == ( [ "a.vs" ], [], [] )
+    assert glsl_flatten.flatten_tree( str(root), str(output) ) == ( [], [ "a.vs" ], [] )
@@ -0,0 +1,97 @@
+# * Description:  Tests for preprocessing and variant dedup of glnew --permute
+# * Author:       Alicia Amarilla ( smushyaa@gmail.com )
+# * File Created: October 19, 2026
+
+import os
+
+import pytest
+
+import glsl_flatten
+import glsl_permute
+
+def permute( tmp_path, source:str, axes:list ):
+    path = os.path.join( str(tmp_path), "a.fs" )
+    with open( path, "w", newline='\n' ) as write_file:
+        write_file.write( source )
+    return glsl_permute.permute_shader( glsl_flatten.Flattener( str(tmp_path) ), path, axes )
+
+def test_preprocess_resolves_conditionals():
+    text = (
+        "#version 450\n"
+        "#define LIGHTS 2\n"
+        "// comment\n"
+        "#if LIGHTS > 1 && !defined( FOG )\n"
+        "int many; /* inline */\n"
+        "#elif LIGHTS == 1\n"
+        "int one;\n"
+        "#else\n"
+        "int none;\n"
+        "#endif\n"
+        "\n"
+        "#ifdef FOG\n"
+        "int fog;\n"
+        "#endif\n"
+        "int count = LIGHTS;\n"
+    )
+    assert glsl_permute.preprocess( text ) == "#version 450\nint many ;\nint count = 2 ;"
+
+def test_preprocess_expands_function_like_macros():
+    text = (
+        "#define QUALITY 3\n"
+        "#define SCALE( x ) ( ( x ) * QUALITY )\n"
+        "#define NAME( a, b ) a ## b\n"
+        "float NAME( blur, _radius ) = SCALE( 2.0 );\n"
+        "float SCALE_ = 1.0;\n"
+    )
+    assert glsl_permute.preprocess( text ) == (
+        "float blur_radius = ( ( 2.0 ) * 3 ) ;\nfloat SCALE_ = 1.0 ;"
+    )
+
+def test_preprocess_tab_after_directive():
+    text = "#define\tX 1\n#ifdef\tX\nint x = X;\n#endif\t\n#undef\tX\nint y = X;\n"
+    assert glsl_permute.preprocess( text ) == "int x = 1 ;\nint y = X ;"
+
+def test_preprocess_unterminated_if():
+    with pytest.raises( glsl_permute.PermuteError, match="unterminated #if" ):
+        glsl_permute.preprocess( "#if 1\nint a;\n" )
+
+def test_combinations_masks():
+    switch  = glsl_permute.Axis( "FOG", None )
+    quality = glsl_permute.Axis( "QUALITY", [ 1, 2, 3 ] )
+    quality.shift = switch.bits
+    assert quality.bits == 2
+    assert glsl_permute.combinations( [ switch, quality ] ) == [
+        ( 0, [ "QUALITY=1" ] ),
+        ( 1, [ "FOG", "QUALITY=1" ] ),
+        ( 2, [ "QUALITY=2" ] ),
+        ( 3, [ "FOG", "QUALITY=2" ] ),
+        ( 4, [ "QUALITY=3" ] ),
+        ( 5, [ "FOG", "QUALITY=3" ] ),
+    ]
+
+def test_unused_axis_shares_one_variant( tmp_path ):
+    variants, table = permute( tmp_path, "#version 450\nvoid main() {}\n", [ glsl_permute.Axis( "FOG", None ) ] )
+    assert len( variants ) == 1
+    assert table == { 0: 0, 1: 0 }
+
+def test_used_axis_gets_a_variant_per_value( tmp_path ):
+    source = "#version 450\n#ifdef FOG\nfloat fog;\n#endif\nvoid main() {}\n"
+    variants, table = permute( tmp_path, source, [ glsl_permute.Axis( "FOG", None ) ] )
+    assert len( variants ) == 2
+    assert table == { 0: 0, 1: 1 }
+    assert variants[1][0].splitlines()[:3] == [ "#version 450", "#define FOG 1", "#line 2 0" ]
+
+def test_values_with_identical_output_are_merged( tmp_path ):
+    source = "#version 450\n#if QUALITY > 1\nfloat taps[8];\n#else\nfloat taps[4];\n#endif\n"
+    quality = glsl_permute.Axis( "QUALITY", [ 1, 2, 3 ] )
+    variants, table = permute( tmp_path, source, [ quality ] )
+    assert len( variants ) == 2
+    assert table == { 0: 0, 1: 1, 2: 1 }
+
+def test_function_like_macro_values_are_not_merged( tmp_path ):
+    # the axis value only reaches the code through a function-like macro body
+    source = "#version 450\n#define SCALE( x ) ( ( x ) * QUALITY )\nfloat radius = SCALE( 2.0 );\n"
+    quality = glsl_permute.Axis( "QUALITY", [ 1, 2, 3 ] )
+    variants, table = permute( tmp_path, source, [ quality ] )
+    assert len( variants ) == 3
+    assert table == { 0: 0, 1: 1, 2: 2 }
@@ -0,0 +1,122 @@
+# * Description:  Compile and run test of the glnew --gpu_timer module against a stub GL
+# * Author:       Alicia Amarilla ( smushyaa@gmail.com )
+# * File Created: October 19, 2026
+
+import sys
+import os
+import shutil
+import subprocess
+
+import pytest
+
+from conftest import src_dir
+
+# every query finishes in 2 ms, begin and end are logged to catch nested queries
+gl_header = """#ifndef STUB_GL_H
+#define STUB_GL_H
+typedef unsigned int GLuint;
+typedef int GLint;
+typedef int GLsizei;
+typedef unsigned int GLenum;
+typedef unsigned long GLuint64;
+#define GL_NO_ERROR 0
+#define GL_TIME_ELAPSED 0x88BF
+#define GL_QUERY_RESULT 0x8866
+#define GL_QUERY_RESULT_AVAILABLE 0x8867
+extern int gl_queries_running;
+extern int gl_queries_nested;
+void glGenQueries( GLsizei n, GLuint* ids );
+void glDeleteQueries( GLsizei n, const GLuint* ids );
+void glBeginQuery( GLenum target, GLuint id );
+void glEndQuery( GLenum target );
+GLenum glGetError( void );
+void glGetQueryObjectiv( GLuint id, GLenum name, GLint* value );
+void glGetQueryObjectui64v( GLuint id, GLenum name, GLuint64* value );
+#endif
+"""
+
+gl_source = """#include "gl.h"
+int gl_queries_running = 0;
+int gl_queries_nested  = 0;
+void glGenQueries( GLsizei n, GLuint* ids ) { GLsizei i; for( i = 0; i < n; ++i ) ids[i] = (GLuint)i + 1u; }
+void glDeleteQueries( GLsizei n, const GLuint* ids ) { (void)n; (void)ids; }
+void glBeginQuery( GLenum target, GLuint id ) { (void)target; (void)id; gl_queries_nested += gl_queries_running++ > 0; }
+void glEndQuery( GLenum target ) { (void)target; gl_queries_running--; }
+GLenum glGetError( void ) { return GL_NO_ERROR; }
+void glGetQueryObjectiv( GLuint id, GLenum name, GLint* value ) { (void)id; (void)name; *value = 1; }
+void glGetQueryObjectui64v( GLuint id, GLenum name, GLuint64* value ) { (void)id; (void)name; *value = 2000000ul; }
+"""
+
+main_source = """#include "gpu.h"
+#include "gl.h"
+#include <stdio.h>
+
+int main( void ) {
+    int frame;
+    int extra;
+    if( !gpu_init() ) {
+        return 1;
+    }
+    extra = gpu_pass( "extra" );
+    /* names are cleaned before they are looked up, a second call finds the same pass */
+    if( gpu_pass( "a,\\"b\\"" ) != 3 || gpu_pass( "a,\\"b\\"" ) != 3 || gpu_pass( "a__b_" ) != 3 ) {
+        return 1;
+    }
+    for( frame = 0; frame < 5; ++frame ) {
+        gpu_frame();
+        GPU_SCOPE( GPU_PASS_SHADOW ) {
+            GPU_SCOPE( GPU_PASS_MAIN ) {
+                printf( "n" );
+            }
+        }
+        GPU_SCOPE( GPU_PASS_MAIN ) {
+            printf( "m" );
+        }
+    }
+    printf(
+        " %d %d %d %lu %lu %.1f %d\\n", gpu_pass( "shadow" ), extra, gpu_pass( "extra" ),
+        (unsigned long)gpu_get( GPU_PASS_SHADOW )->samples, (unsigned long)gpu_get( GPU_PASS_MAIN )->samples,
+        gpu_milliseconds( GPU_PASS_SHADOW ), gl_queries_nested
+    );
+    if( !gpu_export_csv( "passes.csv" ) ) {
+        return 1;
+    }
+    gpu_shutdown();
+    return 0;
+}
+"""
+
+def write( cwd:str, name:str, text:str ):
+    with open( os.path.join( cwd, name ), "w", newline='\n' ) as write_file:
+        write_file.write( text )
+
+@pytest.mark.skipif( shutil.which( "gcc" ) is None, reason="needs gcc" )
+@pytest.mark.parametrize( "std", [ "c89", "c99", "c11" ] )
+def test_gpu_timer_runs( tmp_path, std:str ):
+    cwd = str(tmp_path)
+    proc = subprocess.run(
+        [
+            sys.executable, os.path.join( src_dir, "create_glsl.py" ),
+            "--gpu_timer", "gpu", "--pass", "shadow", "--pass", "main", "--gl_header", "gl.h", "-q"
+        ],
+        cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True
+    )
+    assert proc.returncode == 0, proc.stdout
+    write( cwd, "gl.h", gl_header )
+    write( cwd, "gl.c", gl_source )
+    write( cwd, "main.c", main_source )
+
+    subprocess.run(
+        [ "gcc", "-std=" + std, "-Wall", "-Wextra", "-pedantic", "-Werror", "-o", "main", "main.c", "gpu.c", "gl.c" ],
+        cwd=cwd, check=True
+    )
+    proc = subprocess.run( [ os.path.join( cwd, "main" ) ], cwd=cwd, stdout=subprocess.PIPE, text=True )
+    assert proc.returncode == 0
+    # latency 3, queries of the first two frames are read back by the last two
+    assert proc.stdout == "nmnmnmnmnm 0 2 2 2 2 2.0 0\n"
+    with open( os.path.join( cwd, "passes.csv" ), "r" ) as read_file:
+        assert read_file.read().splitlines() == [
+            "frame,pass,milliseconds",
+            "1,shadow,2.000000", "1,main,2.000000",
+            "2,shadow,2.000000", "2,main,2.000000",
+        ]
@@ -0,0 +1,69 @@
+# * Description:  Smoke build of the glnew --hot_reload module inside a cproj C project
+# * Author:       Alicia Amarilla ( smushyaa@gmail.com )
+# * File Created: October 19, 2026
+
+import sys
+import os
+import shutil
+import subprocess
+
+import pytest
+
+from conftest import src_dir
+
+main_source = """#include "reload.h"
+#include <stdio.h>
+
+static int builds = 0;
+
+static unsigned int build( const char* const paths[RELOAD_MAX_STAGES], char* log, int log_size, void* user ) {
+    (void)log;
+    (void)log_size;
+    (void)user;
+    builds += paths[0] != NULL && paths[1] != NULL && paths[2] == NULL;
+    return 1;
+}
+
+static void destroy( unsigned int handle, void* user ) {
+    (void)handle;
+    (void)user;
+}
+
+int main( void ) {
+    reload_program* program;
+    unsigned int    handle;
+    reload_init( "shaders", build, destroy, NULL );
+    program = reload_register( "a.vs", "a.fs", NULL );
+    reload_frame();
+    handle = program ? program->handle : 0u;
+    reload_shutdown();
+    printf( "%d %u\\n", builds, handle );
+    return !( handle == 1u && builds == 1 );
+}
+"""
+
+def run( cmd:list, cwd:str ) -> str:
+    proc = subprocess.run( cmd, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True )
+    assert proc.returncode == 0, " ".join( cmd ) + "\n" + proc.stdout
+    return proc.stdout
+
+@pytest.mark.skipif(
+    shutil.which( "gcc" ) is None or shutil.which( "make" ) is None,
+    reason="needs gcc and make"
+)
+def test_hot_reload_builds_in_cproj( tmp_path ):
+    cwd = str(tmp_path)
+    run( [ sys.executable, os.path.join( src_dir, "create_cproj.py" ), "--init", "smoke", "-c", "-q" ], cwd )
+    run( [ sys.executable, os.path.join( src_dir, "create_glsl.py" ), "--hot_reload", "src/reload", "-q" ], cwd )
+
+    with open( os.path.join( cwd, "src", "main.c" ), "w", newline='\n' ) as write_file:
+        write_file.write( main_source )
+    os.makedirs( os.path.join( cwd, "shaders" ) )
+    for name in ( "a.vs", "a.fs" ):
+        with open( os.path.join( cwd, "shaders", name ), "w", newline='\n' ) as write_file:
+            write_file.write( "#version 450\nvoid main() {}\n" )
+
+    # objects only, the generated Makefile links for mingw
+    run( [ "make", "src/reload.o", "src/main.o", "WARN=-Wall -Wextra -Werror" ], cwd )
+    run( [ "gcc", "-o", "smoke", "src/main.o", "src/reload.o" ], cwd )
+    assert run( [ os.path.join( cwd, "smoke" ) ], cwd ).split() == [ "1", "1" ]
@@ -0,0 +1,90 @@
+# * Description:  Tests for manifest parsing and batched writes
+# * Author:       Alicia Amarilla ( smushyaa@gmail.com )
+# * File Created: October 19, 2026
+
+import os
+import re
+
+import pytest
+
+import manifest
+
+def write( tmp_path, name:str, text:str ) -> str:
+    path = os.path.join( str(tmp_path), name )
+    with open( path, "w", newline='\n' ) as write_file:
+        write_file.write( text )
+    return path
+
+def test_json_defaults_apply_to_every_entry( tmp_path ):
+    path = write( tmp_path, "m.json", """{
+        "defaults": { "c": true, "description": "shared" },
+        "files": [ "core/math", { "name": "io", "c": false } ]
+    }""" )
+    assert manifest.load_manifest( path ) == [
+        { "name": "core/math", "c": True, "description": "shared" },
+        { "name": "io", "c": False, "description": "shared" },
+    ]
+
+def test_json_list( tmp_path ):
+    path = write( tmp_path, "m.json", '[ "a", { "name": "b", "kind": "pipeline" } ]' )
+    assert manifest.load_manifest( path ) == [ { "name": "a" }, { "name": "b", "kind": "pipeline" } ]
+
+def test_toml( tmp_path ):
+    path = write( tmp_path, "m.toml", """
+[defaults]
+description = "shader"
+
+[[files]]
+name = "post/blur"
+
+[[files]]
+name = "sky"
+description = "sky dome"
+""" )
+    assert manifest.load_manifest( path ) == [
+        { "name": "post/blur", "description": "shader" },
+        { "name": "sky", "description": "sky dome" },
+    ]
+
+def test_plain_text_skips_blank_lines_and_comments( tmp_path ):
+    path = write( tmp_path, "names.txt", "# modules\nalpha\n\n  beta  \n#gamma\n" )
+    assert manifest.load_manifest( path ) == [ { "name": "alpha" }, { "name": "beta" } ]
+
+def test_workspace_key( tmp_path ):
+    path = write( tmp_path, "w.json", '{ "projects": [ "app" ], "files": [ "ignored" ] }' )
+    assert manifest.load_manifest( path, "projects" ) == [ { "name": "app" } ]
+
+@pytest.mark.parametrize( "name, text, message", [
+    ( "m.json", '{ "files": [ { "c": true } ] }', "manifest entry 0 has no name" ),
+    ( "m.json", '{ "files": [ "a", 3 ] }', "manifest entry 1 must be a string or a table" ),
+    ( "m.json", '{ "files": "a" }', "manifest \"files\" must be a list" ),
+    ( "m.json", '{ "defaults": [], "files": [] }', "manifest \"defaults\" must be a table" ),
+    ( "m.json", '"a"', "manifest must be a list or a table" ),
+    ( "m.json", '{ "files": [', "invalid json manifest" ),
+    ( "m.toml", '[[files]\nname = "a"', "invalid toml manifest" ),
+] )
+def test_invalid_manifests( tmp_path, name:str, text:str, message:str ):
+    path = write( tmp_path, name, text )
+    with pytest.raises( manifest.ManifestError, match=re.escape( message ) ):
+        manifest.load_manifest( path )
+
+def test_missing_manifest( tmp_path ):
+    with pytest.raises( manifest.ManifestError ):
+        manifest.load_manifest( os.path.join( str(tmp_path), "missing.json" ) )
+
+def test_write_files_skips_existing( tmp_path ):
+    existing = write( tmp_path, "a.h", "old" )
+    new      = os.path.join( str(tmp_path), "b.h" )
+
+    created, skipped, failed = manifest.write_files( [ ( existing, "new" ), ( new, "new" ) ], False )
+    assert ( created, skipped, failed ) == ( [ new ], [ existing ], [] )
+    with open( existing, "r" ) as read_file:
+        assert read_file.read() == "old"
+    assert manifest.summary( created, skipped, failed ) == (
+        "created 1 file, skipped 1 existing (use -o or --overwrite to overwrite)"
+    )
+
+    created, skipped, failed = manifest.write_files( [ ( existing, "new" ), ( new, "new" ) ], True )
+    assert ( sorted( created ), skipped, failed ) == ( sorted( [ existing, new ] ), [], [] )
+    with open( existing, "r" ) as read_file:
+        assert read_file.read() == "new"
@@ -0,0 +1,41 @@
+# * Description:  Tests for --profile option handling
+# * Author:       Alicia Amarilla ( smushyaa@gmail.com )
+# * File Created: October 19, 2026
+
+import sys
+import os
+import subprocess
+
+from conftest import src_dir
+
+def setup( args:list, cwd:str ):
+    # profiling patches builtins.open and os.stat, so every case runs in its own interpreter
+    code = "import sys, profiler; print( profiler.setup( sys.argv[1:] ) ); print( profiler.enabled, profiler.profile_file )"
+    return subprocess.run(
+        [ sys.executable, "-c", code ] + args, cwd=cwd,
+        env=dict( os.environ, PYTHONPATH=src_dir ),
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+    )
+
+def test_setup_without_profile_options( tmp_path ):
+    proc = setup( [ "name", "-c", "--profiled" ], str(tmp_path) )
+    assert proc.stdout.splitlines() == [ "['name', '-c', '--profiled']", "False " ]
+    assert proc.stderr == ""
+
+def test_setup_strips_profile_options( tmp_path ):
+    proc = setup( [ "name", "--profile", "-c", "--profile_file", "out.pstats", "-q" ], str(tmp_path) )
+    assert proc.stdout.splitlines() == [ "['name', '-c', '-q']", "True out.pstats" ]
+    assert proc.stderr.startswith( "profile: " )
+    assert "  arguments " in proc.stderr
+    assert "wrote pstats to \"out.pstats\"" in proc.stderr
+    assert os.path.isfile( os.path.join( str(tmp_path), "out.pstats" ) )
+
+def test_setup_profile_file_with_equals( tmp_path ):
+    proc = setup( [ "--profile_file=p.out", "name" ], str(tmp_path) )
+    assert proc.stdout.splitlines() == [ "['name']", "True p.out" ]
+
+def test_setup_missing_profile_file_path( tmp_path ):
+    for args in ( [ "name", "--profile_file" ], [ "--profile_file=", "name" ] ):
+        proc = setup( args, str(tmp_path) )
+        assert proc.returncode == 255
+        assert "--profile_file is missing a path!" in proc.stdout
@@ -0,0 +1,58 @@
+# * Description:  Runs the script generated by pynew --kind pipeline
+# * Author:       Alicia Amarilla ( smushyaa@gmail.com )
+# * File Created: October 19, 2026
+
+import sys
+import os
+import subprocess
+
+import pytest
+
+from conftest import src_dir
+
+def pynew( cwd:str, *args ) -> subprocess.CompletedProcess:
+    proc = subprocess.run(
+        [ sys.executable, os.path.join( src_dir, "create_py.py" ) ] + list( args ),
+        cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True
+    )
+    assert proc.returncode == 0, proc.stdout
+    return proc
+
+@pytest.mark.parametrize( "pool", [ "thread", "process" ] )
+def test_pipeline_keeps_input_order( tmp_path, pool:str ):
+    cwd = str(tmp_path)
+    pynew( cwd, "-n", "pipe", "-k", "pipeline" )
+
+    lines = [ "record " + str(idx) for idx in range( 10000 ) ]
+    with open( os.path.join( cwd, "a.txt" ), "w", newline='' ) as write_file:
+        write_file.write( "\r\n\n".join( lines[:5000] ) + "\n" )
+    with open( os.path.join( cwd, "b.txt" ), "w", newline='' ) as write_file:
+        # no newline after the last record
+        write_file.write( "\n".join( lines[5000:] ) )
+
+    proc = subprocess.run(
+        [ sys.executable, "pipe.py", "-j", "3", "--pool", pool, "--batch", "64", "--bench", "-o", "out.txt", "a.txt", "b.txt" ],
+        cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+    )
+    assert proc.returncode == 0, proc.stderr
+    assert proc.stderr.startswith( "pipe: 10000 records in 235 batches" )
+    with open( os.path.join( cwd, "out.txt" ), "r", newline='' ) as read_file:
+        assert read_file.read() == "\n".join( lines ) + "\n"
+
+def test_pipeline_reads_stdin( tmp_path ):
+    cwd = str(tmp_path)
+    pynew( cwd, "-n", "pipe", "-k", "pipeline" )
+    proc = subprocess.run(
+        [ sys.executable, "pipe.py" ], cwd=cwd, input="a\n\nb", stdout=subprocess.PIPE, text=True
+    )
+    assert ( proc.returncode, proc.stdout ) == ( 0, "a\nb\n" )
+
+def test_manifest_kind_default( tmp_path ):
+    cwd = str(tmp_path)
+    with open( os.path.join( cwd, "scripts.json" ), "w", newline='\n' ) as write_file:
+        write_file.write( "[ \"one\", { \"name\": \"two\", \"kind\": \"script\" } ]" )
+    pynew( cwd, "-m", "scripts.json", "-k", "pipeline" )
+    with open( os.path.join( cwd, "one.py" ), "r" ) as read_file:
+        assert "def stage( function ):" in read_file.read()
+    with open( os.path.join( cwd, "two.py" ), "r" ) as read_file:
+        assert not( "def stage( function ):" in read_file.read() )
@@ -0,0 +1,74 @@
+# * Description:  Tests for cproj skeleton snapshots
+# * Author:       Alicia Amarilla ( smushyaa@gmail.com )
+# * File Created: October 19, 2026
+
+import os
+
+import skeleton
+
+files = [
+    ( "README.md", "cproj_readme" ),
+    ( ".gitignore", "cproj_gitignore" ),
+    ( "src/main.c", "cproj_main" ),
+]
+paths   = [ path for path, _ in files ]
+context = { "description": "" }
+
+def values( name:str ) -> dict:
+    return { "name": name, "date": "May 04, 2026", "year": "2026", "src": "./src" }
+
+def read( *parts ) -> str:
+    with open( os.path.join( *parts ), "r", newline='' ) as read_file:
+        return read_file.read()
+
+def create( dst, name:str ):
+    os.makedirs( os.path.join( str(dst), "src" ), exist_ok=True )
+    skeleton.create( [ "c", "c99" ], files, context, str(dst), paths, values( name ) )
+
+def snapshot_files( key_parts:list ) -> list:
+    key = skeleton.fingerprint( key_parts, [ "cproj_info" ] + [ template for _, template in files ] )
+    snapshot = skeleton.snapshot_dir( key )
+    return sorted(
+        os.path.relpath( os.path.join( root, name ), snapshot ).replace( os.sep, "/" )
+        for root, _, names in os.walk( snapshot ) for name in names
+    )
+
+def test_patch_replaces_every_placeholder():
+    text = "# \0name\0 " + skeleton.placeholders["year"] + " \0src\0 \0date\0"
+    assert skeleton.patch( text, values( "app" ) ) == "# app 2026 ./src May 04, 2026"
+
+def test_create_patches_snapshot_per_project( tmp_path, monkeypatch ):
+    create( tmp_path / "one", "one" )
+    # only files with placeholders are stored as .in and patched
+    assert snapshot_files( [ "c", "c99" ] ) == [ ".gitignore", "README.md.in", "src/main.c.in" ]
+
+    # the second project is copied from the snapshot without rendering
+    monkeypatch.setattr( skeleton, "render_files", None )
+    create( tmp_path / "two", "two" )
+
+    assert read( str(tmp_path), "one", "README.md" ) == "# one\n"
+    assert read( str(tmp_path), "two", "README.md" ) == "# two\n"
+    assert read( str(tmp_path), "two", ".gitignore" ) == read( str(tmp_path), "one", ".gitignore" )
+    assert "File Created: May 04, 2026" in read( str(tmp_path), "two", "src", "main.c" )
+    assert not( "\0" in read( str(tmp_path), "two", "src", "main.c" ) )
+
+def test_store_is_atomic( tmp_path ):
+    rendered = { "a.txt": "plain", "b/c.txt": "\0name\0" }
+    final    = skeleton.store( "atomic", rendered )
+    assert final == skeleton.snapshot_dir( "atomic" )
+    assert sorted( os.listdir( final ) ) == [ "a.txt", "b" ]
+    assert os.listdir( os.path.dirname( final ) ) == [ "atomic" ]
+
+    # a snapshot stored first by another process is kept, the temporary copy removed
+    assert skeleton.store( "atomic", { "a.txt": "other" } ) == final
+    assert read( final, "a.txt" ) == "plain"
+    assert os.listdir( os.path.dirname( final ) ) == [ "atomic" ]
+
+def test_damaged_snapshot_is_rendered_again( tmp_path ):
+    create( tmp_path / "one", "one" )
+    key = skeleton.fingerprint( [ "c", "c99" ], [ "cproj_info" ] + [ template for _, template in files ] )
+    os.remove( os.path.join( skeleton.snapshot_dir( key ), "README.md.in" ) )
+
+    create( tmp_path / "two", "two" )
+    assert read( str(tmp_path), "two", "README.md" ) == "# two\n"
+    assert not( os.path.isdir( skeleton.snapshot_dir( key ) ) )
@@ -0,0 +1,66 @@
+# * Description:  Tests for template lookup and the compiled template cache
+# * Author:       Alicia Amarilla ( smushyaa@gmail.com )
+# * File Created: October 19, 2026
+
+import os
+
+import pytest
+
+import templates
+
+@pytest.fixture
+def template_env( tmp_path, monkeypatch ):
+    """user templates, project templates and the cache all live below tmp_path"""
+    monkeypatch.chdir( tmp_path )
+    monkeypatch.setenv( "SCAFFOLD_TEMPLATES", str(tmp_path / "user") )
+    monkeypatch.setenv( "XDG_CACHE_HOME", str(tmp_path / "cache") )
+    monkeypatch.setattr( templates, "compiled", None )
+    return tmp_path
+
+def write_template( directory, name:str, text:str ) -> str:
+    os.makedirs( str(directory), exist_ok=True )
+    path = os.path.join( str(directory), name + templates.extension )
+    with open( path, "w", newline='\n' ) as write_file:
+        write_file.write( text )
+    return path
+
+def render_fresh( name:str, **context ) -> str:
+    # a new run of a tool, only the cache file survives
+    templates.compiled = None
+    return templates.render( name, **context )
+
+def test_compile_template():
+    assert templates.compile_template( "a {{ x }} b {{y}}", "t" ) == ( "a ", "x", " b ", "y", "" )
+    with pytest.raises( templates.TemplateError ):
+        templates.compile_template( "a {{ x", "t" )
+    with pytest.raises( templates.TemplateError ):
+        templates.compile_template( "a {{}}", "t" )
+
+def test_builtin_template( template_env ):
+    assert render_fresh( "c_source", info="", include="a.h" ) == "#include \"a.h\""
+
+def test_project_templates_win( template_env ):
+    write_template( template_env / "user", "c_source", "user {{include}}" )
+    assert render_fresh( "c_source", info="", include="a.h" ) == "user a.h"
+    write_template( template_env / ".scaffold" / "templates", "c_source", "project {{include}}" )
+    assert render_fresh( "c_source", info="", include="a.h" ) == "project a.h"
+
+def test_cache_is_invalidated_by_mtime( template_env ):
+    path = write_template( template_env / "user", "c_source", "old {{include}}" )
+    assert render_fresh( "c_source", info="", include="a.h" ) == "old a.h"
+    assert os.path.isfile( templates.cache_path() )
+    stamp = os.stat( path ).st_mtime_ns
+
+    # same size and mtime, the compiled entry is reused without reading the file
+    write_template( template_env / "user", "c_source", "new {{include}}" )
+    os.utime( path, ns=( stamp, stamp ) )
+    assert render_fresh( "c_source", info="", include="a.h" ) == "old a.h"
+
+    os.utime( path, ns=( stamp + 1000000000, stamp + 1000000000 ) )
+    assert render_fresh( "c_source", info="", include="a.h" ) == "new a.h"
+
+def test_lazy_templates_resolve():
+    for name, module_name in templates.lazy_modules.items():
+        module = __import__( module_name )
+        assert templates.builtin_text( name ) == module.builtin[name]
+        assert sorted( module.builtin ) == sorted( n for n, m in templates.lazy_modules.items() if m == module_name )